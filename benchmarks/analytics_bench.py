@@ -0,0 +1,121 @@
+"""
+Analytics Benchmarks - flattening and vectorized metrics of the analytics view
+Times the streamlitagenda analytics pipeline against generated datasets (see
+generate_dataset.py): flattening the agendas into columnar frames, which
+happens once per data revision, and computing every metric the view shows
+from those frames, which happens on each rerun. The same metrics computed
+with plain Python loops over the agenda dicts are timed for comparison.
+
+    python benchmarks/analytics_bench.py --sizes 1250,12500 --repeat 5 [--json]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict
+
+import pandas as pd
+import streamlit
+
+from generate_dataset import generate_agendas
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'streamlitagenda'))
+
+TODAY = date(2026, 1, 15)   # the generator's reference date
+
+def time_call(func: Callable, repeat: int) -> float:
+    """Median wall time in ms over `repeat` calls"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 1)
+
+def vectorized_metrics(analytics, frames: Dict[str, pd.DataFrame]) -> None:
+    """Everything the analytics view computes on a rerun"""
+    actions = frames['actions']
+    done = actions['status'].eq('completed')
+    analytics.monthly_counts(frames['agendas'], 'date', 'presenter', top=8)
+    analytics.completion(actions, done)
+    analytics.overdue_by_owner(actions, ~done, 'owner', today=TODAY)
+    analytics.priority_mix(actions, 'priority', done, ['high', 'medium', 'low'])
+    frames['todos']['completed'].fillna(False).astype(bool).mean()
+
+def loop_metrics(agendas: Dict[str, dict]) -> None:
+    """The same metrics with Python loops over the agenda dicts"""
+    per_month = Counter((a['date'][:7], a['presenter']) for a in agendas.values())
+    close_days, completed, total = [], 0, 0
+    overdue, priorities = Counter(), defaultdict(Counter)
+    todos_done = todos = 0
+    for agenda in agendas.values():
+        for action in agenda['action_items']:
+            total += 1
+            is_done = action['status'] == 'completed'
+            priorities[action['priority']][is_done] += 1
+            if is_done:
+                completed += 1
+                if action.get('completed_at'):
+                    delta = datetime.fromisoformat(action['completed_at']) - datetime.fromisoformat(action['created_at'])
+                    close_days.append(delta.total_seconds() / 86400)
+            elif action['due_date'] and date.fromisoformat(action['due_date']) < TODAY:
+                overdue[action['owner'].strip() or 'Unassigned'] += 1
+        todos += len(agenda['todos'])
+        todos_done += sum(1 for todo in agenda['todos'] if todo['completed'])
+    statistics.median(close_days) if close_days else None
+    return per_month, overdue.most_common(25)
+
+def bench_size(app, size: int, args) -> Dict:
+    agendas = generate_agendas(size, args.seed)
+    # Give completed actions a completion time so time-to-close has data
+    for agenda in agendas.values():
+        for action in agenda['action_items']:
+            if action['status'] == 'completed':
+                action['completed_at'] = agenda['updated_at']
+    frames = app.build_analytics_frames(agendas)
+    return {
+        'agendas': size,
+        'items': len(frames['actions']) + len(frames['todos']),
+        'flatten_ms': time_call(lambda: app.build_analytics_frames(agendas), args.repeat),
+        'metrics_ms': time_call(lambda: vectorized_metrics(app.analytics, frames), args.repeat),
+        'loops_ms': time_call(lambda: loop_metrics(agendas), args.repeat)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', default='1250,12500',
+                        help="Comma-separated agenda counts (about 8 items each by default)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    import meeting_agenda_manager as app
+
+    results = [bench_size(app, int(size), args) for size in args.sizes.split(',')]
+    report = {
+        'benchmark': 'analytics',
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'streamlit': streamlit.__version__,
+        'repeat': args.repeat,
+        'results': results
+    }
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{'agendas':>8} {'items':>8} {'flatten ms':>11} {'metrics ms':>11} {'loops ms':>9}")
+        for r in results:
+            print(f"{r['agendas']:>8} {r['items']:>8} {r['flatten_ms']:>11.1f} {r['metrics_ms']:>11.1f} "
+                  f"{r['loops_ms']:>9.1f}")
+
+if __name__ == "__main__":
+    main()
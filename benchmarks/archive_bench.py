@@ -0,0 +1,124 @@
+"""
+Archive Benchmarks - hot working set size with and without the archive tier
+Generates a dataset (see generate_dataset.py), times loading it and the
+per-rerun scans of the list view and sidebar stats over every agenda, then
+archives the completed agendas older than --after-days and times the same
+work over the hot agendas that remain. Also times the archive pass itself
+and an "include archived" search, with the segments first opened from disk
+and then served from the decoded-segment cache.
+
+    python benchmarks/archive_bench.py --sizes 2000,10000 --after-days 180 --repeat 5 [--json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict
+
+import streamlit
+
+from generate_dataset import generate_agendas
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'streamlitagenda'))
+
+NOW = datetime(2026, 1, 15, 12)     # the generator's reference date
+
+def time_call(func: Callable, repeat: int, setup: Callable = None) -> float:
+    """Median wall time in ms over `repeat` calls"""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 1)
+
+def rerun_scan(app, agendas: Dict) -> None:
+    """What the list view and sidebar stats compute over the agendas on every rerun"""
+    sum(1 for a in agendas.values() if a['status'] == 'scheduled')
+    sum(1 for a in agendas.values() if a['status'] == 'completed')
+    grouped = {}
+    for agenda in app.filter_agendas(agendas, '', 'All', 'Date (newest)'):
+        grouped.setdefault(agenda['date'][:7], []).append(agenda)
+
+def bench_size(app, store, archive, size: int, args) -> Dict:
+    path = Path(f"agendas_{size}.json")
+    agendas = generate_agendas(size, args.seed)
+    store.save_agendas_to_file(agendas, path, 'none')
+    full_bytes = path.stat().st_size
+    full_load = time_call(lambda: store.load_agendas_from_file(path), args.repeat)
+    full_scan = time_call(lambda: rerun_scan(app, agendas), args.repeat)
+
+    after = timedelta(days=args.after_days)
+    started = time.perf_counter()
+    hot, moved = archive.archive_old(path, after, NOW)
+    archive_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    def query(segment):
+        return app.filter_agendas(segment, 'review', 'All', 'Date (newest)')
+
+    summary = archive.stats(path)
+    return {
+        'agendas': size,
+        'archived': summary['agendas'],
+        'segments': summary['segments'],
+        'full_mb': round(full_bytes / 1e6, 2),
+        'hot_mb': round(path.stat().st_size / 1e6, 2),
+        'archive_mb': round(summary['bytes'] / 1e6, 2),
+        'full_load_ms': full_load,
+        'hot_load_ms': time_call(lambda: store.load_agendas_from_file(path), args.repeat),
+        'full_scan_ms': full_scan,
+        'hot_scan_ms': time_call(lambda: rerun_scan(app, hot), args.repeat),
+        'archive_pass_ms': archive_ms,
+        'search_cold_ms': time_call(lambda: archive.search(path, query, exclude=hot), args.repeat,
+                                    archive._segments.clear),
+        'search_warm_ms': time_call(lambda: archive.search(path, query, 50, hot), args.repeat)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', default='2000,10000', help="Comma-separated agenda counts")
+    parser.add_argument('--after-days', type=int, default=180,
+                        help="Archive completed agendas older than this, as of the generator's reference date")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    # Data files and archive segments are written next to each other; keep them away from real data
+    os.chdir(tempfile.mkdtemp(prefix='archive_bench_cwd_'))
+    import agenda_store as store
+    import archive
+    import meeting_agenda_manager as app
+
+    results = [bench_size(app, store, archive, int(size), args) for size in args.sizes.split(',')]
+    report = {
+        'benchmark': 'archive',
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'after_days': args.after_days,
+        'repeat': args.repeat,
+        'results': results
+    }
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{'agendas':>8} {'archived':>9} {'file MB':>13} {'load ms':>15} {'scan ms':>13} "
+              f"{'pass ms':>8} {'search ms':>13}")
+        for r in results:
+            print(f"{r['agendas']:>8} {r['archived']:>9} {r['full_mb']:>6} → {r['hot_mb']:<5} "
+                  f"{r['full_load_ms']:>7} → {r['hot_load_ms']:<6} {r['full_scan_ms']:>5} → {r['hot_scan_ms']:<5} "
+                  f"{r['archive_pass_ms']:>8} {r['search_cold_ms']:>6} / {r['search_warm_ms']:<5}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Fragment Rerun Timing - estimated full-page vs fragment-scoped interaction cost
+Estimates what toggling a to-do in the streamlitagenda detail view costs.
+Before fragments, the mutation re-executed the whole page twice (the
+widget's run plus st.rerun()); now a widget callback applies it and only the
+to-do section re-executes, once.
+
+AppTest always runs the whole script, so a fragment-scoped click cannot be
+timed end to end. The script times one full-page execution and one execution
+of the section body, and derives both costs from those.
+
+    python benchmarks/fragment_reruns.py --items 50 --repeat 15 [--json]
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import sys
+sys.path.insert(0, {app_dir!r})
+import {module} as app
+{setup}
+{call}
+"""
+
+def agenda_fixture(items: int, image_kb: int) -> dict:
+    """One v1 agenda with `items` notes, to-dos and action items and a topic image"""
+    side = max(int((image_kb * 1024 / 3) ** 0.5), 1)
+    buffer = io.BytesIO()
+    Image.frombytes('RGB', (side, side), os.urandom(side * side * 3)).save(buffer, format='PNG')
+    image = {'name': 'topic.png', 'type': 'image/png', 'data': base64.b64encode(buffer.getvalue()).decode()}
+    return {
+        'id': 'bench001', 'topic': 'Benchmark agenda', 'presenter': 'Bench',
+        'date': '2026-01-15', 'time': '09:00:00', 'duration': 60,
+        'topic_image': image, 'urls': [{'name': f'Link {i}', 'url': f'https://example.com/{i}'} for i in range(5)],
+        'attachments': [], 'status': 'scheduled',
+        'created_at': '2026-01-01T00:00:00', 'updated_at': '2026-01-01T00:00:00',
+        'notes': [{'id': f'n{i}', 'content': f'Note {i} ' * 20, 'created_at': '2026-01-01T00:00:00'}
+                  for i in range(items)],
+        'todos': [{'id': f't{i}', 'task': f'Task {i}', 'priority': 'medium', 'assignee': 'Bench',
+                   'completed': bool(i % 2), 'created_at': '2026-01-01T00:00:00'} for i in range(items)],
+        'action_items': [{'id': f'a{i}', 'action': f'Action {i}', 'owner': 'Bench', 'due_date': '2026-02-01',
+                          'priority': 'high', 'status': 'pending', 'created_at': '2026-01-01T00:00:00'}
+                         for i in range(items)],
+    }
+
+def time_script(script: str, state: dict, repeat: int) -> float:
+    """Median wall time in ms of one script execution"""
+    at = AppTest.from_string(script, default_timeout=60)
+    for key, value in state.items():
+        at.session_state[key] = value
+    at.run()  # warm-up: module import, page config, stylesheet build
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def bench_v1(items: int, image_kb: int, repeat: int) -> dict:
+    agenda = agenda_fixture(items, image_kb)
+    workdir = tempfile.mkdtemp(prefix='fragment_bench_')
+    Path(workdir, 'agendas_data.json').write_text(json.dumps({agenda['id']: agenda}))
+    os.chdir(workdir)
+    app_dir = str(REPO_ROOT / 'streamlitagenda')
+    state = {'current_view': 'detail', 'selected_agenda_id': agenda['id']}
+    setup = "app.init_session_state()"
+
+    full = time_script(SCRIPT.format(app_dir=app_dir, module='meeting_agenda_manager', setup=setup,
+                                     call="app.main()"), state, repeat)
+    fragment = time_script(SCRIPT.format(app_dir=app_dir, module='meeting_agenda_manager', setup=setup,
+                                         call="app.render_todos_section('bench001')"), state, repeat)
+    return {'app': 'streamlitagenda', 'interaction': 'toggle to-do', 'full_page_ms': full, 'fragment_ms': fragment}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--items', type=int, default=50, help="Notes / to-dos / actions per agenda")
+    parser.add_argument('--image-kb', type=int, default=256, help="Topic image size")
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--json', action='store_true', help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    results = [bench_v1(args.items, args.image_kb, args.repeat)]
+    for r in results:
+        # Before: the widget's full run plus st.rerun(). After: one fragment run after the callback
+        r['before_ms'] = 2 * r['full_page_ms']
+        r['after_ms'] = r['fragment_ms']
+        r['speedup'] = r['before_ms'] / r['after_ms']
+
+    if args.json:
+        json.dump({'items': args.items, 'image_kb': args.image_kb, 'results': results}, sys.stdout, indent=2)
+        print()
+        return
+    print(f"{'app':<16} {'interaction':<20} {'est. before (ms)':>17} {'est. after (ms)':>16} {'speedup':>8}")
+    for r in results:
+        print(f"{r['app']:<16} {r['interaction']:<20} {r['before_ms']:>17.1f} {r['after_ms']:>16.1f} {r['speedup']:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Dataset Generator - seeded synthetic agendas for both apps
+Produces realistic-looking data in the streamlitagenda schema (agendas with
+notes, to-dos, action items, URLs and base64 attachments) or the streamlitv2
+schema (meetings with notes, action items and follow-ups). The same seed and
+arguments always produce the same dataset, so benchmark runs are comparable.
+
+    python benchmarks/generate_dataset.py --agendas 10000 --out /tmp/agendas_data.json
+    python benchmarks/generate_dataset.py --schema v2 --agendas 1000 --out /tmp/meetings.json
+"""
+
+import argparse
+import base64
+import json
+import random
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict
+
+FIRST_NAMES = ['Alice', 'Bob', 'Carmen', 'Deepak', 'Elena', 'Farid', 'Grace', 'Hiro', 'Ines', 'Jonas',
+               'Kemi', 'Liam', 'Maya', 'Noah', 'Olga', 'Priya', 'Quinn', 'Rafael', 'Sofia', 'Tariq']
+LAST_NAMES = ['Smith', 'Garcia', 'Chen', 'Okafor', 'Novak', 'Patel', 'Kim', 'Rossi', 'Dubois', 'Larsen']
+SUBJECTS = ['Quarterly planning', 'Data platform', 'Onboarding', 'Incident review', 'Roadmap', 'Budget',
+            'Security audit', 'Customer feedback', 'Hiring', 'Release readiness', 'Architecture', 'Analytics']
+ASPECTS = ['kickoff', 'sync', 'deep dive', 'retro', 'status update', 'workshop', 'review', 'demo']
+VERBS = ['Draft', 'Review', 'Update', 'Schedule', 'Share', 'Prepare', 'Follow up on', 'Estimate', 'Document']
+OBJECTS = ['the proposal', 'the budget sheet', 'migration plan', 'test results', 'the slide deck',
+           'vendor contract', 'dashboard metrics', 'risk register', 'release notes', 'interview loop']
+WORDS = ('the team agreed to revisit scope next week while risks around timeline and staffing were '
+         'discussed in detail with several open questions about ownership dependencies and budget').split()
+
+def _person(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+def _task(rng: random.Random) -> str:
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+
+def _stamp(rng: random.Random, around: date) -> str:
+    moment = datetime.combine(around, datetime.min.time()) + timedelta(minutes=rng.randrange(-30 * 1440, 1440))
+    return moment.isoformat()
+
+def _id(rng: random.Random) -> str:
+    return f"{rng.getrandbits(32):08x}"
+
+# ============================================================================
+# SCHEMAS
+# ============================================================================
+
+def generate_agendas(count: int, seed: int = 42, notes: int = 5, todos: int = 5, actions: int = 3,
+                     attachment_kb: int = 0, attachment_rate: float = 0.2,
+                     today: date = date(2026, 1, 15)) -> Dict[str, dict]:
+    """`count` streamlitagenda agendas; item counts are means, attachments go to `attachment_rate` of them"""
+    rng = random.Random(seed)
+    agendas = {}
+    for _ in range(count):
+        agenda_id = _id(rng)
+        meeting_date = today + timedelta(days=rng.randint(-365, 180))
+        created = _stamp(rng, meeting_date)
+        status = ('completed' if meeting_date < today and rng.random() < 0.8
+                  else rng.choice(['scheduled', 'scheduled', 'in_progress']))
+        attachments = []
+        if attachment_kb and rng.random() < attachment_rate:
+            payload = rng.randbytes(attachment_kb * 1024)
+            attachments.append({'name': f"{rng.choice(OBJECTS).replace(' ', '_')}.pdf",
+                                'type': 'application/pdf', 'data': base64.b64encode(payload).decode('utf-8')})
+        agendas[agenda_id] = {
+            'id': agenda_id,
+            'topic': f"{rng.choice(SUBJECTS)} {rng.choice(ASPECTS)}",
+            'presenter': _person(rng),
+            'date': meeting_date.isoformat(),
+            'time': f"{rng.randint(8, 17):02d}:{rng.choice(['00', '30'])}:00",
+            'duration': rng.choice([15, 30, 30, 45, 60, 60, 90]),
+            'topic_image': None,
+            'urls': [{'name': f"Doc {i + 1}", 'url': f"https://docs.example.com/{agenda_id}/{i}"}
+                     for i in range(rng.randint(0, 3))],
+            'attachments': attachments,
+            'notes': [{'id': _id(rng), 'content': _sentence(rng, rng.randint(8, 40)), 'created_at': created}
+                      for _ in range(rng.randint(0, 2 * notes))],
+            'todos': [{'id': _id(rng), 'task': _task(rng), 'priority': rng.choice(['low', 'medium', 'high']),
+                       'assignee': _person(rng), 'completed': rng.random() < 0.4, 'created_at': created}
+                      for _ in range(rng.randint(0, 2 * todos))],
+            'action_items': [{'id': _id(rng), 'action': _task(rng), 'owner': _person(rng),
+                              'due_date': (meeting_date + timedelta(days=rng.randint(1, 30))).isoformat(),
+                              'priority': rng.choice(['low', 'medium', 'high']),
+                              'status': rng.choice(['pending', 'pending', 'in_progress', 'completed']),
+                              'created_at': created}
+                             for _ in range(rng.randint(0, 2 * actions))],
+            'created_at': created,
+            'updated_at': created,
+            'status': status
+        }
+    return agendas
+
+def generate_meetings(count: int, seed: int = 42, notes: int = 5, actions: int = 3, follow_ups: int = 2,
+                      today: date = date(2026, 1, 15)) -> Dict[str, dict]:
+    """`count` streamlitv2 meetings; item counts are means"""
+    rng = random.Random(seed)
+    meetings = {}
+    for _ in range(count):
+        meeting_id = _id(rng)
+        meeting_date = today + timedelta(days=rng.randint(-365, 180))
+        created = _stamp(rng, meeting_date)
+        meetings[meeting_id] = {
+            'id': meeting_id,
+            'name': f"{rng.choice(SUBJECTS)} {rng.choice(ASPECTS)}",
+            'date': meeting_date.isoformat(),
+            'time': f"{rng.randint(8, 17):02d}:{rng.choice(['00', '30'])}:00",
+            'topic': rng.choice(SUBJECTS),
+            'description': _sentence(rng, rng.randint(10, 30)),
+            'attachments': ', '.join(f"{rng.choice(OBJECTS).replace(' ', '_')}.pdf" for _ in range(rng.randint(0, 2))),
+            'url_name': 'Meeting notes',
+            'url': f"https://docs.example.com/{meeting_id}",
+            'created_at': created,
+            'notes': [{'id': _id(rng), 'content': _sentence(rng, rng.randint(8, 40)), 'created_at': created}
+                      for _ in range(rng.randint(0, 2 * notes))],
+            'action_items': [{'id': _id(rng), 'content': _task(rng), 'assignee': _person(rng),
+                              'due_date': (meeting_date + timedelta(days=rng.randint(1, 30))).isoformat(),
+                              'completed': rng.random() < 0.4, 'created_at': created}
+                             for _ in range(rng.randint(0, 2 * actions))],
+            'follow_ups': [{'id': _id(rng), 'content': _task(rng),
+                            'priority': rng.choice(['Low', 'Medium', 'High', 'Critical']),
+                            'completed': rng.random() < 0.3, 'created_at': created}
+                           for _ in range(rng.randint(0, 2 * follow_ups))]
+        }
+    return meetings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--schema', choices=['v1', 'v2'], default='v1',
+                        help="v1: streamlitagenda agendas, v2: streamlitv2 meetings")
+    parser.add_argument('--agendas', type=int, default=1000, help="Number of agendas / meetings")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--notes', type=int, default=5, help="Mean notes per agenda")
+    parser.add_argument('--todos', type=int, default=5, help="Mean to-dos per agenda (v1)")
+    parser.add_argument('--actions', type=int, default=3, help="Mean action items per agenda")
+    parser.add_argument('--follow-ups', type=int, default=2, help="Mean follow-ups per meeting (v2)")
+    parser.add_argument('--attachment-kb', type=int, default=0, help="Attachment size (v1; 0 for none)")
+    parser.add_argument('--attachment-rate', type=float, default=0.2, help="Share of agendas with an attachment")
+    parser.add_argument('--out', type=Path, help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    if args.schema == 'v1':
+        data = generate_agendas(args.agendas, args.seed, args.notes, args.todos, args.actions,
+                                args.attachment_kb, args.attachment_rate)
+    else:
+        data = generate_meetings(args.agendas, args.seed, args.notes, args.actions, args.follow_ups)
+
+    if args.out:
+        args.out.write_text(json.dumps(data, indent=2))
+        print(f"Wrote {len(data)} {'agendas' if args.schema == 'v1' else 'meetings'} to {args.out}", file=sys.stderr)
+    else:
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+if __name__ == "__main__":
+    main()
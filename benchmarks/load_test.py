@@ -0,0 +1,191 @@
+"""
+Load Test - concurrent sessions of streamlitagenda sharing one data file
+Each simulated user is a separate process driving its own AppTest session
+through a seeded click script (open an agenda, add a note, toggle a to-do,
+search the list). AppTest's runtime is process-global, so sessions cannot
+share a process; they do share the data file, its lock and the CPU, which is
+where a server with many sessions stalls. Reports rerun latency percentiles,
+throughput, lock contention on the data file and updates lost when two
+sessions change the same agenda (saves merge per agenda, last writer wins).
+
+    python benchmarks/load_test.py --sessions 8 --steps 25 --agendas 500 [--json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from streamlit.testing.v1 import AppTest
+
+from generate_dataset import generate_agendas
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP_DIR = REPO_ROOT / 'streamlitagenda'
+
+SCRIPT = """
+import sys
+sys.path.insert(0, {app_dir!r})
+import streamlit as st
+import meeting_agenda_manager as app
+app.archive.ARCHIVE_AFTER = None  # every session works on the whole dataset
+
+@app.coalesce_writes
+def run(step):
+    if step is None:
+        pass
+    elif step[0] == 'open':
+        st.session_state.current_view = 'detail'
+        st.session_state.selected_agenda_id = step[1]
+    elif step[0] == 'add_note':
+        app.add_note(step[1], step[2])
+        st.session_state.current_view = 'detail'
+        st.session_state.selected_agenda_id = step[1]
+    elif step[0] == 'toggle_todo':
+        app.toggle_todo(step[1], step[2])
+    elif step[0] == 'search':
+        st.session_state.current_view = 'list'
+        st.session_state.selected_agenda_id = None
+        st.session_state.agenda_search = step[1]
+    app.main()
+
+app.init_session_state()
+run(st.session_state.pop('step', None))
+"""
+
+# (action, relative weight) of a typical session
+ACTIONS = [('open agenda', 4), ('add note', 2), ('toggle to-do', 2), ('search', 2)]
+SEARCH_TERMS = ['review', 'planning', 'Alice', 'sync', 'budget', 'Chen']
+
+def next_step(rng: random.Random, agendas: Dict, session: int, count: int) -> tuple:
+    action = rng.choices([a for a, _ in ACTIONS], weights=[w for _, w in ACTIONS])[0]
+    agenda_id = rng.choice(list(agendas))
+    if action == 'open agenda':
+        return action, ('open', agenda_id)
+    if action == 'add note':
+        return action, ('add_note', agenda_id, f"load-test s{session} n{count}")
+    if action == 'toggle to-do':
+        with_todos = [a for a in agendas.values() if a['todos']]
+        if with_todos:
+            agenda = rng.choice(with_todos)
+            return action, ('toggle_todo', agenda['id'], rng.choice(agenda['todos'])['id'])
+        return 'open agenda', ('open', agenda_id)
+    return action, ('search', rng.choice(SEARCH_TERMS))
+
+def run_session(session: int, args, workdir: str, barrier, results) -> None:
+    """One simulated user: start a session, wait for the others, then click through the script"""
+    os.chdir(workdir)
+    rng = random.Random(args.seed * 1000 + session)
+    at = AppTest.from_string(SCRIPT.format(app_dir=str(APP_DIR)), default_timeout=300)
+    at.run()
+    barrier.wait()
+
+    samples, notes_added, errors = [], 0, 0
+    for count in range(args.steps):
+        action, step = next_step(rng, at.session_state['agendas'], session, count)
+        at.session_state['step'] = step
+        started = time.perf_counter()
+        at.run()
+        samples.append({'action': action, 'ms': (time.perf_counter() - started) * 1000})
+        errors += len(at.exception)
+        notes_added += action == 'add note'
+        if args.think_ms:
+            time.sleep(rng.uniform(0, 2 * args.think_ms) / 1000)
+    at.session_state['writer'].flush()
+
+    store = sys.modules['agenda_store']
+    results.put({
+        'session': session,
+        'samples': samples,
+        'finished': time.time(),
+        'errors': errors,
+        'notes_added': notes_added,
+        'writer': dict(at.session_state['writer'].stats),
+        'locks': dict(store.LOCK_STATS)
+    })
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if len(values) < 2:
+        value = round(values[0], 1) if values else 0.0
+        return {'p50': value, 'p90': value, 'p99': value, 'max': value}
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50': round(cuts[49], 1), 'p90': round(cuts[89], 1), 'p99': round(cuts[98], 1),
+            'max': round(max(values), 1)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sessions', type=int, default=8, help="Concurrent simulated users")
+    parser.add_argument('--steps', type=int, default=25, help="Clicks per session")
+    parser.add_argument('--agendas', type=int, default=500, help="Size of the generated dataset")
+    parser.add_argument('--think-ms', type=float, default=0, help="Mean pause between clicks")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='load_test_')
+    data_file = Path(workdir, 'agendas_data.json')
+    data_file.write_text(json.dumps(generate_agendas(args.agendas, args.seed), indent=2))
+
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Barrier(args.sessions + 1)
+    results = ctx.Queue()
+    workers = [ctx.Process(target=run_session, args=(i, args, workdir, barrier, results))
+               for i in range(args.sessions)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.time()
+    sessions = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    elapsed = max(s['finished'] for s in sessions) - started
+
+    samples = [x for s in sessions for x in s['samples']]
+    by_action = {action: percentiles([x['ms'] for x in samples if x['action'] == action])
+                 for action, _ in ACTIONS if any(x['action'] == action for x in samples)}
+    acquired = sum(s['locks']['acquired'] for s in sessions)
+    contended = sum(s['locks']['contended'] for s in sessions)
+    stored = json.loads(data_file.read_text())
+    notes_kept = sum(1 for a in stored.values() for n in a['notes'] if n['content'].startswith('load-test '))
+    report = {
+        'benchmark': 'load_test',
+        'sessions': args.sessions,
+        'steps': args.steps,
+        'agendas': args.agendas,
+        'reruns': len(samples),
+        'errors': sum(s['errors'] for s in sessions),
+        'elapsed_s': round(elapsed, 2),
+        'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        'latency_ms': percentiles([x['ms'] for x in samples]),
+        'latency_by_action_ms': by_action,
+        'writes': sum(s['writer']['commits'] for s in sessions),
+        'lock_acquisitions': acquired,
+        'lock_contended': contended,
+        'lock_wait_ms': round(sum(s['locks']['wait_seconds'] for s in sessions) * 1000, 1),
+        'notes_added': sum(s['notes_added'] for s in sessions),
+        'notes_in_file': notes_kept
+    }
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    print(f"{args.sessions} sessions x {args.steps} clicks on {args.agendas} agendas: "
+          f"{report['reruns']} reruns in {report['elapsed_s']} s ({report['throughput_rps']} reruns/s), "
+          f"{report['errors']} error(s)")
+    print(f"\n{'action':<14} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for action, p in [('all', report['latency_ms'])] + list(by_action.items()):
+        print(f"{action:<14} {p['p50']:>9.1f} {p['p90']:>9.1f} {p['p99']:>9.1f} {p['max']:>9.1f}")
+    print(f"\nData file: {report['writes']} write(s), {contended} of {acquired} lock acquisitions contended, "
+          f"{report['lock_wait_ms']} ms spent waiting")
+    print(f"Notes: {report['notes_added']} added, {notes_kept} survived concurrent saves")
+
+if __name__ == "__main__":
+    main()
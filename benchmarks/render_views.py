@@ -0,0 +1,173 @@
+"""
+Render Timing - per-view script time and element count with a baseline
+Renders each screen of both apps headlessly through AppTest against
+generated datasets of increasing size (see generate_dataset.py), recording
+the median script execution time and the number of elements it emits.
+Results are compared with benchmarks/baselines/render_views.json; a view
+that got slower by more than both the tolerance ratio and a minimum number
+of milliseconds (timings of small views are noisy), or started emitting a
+different number of elements, is reported as a regression and the script
+exits non-zero.
+
+    python benchmarks/render_views.py --sizes 10,100,1000 [--repeat 5] [--json]
+    python benchmarks/render_views.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+from generate_dataset import generate_agendas, generate_meetings
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE = Path(__file__).resolve().parent / 'baselines' / 'render_views.json'
+V2_APP = REPO_ROOT / 'streamlitv2' / 'meeting_agenda_app.py'
+
+V1_SCRIPT = """
+import sys
+sys.path.insert(0, {app_dir!r})
+import streamlit as st
+import meeting_agenda_manager as app
+app.archive.ARCHIVE_AFTER = None  # render the whole dataset, whatever today's date
+app.init_session_state()
+{call}
+"""
+
+# (view, render call); detail renders the agenda with the most items
+V1_VIEWS = [
+    ('agenda list', "app.render_agenda_list()"),
+    ('agenda detail', "app.render_agenda_detail(st.session_state.bench_agenda)"),
+    ('email settings', "app.render_email_settings()"),
+    ('import/export', "app.render_import_export()"),
+]
+
+# (view, session state on top of the generated meetings)
+V2_FLOWS = [
+    ('main: list', {}),
+    ('main: detail', {'selected_meeting': '{busiest}'}),
+    ('main: edit', {'selected_meeting': '{busiest}', 'editing_meeting': '{busiest}'}),
+]
+
+def count_elements(node) -> int:
+    """Leaf elements under an AppTest node (containers themselves are not counted)"""
+    children = getattr(node, 'children', None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+def measure(at: AppTest, state: Dict, repeat: int) -> Dict:
+    """Median script time in ms and element count of one view"""
+    for key, value in state.items():
+        at.session_state[key] = value
+    at.run()  # warm-up: imports, page config, stylesheet build, caches
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {'ms': round(statistics.median(samples), 1), 'elements': count_elements(at._tree)}
+
+def busiest(records: Dict, lists: List[str]) -> str:
+    return max(records.values(), key=lambda r: sum(len(r[name]) for name in lists))['id']
+
+def bench_v1(size: int, args) -> List[Dict]:
+    agendas = generate_agendas(size, args.seed)
+    Path('agendas_data.json').write_text(json.dumps(agendas))
+    state = {'bench_agenda': busiest(agendas, ['notes', 'todos', 'action_items'])}
+    app_dir = str(REPO_ROOT / 'streamlitagenda')
+    results = []
+    for view, call in V1_VIEWS:
+        at = AppTest.from_string(V1_SCRIPT.format(app_dir=app_dir, call=call), default_timeout=300)
+        results.append(dict(app='streamlitagenda', view=view, size=size, **measure(at, state, args.repeat)))
+    return results
+
+def bench_v2(size: int, args) -> List[Dict]:
+    meetings = generate_meetings(size, args.seed)
+    target = busiest(meetings, ['notes', 'action_items', 'follow_ups'])
+    results = []
+    for view, extra in V2_FLOWS:
+        state = dict({'meetings': meetings}, **{k: v.format(busiest=target) for k, v in extra.items()})
+        at = AppTest.from_file(str(V2_APP), default_timeout=300)
+        results.append(dict(app='streamlitv2', view=view, size=size, **measure(at, state, args.repeat)))
+    return results
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float, min_delta_ms: float) -> List[Dict]:
+    """Annotate results with their baseline and return the regressions"""
+    previous = {(r['app'], r['view'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for r in results:
+        base = previous.get((r['app'], r['view'], r['size']))
+        if base is None:
+            continue
+        r['baseline_ms'] = base['ms']
+        r['ratio'] = round(r['ms'] / base['ms'], 2) if base['ms'] else None
+        r['baseline_elements'] = base['elements']
+        slower = (r['ratio'] or 0) > tolerance and r['ms'] - base['ms'] > min_delta_ms
+        if slower or r['elements'] != base['elements']:
+            regressions.append(r)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', default='10,100,1000', help="Comma-separated dataset sizes")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--tolerance', type=float, default=1.5,
+                        help="Slowdown ratio against the baseline that counts as a regression")
+    parser.add_argument('--min-delta-ms', type=float, default=25,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the new baseline")
+    parser.add_argument('--json', action='store_true', help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    # Each size gets a scratch data file; the apps resolve it relative to the working directory
+    os.chdir(tempfile.mkdtemp(prefix='render_views_'))
+    sizes = [int(s) for s in args.sizes.split(',')]
+    results = [r for size in sizes for r in bench_v1(size, args) + bench_v2(size, args)]
+    report = {
+        'benchmark': 'render_views',
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'results': results
+    }
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+        regressions = []
+    else:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    report['regressions'] = len(regressions)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{'app':<16} {'view':<16} {'size':>6} {'ms':>9} {'elements':>9} {'vs baseline':>12}")
+        for r in results:
+            versus = f"{r['ratio']:.2f}x" if r.get('ratio') else '-'
+            flag = '  <-- regression' if r in regressions else ''
+            print(f"{r['app']:<16} {r['view']:<16} {r['size']:>6} {r['ms']:>9.1f} {r['elements']:>9} "
+                  f"{versus:>12}{flag}")
+        if args.save_baseline:
+            print(f"\nSaved baseline to {args.baseline}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
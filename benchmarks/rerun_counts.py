@@ -0,0 +1,126 @@
+"""
+Rerun Counts - script executions per interaction in the v2 app
+Clicks every control of streamlitv2 through AppTest and reads the app's own
+run_stats counters. Widgets dispatch commands from on_click/on_change
+callbacks, so each interaction must cost exactly one script execution and
+apply exactly one command; the script exits non-zero if any interaction
+costs more.
+
+    python benchmarks/rerun_counts.py [--json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP = REPO_ROOT / 'streamlitv2' / 'meeting_agenda_app.py'
+
+def meeting_fixture(meeting_id: str, items: int = 3) -> dict:
+    """One v2 meeting with a few notes, action items and follow-ups"""
+    return {
+        'id': meeting_id, 'name': f'Meeting {meeting_id}', 'date': '2026-01-15', 'time': '09:00:00',
+        'topic': 'Rerun counts', 'description': '', 'attachments': '', 'url_name': '', 'url': '',
+        'created_at': '2026-01-01T00:00:00',
+        'notes': [{'id': f'{meeting_id}n{i}', 'content': f'Note {i}', 'created_at': '2026-01-01T00:00:00'}
+                  for i in range(items)],
+        'action_items': [{'id': f'{meeting_id}a{i}', 'content': f'Action {i}', 'assignee': '', 'due_date': None,
+                          'completed': False, 'created_at': '2026-01-01T00:00:00'} for i in range(items)],
+        'follow_ups': [{'id': f'{meeting_id}f{i}', 'content': f'Follow-up {i}', 'priority': 'High',
+                        'completed': False, 'created_at': '2026-01-01T00:00:00'} for i in range(items)],
+    }
+
+def fresh_app(**state) -> AppTest:
+    at = AppTest.from_file(str(APP), default_timeout=30)
+    at.session_state['meetings'] = {m: meeting_fixture(m) for m in ('m1', 'm2')}
+    for key, value in state.items():
+        at.session_state[key] = value
+    at.run()
+    return at
+
+def submit(at: AppTest, label: str) -> None:
+    next(b for b in at.button if b.label == label).click()
+
+def delete_first_note(at: AppTest) -> None:
+    at.button(key='del_note_m1n0').click()
+    at.run()
+
+# (name, initial session state, action performed on the AppTest[, setup run before measuring])
+INTERACTIONS = [
+    ('view meeting', {}, lambda at: at.button(key='view_m1').click()),
+    ('delete meeting (card)', {}, lambda at: at.button(key='delete_m1').click()),
+    ('sidebar: new meeting', {}, lambda at: submit(at, "➕ New Meeting")),
+    ('sidebar: all meetings', {'selected_meeting': 'm1'}, lambda at: submit(at, "📋 All Meetings")),
+    ('sidebar: analytics', {}, lambda at: submit(at, "📈 Analytics")),
+    ('sidebar: recent meeting', {}, lambda at: at.button(key='sidebar_m2').click()),
+    ('create meeting', {}, lambda at: (at.text_input(key='create_tab_form_name').set_value('Kickoff'),
+                                       at.text_input(key='create_tab_form_topic').set_value('Scope'),
+                                       submit(at, "➕ Create Meeting"))),
+    ('back to meetings', {'selected_meeting': 'm1'}, lambda at: submit(at, "← Back to Meetings")),
+    ('edit meeting', {'selected_meeting': 'm1'}, lambda at: submit(at, "✏️ Edit Meeting Details")),
+    ('delete meeting (detail)', {'selected_meeting': 'm1'}, lambda at: submit(at, "🗑️ Delete Meeting")),
+    ('save meeting', {'selected_meeting': 'm1', 'editing_meeting': 'm1'},
+     lambda at: submit(at, "💾 Save Meeting")),
+    ('cancel edit', {'selected_meeting': 'm1', 'editing_meeting': 'm1'}, lambda at: submit(at, "❌ Cancel")),
+    ('add note', {'selected_meeting': 'm1'}, lambda at: (at.text_area(key='add_note_form_content').set_value('New'),
+                                                         submit(at, "➕ Add Note"))),
+    ('delete note', {'selected_meeting': 'm1'}, lambda at: at.button(key='del_note_m1n0').click()),
+    ('add action item', {'selected_meeting': 'm1'},
+     lambda at: (at.text_input(key='add_action_form_content').set_value('New'), submit(at, "➕ Add Action Item"))),
+    ('toggle action item', {'selected_meeting': 'm1'}, lambda at: at.checkbox(key='check_m1a0').check()),
+    ('delete action item', {'selected_meeting': 'm1'}, lambda at: at.button(key='del_action_m1a0').click()),
+    ('add follow-up', {'selected_meeting': 'm1'},
+     lambda at: (at.text_input(key='add_followup_form_content').set_value('New'), submit(at, "➕ Add Follow-up"))),
+    ('toggle follow-up', {'selected_meeting': 'm1'}, lambda at: at.checkbox(key='followup_check_m1f0').check()),
+    ('delete follow-up', {'selected_meeting': 'm1'}, lambda at: at.button(key='del_followup_m1f0').click()),
+    ('select all', {}, lambda at: at.button(key='bulk_select_all').click()),
+    ('clear selection', {'select_m1': True}, lambda at: at.button(key='bulk_clear').click()),
+    ('bulk complete actions', {'select_m1': True, 'select_m2': True},
+     lambda at: at.button(key='bulk_complete').click()),
+    ('bulk reassign', {'select_m1': True, 'select_m2': True},
+     lambda at: (at.text_input(key='bulk_assignee').set_value('Dana'), at.button(key='bulk_reassign').click())),
+    ('bulk delete', {'select_m1': True, 'select_m2': True}, lambda at: at.button(key='bulk_delete').click()),
+    ('undo', {'selected_meeting': 'm1'}, lambda at: at.button(key='undo').click(), delete_first_note),
+    ('redo', {'selected_meeting': 'm1'}, lambda at: at.button(key='redo').click(),
+     lambda at: (delete_first_note(at), at.button(key='undo').click(), at.run())),
+]
+
+def measure(name: str, state: dict, action, setup=None) -> dict:
+    at = fresh_app(**state)
+    if setup:
+        setup(at)
+    before = dict(at.session_state['run_stats'])
+    action(at)
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{name}: {at.exception[0].value}")
+    after = at.session_state['run_stats']
+    return {
+        'interaction': name,
+        'script_runs': after['script_runs'] - before['script_runs'],
+        'commands': after['commands'] - before['commands'],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--json', action='store_true', help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    results = [measure(*interaction) for interaction in INTERACTIONS]
+    failures = [r for r in results if r['script_runs'] != 1 or r['commands'] != 1]
+
+    if args.json:
+        json.dump({'results': results, 'failures': len(failures)}, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{'interaction':<26} {'script runs':>11} {'commands':>9}")
+        for r in results:
+            flag = '' if r not in failures else '  <-- expected 1/1'
+            print(f"{r['interaction']:<26} {r['script_runs']:>11} {r['commands']:>9}{flag}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Storage Benchmarks - load, save, export, import, search and email rendering
+Times the storage-bound functions of streamlitagenda against generated
+datasets of increasing size (see generate_dataset.py). The app module runs
+in Streamlit's bare mode, so no server is needed. Results can be written as
+JSON and diffed between commits to catch regressions.
+
+    python benchmarks/storage_bench.py --sizes 100,1000,10000 --repeat 5 [--json] [--out results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import streamlit
+
+from generate_dataset import generate_agendas
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'streamlitagenda'))
+
+INCLUDE_ALL = {'urls': True, 'notes': True, 'todos': True, 'action_items': True}
+
+def time_call(func: Callable, repeat: int, setup: Callable = None) -> Dict[str, float]:
+    """Median and worst wall time in ms over `repeat` calls"""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {'median_ms': round(statistics.median(samples), 3), 'max_ms': round(max(samples), 3)}
+
+def bench_size(app, store, size: int, args) -> List[Dict]:
+    """Time every operation against one generated dataset"""
+    import streamlit as st
+
+    agendas = generate_agendas(size, args.seed, attachment_kb=args.attachment_kb)
+    path = Path(tempfile.mkdtemp(prefix='storage_bench_')) / 'agendas_data.json'
+    store.save_agendas_to_file(agendas, path, 'none')
+    exported = json.dumps(agendas, indent=2)
+    busiest = max(agendas.values(), key=lambda a: len(a['notes']) + len(a['todos']) + len(a['action_items']))
+
+    def fresh_session():
+        st.session_state.agendas = {}
+        st.session_state.operation_log = app.OperationLog()
+
+    def loaded_session():
+        st.session_state.agendas = agendas
+
+    operations = [
+        ('load_agendas_from_file', lambda: store.load_agendas_from_file(path), None),
+        ('save_agendas_to_file (fsync)', lambda: store.save_agendas_to_file(agendas, path, 'fsync'), None),
+        ('save_agendas_to_file (no fsync)', lambda: store.save_agendas_to_file(agendas, path, 'none'), None),
+        ('export_data', app.export_data, loaded_session),
+        ('import_data', lambda: app.import_data(exported), fresh_session),
+        ('search filtering', lambda: app.filter_agendas(agendas, 'review', 'Scheduled', 'Date (newest)'), None),
+        ('generate_email_content', lambda: app.generate_email_content(busiest, INCLUDE_ALL), None),
+    ]
+    results = []
+    for name, func, setup in operations:
+        results.append(dict(size=size, operation=name, **time_call(func, args.repeat, setup)))
+    results.append({'size': size, 'operation': 'file size', 'bytes': path.stat().st_size})
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', default='100,1000,10000',
+                        help="Comma-separated agenda counts (up to 100000)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--attachment-kb', type=int, default=0, help="Attachment size for 20%% of agendas")
+    parser.add_argument('--json', action='store_true', help="Emit machine-readable results")
+    parser.add_argument('--out', type=Path, help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    # The app resolves its data file relative to the working directory; keep it away from real data
+    os.chdir(tempfile.mkdtemp(prefix='storage_bench_cwd_'))
+    import agenda_store as store
+    import meeting_agenda_manager as app
+
+    results = [r for size in map(int, args.sizes.split(',')) for r in bench_size(app, store, size, args)]
+    report = {
+        'benchmark': 'storage',
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'attachment_kb': args.attachment_kb,
+        'results': results
+    }
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{'size':>7}  {'operation':<32} {'median ms':>10} {'max ms':>10}")
+        for r in results:
+            if 'bytes' in r:
+                print(f"{r['size']:>7}  {r['operation']:<32} {r['bytes']:>21,} B")
+            else:
+                print(f"{r['size']:>7}  {r['operation']:<32} {r['median_ms']:>10.2f} {r['max_ms']:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Action Index - secondary indexes over action items across all agendas
+Keeps action items sorted by due date per owner, plus a global due-date index
+of open items, so tracker queries ("what does Alice owe, by due date",
+"what is overdue") are answered with bisect range scans instead of walking
+every agenda.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+OPEN_STATUSES = ('pending', 'in_progress')
+
+def _owner_key(owner: str) -> str:
+    return (owner or '').strip().lower()
+
+def _remove_sorted(entries: List[Tuple], entry: Tuple) -> None:
+    """Remove an entry from a sorted list in O(log n) search + one shift"""
+    pos = bisect_left(entries, entry)
+    if pos < len(entries) and entries[pos] == entry:
+        del entries[pos]
+
+class ActionIndex:
+    """Owner and due-date indexes over every agenda's action items"""
+
+    def __init__(self):
+        # action_id -> (agenda_id, owner_key, due_date, status)
+        self._items: Dict[str, Tuple[str, str, str, str]] = {}
+        self._by_agenda: Dict[str, set] = {}
+        self._by_owner: Dict[str, List[Tuple[str, str]]] = {}
+        self._open_by_due: List[Tuple[str, str]] = []
+        self._owner_names: Dict[str, str] = {}
+
+    @classmethod
+    def from_agendas(cls, agendas: Dict) -> 'ActionIndex':
+        """Build the index over every action item in the store"""
+        index = cls()
+        for agenda_id, agenda in agendas.items():
+            for action in agenda.get('action_items', []):
+                index.add(agenda_id, action)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, agenda_id: str, action: dict) -> None:
+        """Index an action item, replacing any previous entry for it"""
+        self.remove(action['id'])
+        owner = _owner_key(action.get('owner'))
+        due = action.get('due_date') or ''
+        status = action.get('status', 'pending')
+        entry = (due, action['id'])
+
+        self._items[action['id']] = (agenda_id, owner, due, status)
+        self._by_agenda.setdefault(agenda_id, set()).add(action['id'])
+        insort(self._by_owner.setdefault(owner, []), entry)
+        self._owner_names.setdefault(owner, (action.get('owner') or '').strip())
+        if status in OPEN_STATUSES:
+            insort(self._open_by_due, entry)
+
+    def remove(self, action_id: str) -> None:
+        """Drop an action item from the index if present"""
+        indexed = self._items.pop(action_id, None)
+        if indexed is None:
+            return
+        agenda_id, owner, due, status = indexed
+        entry = (due, action_id)
+
+        self._by_agenda[agenda_id].discard(action_id)
+        if not self._by_agenda[agenda_id]:
+            del self._by_agenda[agenda_id]
+        owned = self._by_owner[owner]
+        _remove_sorted(owned, entry)
+        if not owned:
+            del self._by_owner[owner]
+            self._owner_names.pop(owner, None)
+        if status in OPEN_STATUSES:
+            _remove_sorted(self._open_by_due, entry)
+
+    def remove_agenda(self, agenda_id: str) -> None:
+        """Drop every action item belonging to an agenda"""
+        for action_id in list(self._by_agenda.get(agenda_id, ())):
+            self.remove(action_id)
+
+    def set_status(self, action_id: str, status: str) -> None:
+        """Move an action item between the open and closed sets"""
+        indexed = self._items.get(action_id)
+        if indexed is None or indexed[3] == status:
+            return
+        agenda_id, owner, due, old_status = indexed
+        entry = (due, action_id)
+        self._items[action_id] = (agenda_id, owner, due, status)
+        was_open, is_open = old_status in OPEN_STATUSES, status in OPEN_STATUSES
+        if was_open and not is_open:
+            _remove_sorted(self._open_by_due, entry)
+        elif is_open and not was_open:
+            insort(self._open_by_due, entry)
+
+    def owners(self) -> List[str]:
+        """Return display names of every owner with at least one action item"""
+        return sorted(self._owner_names.values(), key=str.lower)
+
+    def actions_of(self, agenda_id: str) -> List[str]:
+        """Return the IDs of an agenda's indexed action items"""
+        return list(self._by_agenda.get(agenda_id, ()))
+
+    def agenda_of(self, action_id: str) -> Optional[str]:
+        """Return the agenda ID an action item belongs to"""
+        indexed = self._items.get(action_id)
+        return indexed[0] if indexed else None
+
+    def query(self, owner: Optional[str] = None, open_only: bool = True,
+              due_from: Optional[date] = None, due_before: Optional[date] = None) -> List[Tuple[str, str]]:
+        """Return (agenda_id, action_id) pairs ordered by due date
+
+        due_from is inclusive and due_before exclusive; items without a due
+        date sort first and are only returned when no lower bound is given.
+        """
+        if owner is not None:
+            entries = self._by_owner.get(_owner_key(owner), [])
+        elif open_only:
+            entries = self._open_by_due
+        else:
+            entries = sorted(((i[2], a) for a, i in self._items.items()))
+
+        lo = bisect_left(entries, (due_from.isoformat(),)) if due_from else 0
+        hi = bisect_left(entries, (due_before.isoformat(),)) if due_before else len(entries)
+
+        results = []
+        for _, action_id in entries[lo:hi]:
+            agenda_id, _, _, status = self._items[action_id]
+            if open_only and status not in OPEN_STATUSES:
+                continue
+            results.append((agenda_id, action_id))
+        return results
+
+    def overdue(self, today: date, owner: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Open items whose due date is before today"""
+        return [
+            pair for pair in self.query(owner, open_only=True, due_before=today)
+            if self._items[pair[1]][2]
+        ]
+
+    def upcoming(self, today: date, days: int = 7, owner: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Open items due from today through the next `days` days"""
+        return self.query(owner, open_only=True, due_from=today,
+                          due_before=today + timedelta(days=days + 1))
+
+    def counts(self, today: date) -> Dict[str, int]:
+        """Return open/overdue totals without materialising the item lists"""
+        cutoff = bisect_right(self._open_by_due, (today.isoformat(),))
+        undated = bisect_left(self._open_by_due, ('\x00',))
+        return {
+            'open': len(self._open_by_due),
+            'overdue': cutoff - undated
+        }
@@ -0,0 +1,300 @@
+"""
+Agenda CLI - bulk operations and reports over the agenda store
+Runs the same CRUD functions as the app without importing Streamlit, so it
+starts in a fraction of a second. Every bulk edit is applied inside one
+locked transaction and persisted with a single write.
+
+    python agenda_cli.py list --status scheduled
+    python agenda_cli.py close --quarter last
+    python agenda_cli.py reassign --from "Alice" --to "Bob"
+    python agenda_cli.py overdue --format csv
+    python agenda_cli.py backup --keep-last 24 --keep-daily 14
+    python agenda_cli.py restore --at 2026-10-01T09:00 --to restored.json
+    python agenda_cli.py archive --older-than 365 --dry-run
+    python agenda_cli.py archived --search "budget"
+    python agenda_cli.py --workspace sales overdue
+    python agenda_cli.py workspaces
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import agenda_store as store
+import archive
+import backup
+from action_index import ActionIndex
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def parse_quarter(value: str, today: date = None) -> Tuple[date, date]:
+    """Return [start, end) dates for 'last', 'current' or 'YYYYQn'"""
+    today = today or date.today()
+    current = (today.month - 1) // 3
+    if value in ('last', 'current'):
+        year, quarter = today.year, current - (1 if value == 'last' else 0)
+        if quarter < 0:
+            year, quarter = year - 1, 3
+    else:
+        try:
+            year_part, quarter_part = value.upper().split('Q')
+            year, quarter = int(year_part), int(quarter_part) - 1
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid quarter {value!r}; use last, current or YYYYQn")
+        if not 0 <= quarter <= 3:
+            raise argparse.ArgumentTypeError(f"invalid quarter {value!r}")
+    start = date(year, quarter * 3 + 1, 1)
+    end = date(year + 1, 1, 1) if quarter == 3 else date(year, quarter * 3 + 4, 1)
+    return start, end
+
+def parse_workspace(value: str) -> Path:
+    """Data file of a named workspace"""
+    try:
+        return store.workspace_path(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def emit(rows: List[Dict], columns: List[str], fmt: str) -> None:
+    """Print rows as an aligned table, JSON or CSV"""
+    if fmt == 'json':
+        json.dump(rows, sys.stdout, indent=2, default=str)
+        sys.stdout.write('\n')
+    elif fmt == 'csv':
+        writer = csv.DictWriter(sys.stdout, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        widths = {c: max([len(c)] + [len(str(r.get(c, ''))) for r in rows]) for c in columns}
+        print('  '.join(c.upper().ljust(widths[c]) for c in columns))
+        for row in rows:
+            print('  '.join(str(row.get(c, '')).ljust(widths[c]) for c in columns))
+
+def report_change(count: int, noun: str, dry_run: bool) -> None:
+    print(f"{'Would update' if dry_run else 'Updated'} {count} {noun}{'' if count == 1 else 's'}"
+          f"{' (dry run, nothing written)' if dry_run else ''}")
+
+class DryRun(Exception):
+    """Raised inside a transaction to abandon it without writing"""
+
+# ============================================================================
+# COMMANDS
+# ============================================================================
+
+def cmd_list(args) -> int:
+    agendas = store.load_agendas_from_file(args.data)
+    rows = sorted(agendas.values(), key=lambda a: (a['date'], a['time']))
+    if args.status:
+        rows = [a for a in rows if a['status'] == args.status]
+    if args.search:
+        needle = args.search.lower()
+        rows = [a for a in rows if needle in a['topic'].lower() or needle in a['presenter'].lower()]
+    emit(rows, ['id', 'date', 'time', 'status', 'presenter', 'topic'], args.format)
+    return 0
+
+def cmd_close(args) -> int:
+    if args.quarter:
+        start, end = args.quarter
+    else:
+        start, end = date.min, args.before
+    changed = 0
+    try:
+        with store.transaction(args.data) as agendas:
+            for agenda_id, agenda in agendas.items():
+                if start.isoformat() <= agenda['date'] < end.isoformat() and agenda['status'] != args.status:
+                    store.update_agenda(agendas, agenda_id, status=args.status)
+                    changed += 1
+            if args.dry_run:
+                raise DryRun
+    except DryRun:
+        pass
+    report_change(changed, 'agenda', args.dry_run)
+    return 0
+
+def cmd_reassign(args) -> int:
+    old_owner = args.from_owner.strip().lower()
+    changed = 0
+    try:
+        with store.transaction(args.data) as agendas:
+            for agenda_id, agenda in agendas.items():
+                for action in agenda['action_items']:
+                    if action['owner'].strip().lower() != old_owner:
+                        continue
+                    if args.open_only and action['status'] == 'completed':
+                        continue
+                    store.update_item(agendas, agenda_id, 'action_items', action['id'], owner=args.to_owner)
+                    changed += 1
+            if args.dry_run:
+                raise DryRun
+    except DryRun:
+        pass
+    report_change(changed, 'action item', args.dry_run)
+    return 0
+
+def cmd_overdue(args) -> int:
+    agendas = store.load_agendas_from_file(args.data)
+    index = ActionIndex.from_agendas(agendas)
+    today = args.today or date.today()
+    rows = []
+    for agenda_id, action_id in index.overdue(today, args.owner):
+        agenda = agendas[agenda_id]
+        action = store.find_item(agendas, agenda_id, 'action_items', action_id)
+        rows.append({
+            'due_date': action['due_date'],
+            'days_overdue': (today - date.fromisoformat(action['due_date'])).days,
+            'owner': action['owner'],
+            'priority': action['priority'],
+            'status': action['status'],
+            'action': action['action'],
+            'agenda_id': agenda_id,
+            'agenda': agenda['topic']
+        })
+    emit(rows, ['due_date', 'days_overdue', 'owner', 'priority', 'status', 'action', 'agenda'], args.format)
+    return 0
+
+def cmd_backup(args) -> int:
+    snapshot = backup.take_snapshot(args.data)
+    if snapshot is None:
+        print("Nothing changed since the last snapshot")
+    else:
+        print(f"Snapshot {snapshot['name']}: {snapshot['changed']} changed, {snapshot['removed']} removed, "
+              f"{snapshot['bytes_written']:,} bytes written")
+    rotated = backup.rotate(args.data, args.keep_last, args.keep_daily)
+    if rotated['snapshots']:
+        print(f"Rotated out {rotated['snapshots']} snapshot(s), freed {rotated['bytes_freed']:,} bytes")
+    return 0
+
+def cmd_backups(args) -> int:
+    rows = [{'name': s['name'], 'taken_at': s['taken_at'][:19], 'agendas': len(s['agendas']),
+             'changed': s['changed'], 'removed': s['removed'], 'bytes_written': s['bytes_written']}
+            for s in backup.list_snapshots(args.data)]
+    emit(rows, ['name', 'taken_at', 'agendas', 'changed', 'removed', 'bytes_written'], args.format)
+    return 0
+
+def cmd_restore(args) -> int:
+    if args.snapshot:
+        snapshot = next((s for s in backup.list_snapshots(args.data) if s['name'] == args.snapshot), None)
+    else:
+        snapshot = backup.find_snapshot(args.data, args.at)
+    if snapshot is None:
+        print("No matching snapshot", file=sys.stderr)
+        return 1
+    count = backup.restore_snapshot(snapshot, args.data, args.to)
+    print(f"Restored {count} agenda(s) from snapshot {snapshot['name']} to {args.to or args.data}")
+    return 0
+
+def cmd_archive(args) -> int:
+    after = timedelta(days=args.older_than)
+    if args.dry_run:
+        count = len(archive.archivable(store.load_agendas_from_file(args.data), after))
+    else:
+        count = sum(archive.archive_old(args.data, after)[1].values())
+    print(f"{'Would archive' if args.dry_run else 'Archived'} {count} agenda{'' if count == 1 else 's'}"
+          f"{' (dry run, nothing written)' if args.dry_run else ''}")
+    return 0
+
+def cmd_archived(args) -> int:
+    matches, _ = archive.search(args.data, lambda segment: [a for a in segment.values()
+                                                            if args.search.lower() in a['topic'].lower()
+                                                            or args.search.lower() in a['presenter'].lower()],
+                                args.limit, exclude=store.load_agendas_from_file(args.data))
+    columns = ['id', 'date', 'presenter', 'topic']
+    rows = [{c: a[c] for c in columns} for a in sorted(matches, key=lambda a: a['date'], reverse=True)]
+    emit(rows, columns, args.format)
+    return 0
+
+def cmd_workspaces(args) -> int:
+    summaries = store.fan_out(lambda name, agendas: store.summarize_agendas(agendas, args.today))
+    rows = [{'workspace': name, **summary, 'last_updated': summary['last_updated'][:19]}
+            for name, summary in summaries.items()]
+    emit(rows, ['workspace', 'agendas', 'scheduled', 'completed', 'open_actions', 'overdue_actions',
+                'last_updated'], args.format)
+    return 0
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Bulk operations and reports for meeting agendas")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--data', type=Path, default=store.DATA_FILE, help="Agendas JSON file")
+    source.add_argument('--workspace', dest='data', type=parse_workspace, metavar='NAME',
+                        help="Work on a named workspace's data file instead")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_cmd = commands.add_parser('list', help="List agendas")
+    list_cmd.add_argument('--status', choices=['scheduled', 'in_progress', 'completed'])
+    list_cmd.add_argument('--search', help="Match topic or presenter")
+    list_cmd.add_argument('--format', choices=['table', 'json', 'csv'], default='table')
+    list_cmd.set_defaults(handler=cmd_list)
+
+    close_cmd = commands.add_parser('close', help="Set the status of every agenda in a date range")
+    window = close_cmd.add_mutually_exclusive_group(required=True)
+    window.add_argument('--quarter', type=parse_quarter, help="last, current or YYYYQn")
+    window.add_argument('--before', type=date.fromisoformat, help="Close agendas dated before YYYY-MM-DD")
+    close_cmd.add_argument('--status', choices=['scheduled', 'in_progress', 'completed'], default='completed')
+    close_cmd.add_argument('--dry-run', action='store_true')
+    close_cmd.set_defaults(handler=cmd_close)
+
+    reassign_cmd = commands.add_parser('reassign', help="Move action items from one owner to another")
+    reassign_cmd.add_argument('--from', dest='from_owner', required=True)
+    reassign_cmd.add_argument('--to', dest='to_owner', required=True)
+    reassign_cmd.add_argument('--open-only', action='store_true', help="Skip completed action items")
+    reassign_cmd.add_argument('--dry-run', action='store_true')
+    reassign_cmd.set_defaults(handler=cmd_reassign)
+
+    overdue_cmd = commands.add_parser('overdue', help="Dump open action items past their due date")
+    overdue_cmd.add_argument('--owner')
+    overdue_cmd.add_argument('--today', type=date.fromisoformat, help="Evaluate as of YYYY-MM-DD")
+    overdue_cmd.add_argument('--format', choices=['table', 'json', 'csv'], default='table')
+    overdue_cmd.set_defaults(handler=cmd_overdue)
+
+    backup_cmd = commands.add_parser('backup', help="Take an incremental snapshot and rotate old ones")
+    backup_cmd.add_argument('--keep-last', type=int, default=backup.KEEP_LAST, help="Newest snapshots to keep")
+    backup_cmd.add_argument('--keep-daily', type=int, default=backup.KEEP_DAILY,
+                            help="Days for which the newest snapshot is kept")
+    backup_cmd.set_defaults(handler=cmd_backup)
+
+    backups_cmd = commands.add_parser('backups', help="List backup snapshots")
+    backups_cmd.add_argument('--format', choices=['table', 'json', 'csv'], default='table')
+    backups_cmd.set_defaults(handler=cmd_backups)
+
+    restore_cmd = commands.add_parser('restore', help="Rebuild the store from a backup snapshot")
+    point = restore_cmd.add_mutually_exclusive_group()
+    point.add_argument('--snapshot', help="Snapshot name (see 'backups'); the newest by default")
+    point.add_argument('--at', type=datetime.fromisoformat, help="Newest snapshot taken at or before this time")
+    restore_cmd.add_argument('--to', type=Path, help="Write here instead of overwriting the data file")
+    restore_cmd.set_defaults(handler=cmd_restore)
+
+    archive_cmd = commands.add_parser('archive', help="Move old completed agendas into the archive")
+    archive_cmd.add_argument('--older-than', type=int, metavar='DAYS',
+                             default=(archive.ARCHIVE_AFTER or timedelta(days=365)).days,
+                             help="Age of the meeting and of its last change")
+    archive_cmd.add_argument('--dry-run', action='store_true')
+    archive_cmd.set_defaults(handler=cmd_archive)
+
+    archived_cmd = commands.add_parser('archived', help="Search archived agendas")
+    archived_cmd.add_argument('--search', default='', help="Match topic or presenter")
+    archived_cmd.add_argument('--limit', type=int, help="Stop after this many matches")
+    archived_cmd.add_argument('--format', choices=['table', 'json', 'csv'], default='table')
+    archived_cmd.set_defaults(handler=cmd_archived)
+
+    workspaces_cmd = commands.add_parser('workspaces', help="Summarize every workspace")
+    workspaces_cmd.add_argument('--today', type=date.fromisoformat, help="Evaluate as of YYYY-MM-DD")
+    workspaces_cmd.add_argument('--format', choices=['table', 'json', 'csv'], default='table')
+    workspaces_cmd.set_defaults(handler=cmd_workspaces)
+
+    return parser
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,493 @@
+"""
+Agenda Store - persistent storage and CRUD for meeting agendas
+Plain-Python data layer shared by the Streamlit app, the HTTP API and the
+command-line tool. Nothing here imports Streamlit; every mutator works on an
+agendas dict passed in by the caller, and file access is serialised with an
+advisory lock so separate processes don't interleave writes.
+"""
+
+import json
+import os
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+from instrumentation import timed
+from revision_history import history_for
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+# ============================================================================
+# PERSISTENT STORAGE
+# ============================================================================
+DATA_FILE = Path('agendas_data.json')
+
+ITEM_TYPES = ('notes', 'todos', 'action_items')
+
+# 'fsync' flushes the data file and its directory to disk on every write;
+# 'none' still replaces the file atomically but leaves flushing to the OS
+DURABILITY = 'fsync'
+
+# Fields a caller may set on an agenda / item after creation
+AGENDA_FIELDS = {'topic', 'presenter', 'date', 'time', 'duration', 'topic_image',
+                 'urls', 'attachments', 'status'}
+AGENDA_STATUSES = ('scheduled', 'in_progress', 'completed')
+ACTION_STATUSES = ('pending', 'in_progress', 'completed')
+ITEM_FIELDS = {
+    'notes': {'content'},
+    'todos': {'task', 'priority', 'assignee', 'completed'},
+    'action_items': {'action', 'owner', 'due_date', 'priority', 'status'}
+}
+
+# Process-wide lock accounting: how often a lock was already held by someone else
+LOCK_STATS = {'acquired': 0, 'contended': 0, 'wait_seconds': 0.0}
+
+@contextmanager
+def locked(path: Path = None, exclusive: bool = True):
+    """Hold an advisory lock on the data file for the duration of the block"""
+    path = Path(path or DATA_FILE)
+    lock_path = path.with_name(path.name + '.lock')
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            try:
+                fcntl.flock(lock_file, mode | fcntl.LOCK_NB)
+            except BlockingIOError:
+                started = perf_counter()
+                fcntl.flock(lock_file, mode)
+                LOCK_STATS['contended'] += 1
+                LOCK_STATS['wait_seconds'] += perf_counter() - started
+        LOCK_STATS['acquired'] += 1
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def read_agendas(path: Path = None) -> Dict:
+    """Read agendas from disk without taking the lock (caller holds it)
+
+    Static content a templated agenda leaves out is filled in from its
+    template (see inherit_templates).
+    """
+    path = Path(path or DATA_FILE)
+    if path.exists():
+        try:
+            with open(path, 'r') as f:
+                agendas = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+        return inherit_templates(agendas, read_templates(path))
+    return {}
+
+def _fsync_dir(path: Path) -> None:
+    if os.name == 'posix':
+        fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+def write_agendas(agendas: Dict, path: Path = None, durability: str = None) -> int:
+    """Write agendas to disk without taking the lock (caller holds it); returns bytes written
+
+    The file is replaced atomically through a temp file, so a crash leaves
+    either the old or the new contents. Static content an agenda shares with
+    its template is left out. Agendas whose updated_at moved since the last
+    save also get a revision appended to the history file (see
+    revision_history.py).
+    """
+    path = Path(path or DATA_FILE)
+    durable = (durability or DURABILITY) == 'fsync'
+    agendas = stored_form(agendas, read_templates(path))
+    payload = json.dumps(agendas, indent=2, default=str).encode('utf-8')
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if durable:
+        _fsync_dir(path)
+    history_for(path).record(agendas)
+    return len(payload)
+
+@timed('storage.load')
+def load_agendas_from_file(path: Path = None) -> Dict:
+    """Load all agendas from persistent storage"""
+    with locked(path, exclusive=False):
+        return read_agendas(path)
+
+@timed('storage.save')
+def save_agendas_to_file(agendas: Dict, path: Path = None, durability: str = None) -> int:
+    """Save all agendas to persistent storage; raises IOError on failure"""
+    with locked(path):
+        return write_agendas(agendas, path, durability)
+
+@timed('storage.save')
+def save_changes_to_file(changed: Dict, removed: Iterable[str], path: Path = None, durability: str = None) -> int:
+    """Merge a writer's changed and removed agendas into the stored ones; raises IOError on failure
+
+    The file is re-read under the lock, so agendas other writers changed
+    since this one loaded are kept rather than reverted to a stale copy.
+    Returns bytes written.
+    """
+    with locked(path):
+        agendas = read_agendas(path)
+        agendas.update(changed)
+        for agenda_id in removed:
+            agendas.pop(agenda_id, None)
+        return write_agendas(agendas, path, durability)
+
+@contextmanager
+def transaction(path: Path = None):
+    """Yield the stored agendas under an exclusive lock and write them back once
+
+    Every mutation made inside the block is persisted by a single write; if
+    the block raises, nothing is written.
+    """
+    with locked(path):
+        agendas = read_agendas(path)
+        yield agendas
+        write_agendas(agendas, path)
+
+# ============================================================================
+# WORKSPACES
+# ============================================================================
+# Every named workspace is a shard with its own data file, and so its own lock,
+# revision history, trash, templates and backups. The default workspace is
+# DATA_FILE itself, so existing data needs no migration; the others live in
+# WORKSPACE_DIR/<name>/.
+DEFAULT_WORKSPACE = 'default'
+WORKSPACE_DIR = Path('workspaces')
+WORKSPACE_NAME = re.compile(r'[a-z0-9][a-z0-9_-]{0,39}')
+FAN_OUT_WORKERS = 8             # shards read in parallel by fan_out()
+
+T = TypeVar('T')
+
+def workspace_path(name: Optional[str] = None) -> Path:
+    """Data file of a workspace; raises ValueError for an invalid name"""
+    name = name or DEFAULT_WORKSPACE
+    if name == DEFAULT_WORKSPACE:
+        return DATA_FILE
+    if not WORKSPACE_NAME.fullmatch(name):
+        raise ValueError(f"Invalid workspace name {name!r}: use lowercase letters, digits, '-' and '_'")
+    return WORKSPACE_DIR / name / DATA_FILE.name
+
+def list_workspaces() -> List[str]:
+    """The default workspace followed by every workspace created under WORKSPACE_DIR"""
+    names = sorted(path.parent.name for path in WORKSPACE_DIR.glob(f"*/{DATA_FILE.name}")
+                   if WORKSPACE_NAME.fullmatch(path.parent.name) and path.parent.name != DEFAULT_WORKSPACE)
+    return [DEFAULT_WORKSPACE] + names
+
+def create_workspace(name: str) -> Path:
+    """Create an empty workspace and return its data file; an existing one is left as it is"""
+    if not WORKSPACE_NAME.fullmatch(name or ''):
+        raise ValueError(f"Invalid workspace name {name!r}: use lowercase letters, digits, '-' and '_'")
+    path = workspace_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with locked(path):
+        if not path.exists():
+            write_agendas({}, path)
+    return path
+
+def fan_out(query: Callable[[str, Dict], T], workspaces: Optional[List[str]] = None) -> Dict[str, T]:
+    """Run `query(name, agendas)` over each workspace's shard in parallel; results by workspace name
+
+    Every shard is read under its own shared lock, so a workspace that is
+    being written only delays its own result.
+    """
+    names = workspaces or list_workspaces()
+
+    def run(name: str) -> T:
+        return query(name, load_agendas_from_file(workspace_path(name)))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(FAN_OUT_WORKERS, len(names)))) as pool:
+        return dict(zip(names, pool.map(run, names)))
+
+def summarize_agendas(agendas: Dict, today: Optional[date] = None) -> Dict:
+    """Agenda and action item counts of one shard, for cross-workspace overviews"""
+    today_iso = (today or date.today()).isoformat()
+    open_actions = [action for agenda in agendas.values() for action in agenda.get('action_items', [])
+                    if action.get('status') != 'completed']
+    return {
+        'agendas': len(agendas),
+        'scheduled': sum(1 for agenda in agendas.values() if agenda.get('status') == 'scheduled'),
+        'completed': sum(1 for agenda in agendas.values() if agenda.get('status') == 'completed'),
+        'open_actions': len(open_actions),
+        'overdue_actions': sum(1 for action in open_actions
+                               if action.get('due_date') and action['due_date'] < today_iso),
+        'last_updated': max((agenda.get('updated_at') or '' for agenda in agendas.values()), default='')
+    }
+
+# ============================================================================
+# TEMPLATES
+# ============================================================================
+# Static content an agenda shares copy-on-write with the template it was created
+# from: on disk the agenda stores only the fields it overrides. Editing one of
+# these fields always assigns a new value, so the template's objects are never
+# modified through an agenda.
+TEMPLATE_FIELDS = ('topic_image', 'urls', 'attachments')
+
+# Parsed template files by path, reused while the file's mtime and size are unchanged
+_templates_cache: Dict[Path, tuple] = {}
+
+def templates_path(data_file: Path = None) -> Path:
+    """Template file kept next to a data file (agendas_data.json -> agendas_data_templates.json)"""
+    data_file = Path(data_file or DATA_FILE)
+    return data_file.with_name(f"{data_file.stem}_templates.json")
+
+def read_templates(data_file: Path = None) -> Dict:
+    """Read the templates of a data file without taking the lock (caller holds it)
+
+    The parsed file is cached per process, so the agendas of every session
+    reference one copy of each template's static content.
+    """
+    path = templates_path(data_file)
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _templates_cache.get(path)
+    if cached is None or cached[0] != signature:
+        try:
+            with open(path, 'r') as f:
+                cached = _templates_cache[path] = (signature, json.load(f))
+        except (json.JSONDecodeError, IOError):
+            return {}
+    return dict(cached[1])
+
+def write_templates(templates: Dict, data_file: Path = None) -> None:
+    """Write the templates atomically without taking the lock (caller holds it)"""
+    path = templates_path(data_file)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(templates, f, indent=2, default=str)
+    os.replace(tmp, path)
+    stat = path.stat()
+    _templates_cache[path] = ((stat.st_mtime_ns, stat.st_size), dict(templates))
+
+def _empty(field: str):
+    return None if field == 'topic_image' else []
+
+def inherit_templates(agendas: Dict, templates: Dict) -> Dict:
+    """Fill in the static content templated agendas leave out, sharing the template's objects"""
+    for agenda in agendas.values():
+        if not isinstance(agenda, dict) or not agenda.get('template_id'):
+            continue
+        template = templates.get(agenda['template_id'], {})
+        for field in TEMPLATE_FIELDS:
+            if field not in agenda:
+                agenda[field] = template[field] if field in template else _empty(field)
+    return agendas
+
+def stored_form(agendas: Dict, templates: Dict) -> Dict:
+    """Agendas as written to disk: static content equal to their template's is left out"""
+    if not templates:
+        return agendas
+    stored = {}
+    for agenda_id, agenda in agendas.items():
+        template = templates.get(agenda.get('template_id'))
+        if template is not None:
+            inherited = {field for field in TEMPLATE_FIELDS
+                         if field in agenda and (agenda[field] is template.get(field) or
+                                                 agenda[field] == template.get(field))}
+            if inherited:
+                agenda = {key: value for key, value in agenda.items() if key not in inherited}
+        stored[agenda_id] = agenda
+    return stored
+
+def create_template(templates: Dict, name: str, agenda: dict) -> str:
+    """Add a template built from an agenda's details and static content and return its ID"""
+    template_id = _new_id()
+    templates[template_id] = {
+        'id': template_id,
+        'name': name,
+        'topic': agenda['topic'],
+        'presenter': agenda['presenter'],
+        'time': agenda['time'],
+        'duration': agenda['duration'],
+        **{field: agenda[field] if field in agenda else _empty(field) for field in TEMPLATE_FIELDS},
+        'created_at': _now()
+    }
+    return template_id
+
+def template_usage(agendas: Dict) -> Dict[str, int]:
+    """Number of agendas referencing each template"""
+    usage: Dict[str, int] = {}
+    for agenda in agendas.values():
+        if agenda.get('template_id'):
+            usage[agenda['template_id']] = usage.get(agenda['template_id'], 0) + 1
+    return usage
+
+def detach_template(agendas: Dict, template_id: str) -> List[str]:
+    """Unlink agendas from a template so they store its static content themselves
+
+    Write the agendas before removing the template from the template file,
+    or the content they inherit is lost.
+    """
+    detached = []
+    for agenda_id, agenda in agendas.items():
+        if agenda.get('template_id') == template_id:
+            del agenda['template_id']
+            touch(agendas, agenda_id)
+            detached.append(agenda_id)
+    return detached
+
+# ============================================================================
+# AGENDA CRUD
+# ============================================================================
+
+def _new_id() -> str:
+    return str(uuid.uuid4())[:8]
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+def _normalize(key: str, value):
+    if key in ('date', 'due_date') and isinstance(value, date):
+        return value.isoformat()
+    if key == 'time' and isinstance(value, time):
+        return value.isoformat()
+    return value
+
+def touch(agendas: Dict, agenda_id: str) -> None:
+    """Stamp an agenda as modified"""
+    agendas[agenda_id]['updated_at'] = _now()
+
+def create_agenda(agendas: Dict, topic: str, presenter: str, meeting_date: date, meeting_time: time,
+                  duration: int, topic_image: Optional[dict] = None,
+                  urls: List[dict] = None, attachments: List[dict] = None,
+                  template_id: Optional[str] = None) -> str:
+    """Create a new meeting agenda and return its ID"""
+    agenda_id = _new_id()
+    agendas[agenda_id] = {
+        'id': agenda_id,
+        'topic': topic,
+        'presenter': presenter,
+        'date': _normalize('date', meeting_date),
+        'time': _normalize('time', meeting_time),
+        'duration': duration,
+        'topic_image': topic_image,
+        'urls': urls or [],
+        'attachments': attachments or [],
+        'notes': [],
+        'todos': [],
+        'action_items': [],
+        'created_at': _now(),
+        'updated_at': _now(),
+        'status': 'scheduled'
+    }
+    if template_id:
+        agendas[agenda_id]['template_id'] = template_id
+    return agenda_id
+
+def update_agenda(agendas: Dict, agenda_id: str, **kwargs) -> bool:
+    """Update an existing agenda with provided fields"""
+    if agenda_id not in agendas:
+        return False
+    for key, value in kwargs.items():
+        agendas[agenda_id][key] = _normalize(key, value)
+    touch(agendas, agenda_id)
+    return True
+
+def delete_agenda(agendas: Dict, agenda_id: str) -> Optional[dict]:
+    """Delete an agenda by ID and return it"""
+    return agendas.pop(agenda_id, None)
+
+# ============================================================================
+# NOTES, TO-DOS & ACTION ITEMS
+# ============================================================================
+
+def _append_item(agendas: Dict, agenda_id: str, item_type: str, item: dict) -> Optional[dict]:
+    if agenda_id not in agendas:
+        return None
+    agendas[agenda_id][item_type].append(item)
+    touch(agendas, agenda_id)
+    return item
+
+def add_note(agendas: Dict, agenda_id: str, content: str) -> Optional[dict]:
+    """Add a note to an agenda"""
+    return _append_item(agendas, agenda_id, 'notes', {
+        'id': _new_id(),
+        'content': content,
+        'created_at': _now()
+    })
+
+def add_todo(agendas: Dict, agenda_id: str, task: str, priority: str = 'medium',
+             assignee: str = '') -> Optional[dict]:
+    """Add a to-do item to an agenda"""
+    return _append_item(agendas, agenda_id, 'todos', {
+        'id': _new_id(),
+        'task': task,
+        'priority': priority,
+        'assignee': assignee,
+        'completed': False,
+        'created_at': _now()
+    })
+
+def add_action_item(agendas: Dict, agenda_id: str, action: str, owner: str, due_date: date,
+                    priority: str = 'medium') -> Optional[dict]:
+    """Add an action item to an agenda"""
+    return _append_item(agendas, agenda_id, 'action_items', {
+        'id': _new_id(),
+        'action': action,
+        'owner': owner,
+        'due_date': _normalize('due_date', due_date),
+        'priority': priority,
+        'status': 'pending',
+        'created_at': _now()
+    })
+
+def find_item(agendas: Dict, agenda_id: str, item_type: str, item_id: str) -> Optional[dict]:
+    """Return a note, todo, or action item by ID"""
+    if agenda_id not in agendas:
+        return None
+    for item in agendas[agenda_id].get(item_type, []):
+        if item['id'] == item_id:
+            return item
+    return None
+
+def update_item(agendas: Dict, agenda_id: str, item_type: str, item_id: str, **kwargs) -> Optional[dict]:
+    """Update fields of a note, todo, or action item"""
+    item = find_item(agendas, agenda_id, item_type, item_id)
+    if item is None:
+        return None
+    was_completed = item.get('status') == 'completed'
+    for key, value in kwargs.items():
+        item[key] = _normalize(key, value)
+    # When an action item was completed, for time-to-close reporting
+    if item_type == 'action_items' and item.get('status') == 'completed' and not was_completed:
+        item['completed_at'] = _now()
+    touch(agendas, agenda_id)
+    return item
+
+def toggle_todo(agendas: Dict, agenda_id: str, todo_id: str) -> Optional[dict]:
+    """Toggle a to-do item's completion status"""
+    todo = find_item(agendas, agenda_id, 'todos', todo_id)
+    if todo is None:
+        return None
+    return update_item(agendas, agenda_id, 'todos', todo_id, completed=not todo['completed'])
+
+def update_action_status(agendas: Dict, agenda_id: str, action_id: str, status: str) -> Optional[dict]:
+    """Update an action item's status"""
+    return update_item(agendas, agenda_id, 'action_items', action_id, status=status)
+
+def delete_item(agendas: Dict, agenda_id: str, item_type: str, item_id: str) -> Optional[dict]:
+    """Delete a note, todo, or action item and return it"""
+    item = find_item(agendas, agenda_id, item_type, item_id)
+    if item is None:
+        return None
+    agendas[agenda_id][item_type] = [i for i in agendas[agenda_id][item_type] if i['id'] != item_id]
+    touch(agendas, agenda_id)
+    return item
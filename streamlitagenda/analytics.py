@@ -0,0 +1,119 @@
+"""
+Analytics - columnar frames of the meeting data and vectorized reporting metrics
+Records and their child items are flattened into pandas frames once per data
+revision (see OperationLog.revision) and kept in the session, so a rerun of
+the analytics view only runs the grouped aggregations below over columns.
+Flattening reads each field of each item once; no metric loops over rows in
+Python, which keeps the view interactive at 100k items.
+"""
+
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from instrumentation import span
+
+Frames = Dict[str, pd.DataFrame]
+
+# ============================================================================
+# FLATTENING
+# ============================================================================
+
+def records_frame(records: Dict[str, dict], columns: Sequence[str]) -> pd.DataFrame:
+    """One row per record, one column per field"""
+    values = list(records.values())
+    return pd.DataFrame({column: [record.get(column) for record in values] for column in columns})
+
+def items_frame(records: Dict[str, dict], list_name: str, columns: Sequence[str],
+                parent_columns: Sequence[str] = ()) -> pd.DataFrame:
+    """One row per item of every record's `list_name`, with its record's id and `parent_columns`"""
+    parents, items = [], []
+    for record in records.values():
+        children = record.get(list_name) or ()
+        parents.extend([record] * len(children))
+        items.extend(children)
+    data = {'record_id': [parent['id'] for parent in parents]}
+    data.update({f"record_{column}": [parent.get(column) for parent in parents] for column in parent_columns})
+    data.update({column: [item.get(column) for item in items] for column in columns})
+    return pd.DataFrame(data)
+
+def parse_dates(frame: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    """Convert ISO date and timestamp columns in place; missing or malformed values become NaT"""
+    for column in columns:
+        frame[column] = pd.to_datetime(frame[column], errors='coerce', format='ISO8601')
+    return frame
+
+class FrameCache:
+    """A session's flattened frames, rebuilt only when its records or their revision change"""
+
+    def __init__(self):
+        self.builds = 0
+        self._key: Optional[tuple] = None
+        self._frames: Optional[Frames] = None
+
+    def frames(self, records: Dict[str, dict], revision: int,
+               build: Callable[[Dict[str, dict]], Frames]) -> Frames:
+        key = (id(records), revision)
+        if key != self._key:
+            with span('analytics.flatten'):
+                self._frames = build(records)
+            self._key = key
+            self.builds += 1
+        return self._frames
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+def monthly_counts(frame: pd.DataFrame, date_column: str, by: str, top: int = 10) -> pd.DataFrame:
+    """Rows per calendar month, one column per value of `by` (the `top` most frequent, the rest as 'Other')"""
+    dated = frame[frame[date_column].notna()]
+    group = dated[by].fillna('—').astype(str)
+    busiest = group.value_counts().index[:top]
+    group = group.where(group.isin(busiest), 'Other')
+    table = group.groupby([dated[date_column].dt.to_period('M'), group]).size().unstack(fill_value=0)
+    table = table[table.sum().sort_values(ascending=False).index]
+    table.index = table.index.astype(str)
+    table.index.name = 'Month'
+    table.columns.name = None
+    return table
+
+def completion(frame: pd.DataFrame, done: pd.Series, created: str = 'created_at',
+               closed: str = 'completed_at') -> Dict:
+    """Completion rate and median days from creation to completion"""
+    total = len(frame)
+    completed = int(done.sum())
+    days = (frame.loc[done, closed] - frame.loc[done, created]).dt.total_seconds() / 86400
+    days = days[days >= 0]
+    median = days.median()
+    return {
+        'total': total,
+        'completed': completed,
+        'rate': completed / total if total else None,
+        'median_days_to_close': None if pd.isna(median) else round(float(median), 1),
+        'timed': int(days.count())
+    }
+
+def overdue_by_owner(frame: pd.DataFrame, open_: pd.Series, owner: str, due: str = 'due_date',
+                     today: Optional[date] = None, limit: Optional[int] = None) -> pd.DataFrame:
+    """Open items past their due date per owner, with each owner's oldest due date, most overdue first"""
+    late = frame[open_ & (frame[due] < pd.Timestamp(today or date.today()))]
+    owners = late[owner].fillna('').astype(str).str.strip().replace('', 'Unassigned')
+    counts = owners.value_counts()
+    oldest = late[due].groupby(owners).min().reindex(counts.index)
+    table = pd.DataFrame({'Overdue': counts.to_numpy(), 'Oldest due': oldest.dt.date.to_numpy()},
+                         index=counts.index.rename('Owner'))
+    return table.head(limit).reset_index()
+
+def priority_mix(frame: pd.DataFrame, priority: str, done: pd.Series,
+                 order: Optional[List[str]] = None) -> pd.DataFrame:
+    """Open and completed items per priority, with each priority's share of all items"""
+    priorities = frame[priority].fillna('—').astype(str)
+    table = pd.DataFrame({'Open': (~done).groupby(priorities).sum(), 'Completed': done.groupby(priorities).sum()})
+    if order:
+        table = table.reindex([p for p in order if p in table.index] +
+                              [p for p in table.index if p not in order])
+    table['Total'] = table['Open'] + table['Completed']
+    table['Share'] = (table['Total'] / max(int(table['Total'].sum()), 1)).round(3)
+    return table.rename_axis('Priority').reset_index()
@@ -0,0 +1,387 @@
+"""
+Agenda API - headless JSON HTTP API over the agenda store
+Serves list/get/create/update for agendas and their notes, to-dos and action
+items straight from agenda_store, without running the Streamlit app.
+
+    python api_server.py --port 8502
+
+Reads are served from an in-memory copy that is reloaded only when the data
+file changes; writes are locked read-modify-write cycles. Responses carry an
+ETag derived from `updated_at`, so clients can poll with If-None-Match, and
+list endpoints accept `offset`, `limit` and `fields` query parameters.
+
+Open app sessions merge only their own changes into the file (see
+write_behind.py), so API writes to other agendas are kept. Those sessions
+show API writes only after a reload.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from contextlib import contextmanager
+from datetime import date, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import agenda_store as store
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+class ApiError(Exception):
+    """Error carrying an HTTP status code"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+# ============================================================================
+# STORE ACCESS
+# ============================================================================
+
+class AgendaRepository:
+    """Cached, lock-aware access to the agendas file"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._mutex = Lock()
+        self._agendas: Dict = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._list_validator: Optional[str] = None
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def snapshot(self) -> Dict:
+        """Return the current agendas, reloading only if the file changed"""
+        with self._mutex:
+            stamp = self._file_stamp()
+            if stamp != self._stamp or stamp is None:
+                self._agendas = store.load_agendas_from_file(self.path)
+                self._stamp = stamp
+                self._list_validator = None
+            return self._agendas
+
+    def list_validator(self) -> str:
+        """Validator for the whole collection, derived from every updated_at"""
+        agendas = self.snapshot()
+        with self._mutex:
+            if self._list_validator is None:
+                digest = hashlib.sha1()
+                for agenda_id in sorted(agendas):
+                    digest.update(f"{agenda_id}:{agendas[agenda_id].get('updated_at', '')};".encode())
+                self._list_validator = digest.hexdigest()
+            return self._list_validator
+
+    @contextmanager
+    def transaction(self):
+        """Yield a fresh copy of the agendas under an exclusive lock and save it"""
+        with self._mutex, store.transaction(self.path) as agendas:
+            yield agendas
+        with self._mutex:
+            self._agendas = agendas
+            self._stamp = self._file_stamp()
+            self._list_validator = None
+
+# ============================================================================
+# REPRESENTATION HELPERS
+# ============================================================================
+
+def make_etag(validator: str, variant: str = '') -> str:
+    """Strong ETag for a validator and the representation variant (fields, page)"""
+    return '"' + hashlib.sha1(f"{validator}|{variant}".encode()).hexdigest()[:20] + '"'
+
+def agenda_validator(agenda: dict) -> str:
+    return f"{agenda['id']}:{agenda.get('updated_at', '')}"
+
+def select_fields(record: dict, fields: Optional[List[str]]) -> dict:
+    if not fields:
+        return record
+    return {k: record[k] for k in fields if k in record}
+
+def paginate(items: List, query: Dict) -> Tuple[List, Dict]:
+    try:
+        offset = max(int(query.get('offset', 0)), 0)
+        limit = min(max(int(query.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError:
+        raise ApiError(400, "offset and limit must be integers")
+    return items[offset:offset + limit], {'offset': offset, 'limit': limit, 'total': len(items)}
+
+def _parse_date(value, field: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"{field} must be an ISO date (YYYY-MM-DD)")
+
+def _parse_time(value, field: str) -> time:
+    try:
+        return time.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"{field} must be an ISO time (HH:MM[:SS])")
+
+def _require(body: dict, *fields: str) -> None:
+    missing = [f for f in fields if not str(body.get(f, '')).strip()]
+    if missing:
+        raise ApiError(400, f"Missing required field(s): {', '.join(missing)}")
+
+def _check_fields(body: dict, allowed: set, statuses: Tuple[str, ...] = ()) -> dict:
+    unknown = set(body) - allowed
+    if unknown:
+        raise ApiError(400, f"Unknown or read-only field(s): {', '.join(sorted(unknown))}")
+    if 'status' in body and body['status'] not in statuses:
+        raise ApiError(400, f"status must be one of: {', '.join(statuses)}")
+    if 'duration' in body:
+        try:
+            body['duration'] = int(body['duration'])
+        except (TypeError, ValueError):
+            raise ApiError(400, "duration must be a whole number of minutes")
+        if body['duration'] <= 0:
+            raise ApiError(400, "duration must be a whole number of minutes")
+    if 'date' in body:
+        _parse_date(body['date'], 'date')
+    if 'due_date' in body:
+        _parse_date(body['due_date'], 'due_date')
+    if 'time' in body:
+        body['time'] = _parse_time(body['time'], 'time').isoformat()
+    return body
+
+# ============================================================================
+# REQUEST HANDLER
+# ============================================================================
+
+ROUTES = [
+    ('agendas', re.compile(r'^/agendas/?$')),
+    ('agenda', re.compile(r'^/agendas/(?P<agenda_id>[\w-]+)/?$')),
+    ('items', re.compile(r'^/agendas/(?P<agenda_id>[\w-]+)/(?P<item_type>notes|todos|action_items)/?$')),
+    ('item', re.compile(r'^/agendas/(?P<agenda_id>[\w-]+)/(?P<item_type>notes|todos|action_items)/(?P<item_id>[\w-]+)/?$')),
+]
+
+class AgendaApiHandler(BaseHTTPRequestHandler):
+    """Routes JSON requests onto the agenda store"""
+
+    repository: AgendaRepository = None
+    server_version = "AgendaAPI/1.0"
+
+    # -- plumbing ------------------------------------------------------------
+
+    def _route(self) -> Tuple[str, Dict, Dict]:
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        for name, pattern in ROUTES:
+            match = pattern.match(parts.path)
+            if match:
+                return name, match.groupdict(), query
+        raise ApiError(404, "Not found")
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            raise ApiError(400, f"Invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Request body must be a JSON object")
+        return body
+
+    def _send(self, status: int, payload=None, etag: Optional[str] = None, location: Optional[str] = None):
+        body = b'' if payload is None else json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if location:
+            self.send_header('Location', location)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _not_modified(self, etag: str) -> bool:
+        return etag in [t.strip() for t in (self.headers.get('If-None-Match') or '').split(',')]
+
+    def _send_conditional(self, payload, etag: str):
+        if self._not_modified(etag):
+            self._send(304, etag=etag)
+        else:
+            self._send(200, payload, etag=etag)
+
+    def _check_if_match(self, agenda: dict) -> None:
+        expected = self.headers.get('If-Match')
+        if expected and expected.strip() != '*' and expected.strip() != make_etag(agenda_validator(agenda)):
+            raise ApiError(412, "Agenda was modified since it was fetched")
+
+    def _dispatch(self, method: str):
+        try:
+            name, params, query = self._route()
+            handler = getattr(self, f"{method}_{name}", None)
+            if handler is None:
+                raise ApiError(405, f"{method.upper()} not allowed here")
+            handler(query=query, **params)
+        except ApiError as e:
+            self._send(e.status, {'error': e.message})
+        except Exception as e:
+            self._send(500, {'error': f"Internal error: {e}"})
+
+    def do_GET(self):
+        self._dispatch('get')
+
+    def do_POST(self):
+        self._dispatch('post')
+
+    def do_PATCH(self):
+        self._dispatch('patch')
+
+    def log_message(self, format, *args):
+        pass
+
+    # -- agendas -------------------------------------------------------------
+
+    def _fields(self, query: Dict) -> Optional[List[str]]:
+        return [f.strip() for f in query['fields'].split(',') if f.strip()] if query.get('fields') else None
+
+    def _agenda(self, agendas: Dict, agenda_id: str) -> dict:
+        if agenda_id not in agendas:
+            raise ApiError(404, f"Agenda {agenda_id} not found")
+        return agendas[agenda_id]
+
+    def get_agendas(self, query: Dict):
+        variant = urlsplit(self.path).query
+        etag = make_etag(self.repository.list_validator(), variant)
+        if self._not_modified(etag):
+            self._send(304, etag=etag)
+            return
+
+        agendas = list(self.repository.snapshot().values())
+        if query.get('status'):
+            agendas = [a for a in agendas if a.get('status') == query['status']]
+        if query.get('q'):
+            needle = query['q'].lower()
+            agendas = [a for a in agendas if needle in a['topic'].lower() or needle in a['presenter'].lower()]
+        agendas.sort(key=lambda a: (a.get('date', ''), a.get('time', '')), reverse=True)
+
+        page, meta = paginate(agendas, query)
+        fields = self._fields(query)
+        self._send(200, dict(meta, items=[select_fields(a, fields) for a in page]), etag=etag)
+
+    def post_agendas(self, query: Dict):
+        body = _check_fields(self._read_body(), store.AGENDA_FIELDS, store.AGENDA_STATUSES)
+        _require(body, 'topic', 'presenter', 'date')
+        with self.repository.transaction() as agendas:
+            agenda_id = store.create_agenda(
+                agendas, body['topic'], body['presenter'],
+                _parse_date(body['date'], 'date'), _parse_time(body.get('time', '09:00'), 'time'),
+                body.get('duration', 60), body.get('topic_image'),
+                body.get('urls'), body.get('attachments')
+            )
+            if body.get('status'):
+                agendas[agenda_id]['status'] = body['status']
+            agenda = agendas[agenda_id]
+        self._send(201, agenda, etag=make_etag(agenda_validator(agenda)), location=f"/agendas/{agenda_id}")
+
+    def get_agenda(self, query: Dict, agenda_id: str):
+        agenda = self._agenda(self.repository.snapshot(), agenda_id)
+        fields = self._fields(query)
+        self._send_conditional(select_fields(agenda, fields),
+                               make_etag(agenda_validator(agenda), ','.join(fields or [])))
+
+    def patch_agenda(self, query: Dict, agenda_id: str):
+        body = _check_fields(self._read_body(), store.AGENDA_FIELDS, store.AGENDA_STATUSES)
+        with self.repository.transaction() as agendas:
+            agenda = self._agenda(agendas, agenda_id)
+            self._check_if_match(agenda)
+            store.update_agenda(agendas, agenda_id, **body)
+        self._send(200, agenda, etag=make_etag(agenda_validator(agenda)))
+
+    # -- notes, to-dos & action items ----------------------------------------
+
+    def get_items(self, query: Dict, agenda_id: str, item_type: str):
+        agenda = self._agenda(self.repository.snapshot(), agenda_id)
+        variant = urlsplit(self.path).query
+        etag = make_etag(agenda_validator(agenda), f"{item_type}?{variant}")
+        page, meta = paginate(agenda.get(item_type, []), query)
+        fields = self._fields(query)
+        self._send_conditional(dict(meta, items=[select_fields(i, fields) for i in page]), etag)
+
+    def post_items(self, query: Dict, agenda_id: str, item_type: str):
+        body = _check_fields(self._read_body(), store.ITEM_FIELDS[item_type], store.ACTION_STATUSES)
+        with self.repository.transaction() as agendas:
+            self._agenda(agendas, agenda_id)
+            if item_type == 'notes':
+                _require(body, 'content')
+                item = store.add_note(agendas, agenda_id, body['content'])
+            elif item_type == 'todos':
+                _require(body, 'task')
+                item = store.add_todo(agendas, agenda_id, body['task'],
+                                      body.get('priority', 'medium'), body.get('assignee', ''))
+            else:
+                _require(body, 'action', 'owner', 'due_date')
+                item = store.add_action_item(agendas, agenda_id, body['action'], body['owner'],
+                                             _parse_date(body['due_date'], 'due_date'),
+                                             body.get('priority', 'medium'))
+            extra = {k: v for k, v in body.items() if k in ('completed', 'status')}
+            if extra:
+                store.update_item(agendas, agenda_id, item_type, item['id'], **extra)
+            etag = make_etag(agenda_validator(agendas[agenda_id]))
+        self._send(201, item, etag=etag, location=f"/agendas/{agenda_id}/{item_type}/{item['id']}")
+
+    def get_item(self, query: Dict, agenda_id: str, item_type: str, item_id: str):
+        agenda = self._agenda(self.repository.snapshot(), agenda_id)
+        item = store.find_item({agenda_id: agenda}, agenda_id, item_type, item_id)
+        if item is None:
+            raise ApiError(404, f"Item {item_id} not found")
+        fields = self._fields(query)
+        self._send_conditional(select_fields(item, fields),
+                               make_etag(agenda_validator(agenda), f"{item_type}/{item_id}?{','.join(fields or [])}"))
+
+    def patch_item(self, query: Dict, agenda_id: str, item_type: str, item_id: str):
+        body = _check_fields(self._read_body(), store.ITEM_FIELDS[item_type], store.ACTION_STATUSES)
+        with self.repository.transaction() as agendas:
+            self._check_if_match(self._agenda(agendas, agenda_id))
+            item = store.update_item(agendas, agenda_id, item_type, item_id, **body)
+            if item is None:
+                raise ApiError(404, f"Item {item_id} not found")
+            etag = make_etag(agenda_validator(agendas[agenda_id]))
+        self._send(200, item, etag=etag)
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def make_server(host: str, port: int, data_file: Path) -> ThreadingHTTPServer:
+    """Create (but don't start) an API server bound to host:port"""
+    handler = type('BoundAgendaApiHandler', (AgendaApiHandler,),
+                   {'repository': AgendaRepository(data_file)})
+    return ThreadingHTTPServer((host, port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless JSON API for meeting agendas")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8502, help="Port to listen on (default: 8502)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--data', type=Path, default=store.DATA_FILE, help="Agendas JSON file")
+    source.add_argument('--workspace', dest='data', type=store.workspace_path, metavar='NAME',
+                        help="Serve a named workspace's data file instead")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.data)
+    print(f"Agenda API serving {args.data} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
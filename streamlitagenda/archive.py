@@ -0,0 +1,200 @@
+"""
+Archive - compressed, read-only monthly segments of old completed agendas
+Completed agendas whose meeting and last change are both older than
+ARCHIVE_AFTER are moved out of the data file into gzip-compressed segments
+next to it, one per meeting month:
+
+    agendas_data_archive/2024-03.json.gz   {agenda_id: agenda} of that month
+    agendas_data_archive/index.json        agenda IDs, count and size of each segment
+
+The hot data file, which every session loads and every save rewrites, then
+only holds current agendas. The app never edits a segment: an archive pass
+rewrites a month's segment only to add agendas to it. Segments are opened
+lazily, newest month first, by searches that ask for archived agendas, and
+the few most recently opened are kept decoded in memory.
+
+Archived agendas keep their revision history through trash compaction and
+are included in scheduled backups (see trash.py and backup.py).
+
+    python agenda_cli.py archive --older-than 365 --dry-run
+    python agenda_cli.py archived --search "budget"
+"""
+
+import gzip
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import agenda_store as store
+from instrumentation import span, timed
+
+ARCHIVE_AFTER = timedelta(days=365)     # the app's setting; None keeps every agenda in the hot file
+SEGMENT_CACHE = 4                       # decoded segments kept per process
+COMPRESS_LEVEL = 6
+
+def archive_dir(data_file: Path = None) -> Path:
+    data_file = Path(data_file or store.DATA_FILE)
+    return data_file.with_name(f"{data_file.stem}_archive")
+
+def segment_path(data_file: Path, month: str) -> Path:
+    return archive_dir(data_file) / f"{month}.json.gz"
+
+# ============================================================================
+# SEGMENTS
+# ============================================================================
+
+# Decoded segments by path, least recently opened first
+_segments: 'OrderedDict[Path, tuple]' = OrderedDict()
+
+def read_index(data_file: Path = None) -> Dict[str, Dict]:
+    """Agenda IDs, count and sizes of every segment by month"""
+    try:
+        with open(archive_dir(data_file) / 'index.json', 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def read_segment(path: Path) -> Dict:
+    """One segment's agendas; shared with other callers, so treat it as read-only"""
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _segments.get(path)
+    if cached is None or cached[0] != signature:
+        with span('archive.open_segment'):
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                cached = (signature, json.load(f))
+        _segments[path] = cached
+    _segments.move_to_end(path)
+    while len(_segments) > SEGMENT_CACHE:
+        _segments.popitem(last=False)
+    return cached[1]
+
+def _write_segment(data_file: Path, month: str, agendas: Dict) -> Dict:
+    """Replace a month's segment atomically; returns its index entry"""
+    path = segment_path(data_file, month)
+    raw = json.dumps(agendas, default=str).encode('utf-8')
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(gzip.compress(raw, COMPRESS_LEVEL))
+    os.replace(tmp, path)
+    _segments.pop(path, None)
+    return {'agendas': len(agendas), 'ids': sorted(agendas), 'bytes': path.stat().st_size,
+            'raw_bytes': len(raw), 'updated_at': datetime.now().isoformat()}
+
+def _write_index(data_file: Path, index: Dict) -> None:
+    path = archive_dir(data_file) / 'index.json'
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(dict(sorted(index.items())), f, indent=2)
+    os.replace(tmp, path)
+
+# ============================================================================
+# ARCHIVING
+# ============================================================================
+
+def archivable(agendas: Dict, after: Optional[timedelta], now: datetime = None) -> List[str]:
+    """IDs of completed agendas whose meeting date and last change are older than `after`"""
+    if after is None:
+        return []
+    cutoff = ((now or datetime.now()) - after).isoformat()
+    return [agenda_id for agenda_id, agenda in agendas.items()
+            if agenda.get('status') == 'completed'
+            and (agenda.get('updated_at') or '') < cutoff and '' < (agenda.get('date') or '') < cutoff[:10]]
+
+def move_to_archive(agendas: Dict, agenda_ids: List[str], data_file: Path = None) -> Dict[str, int]:
+    """Move agendas into their month's segments without taking the lock (caller holds it)
+
+    The agendas are removed from `agendas`, which the caller then writes
+    back. Returns how many went into each month.
+    """
+    by_month: Dict[str, Dict] = {}
+    for agenda_id in agenda_ids:
+        agenda = dict(agendas[agenda_id])
+        # Segments outlive templates, so they keep their own copy of any shared content
+        agenda.pop('template_id', None)
+        by_month.setdefault(agenda['date'][:7], {})[agenda_id] = agenda
+    if not by_month:
+        return {}
+
+    archive_dir(data_file).mkdir(exist_ok=True)
+    index = read_index(data_file)
+    for month, moved in by_month.items():
+        path = segment_path(data_file, month)
+        segment = dict(read_segment(path)) if path.exists() else {}
+        segment.update(moved)
+        index[month] = _write_segment(data_file, month, segment)
+    _write_index(data_file, index)
+    for agenda_id in agenda_ids:
+        del agendas[agenda_id]
+    return {month: len(moved) for month, moved in by_month.items()}
+
+@timed('archive.pass')
+def archive_old(data_file: Path, after: Optional[timedelta], now: datetime = None) -> Tuple[Dict, Dict[str, int]]:
+    """Archive every agenda that has aged out; returns the remaining hot agendas and counts per month
+
+    Segments are written before the data file, so a crash in between
+    leaves an agenda in both places rather than in neither.
+    """
+    with store.locked(data_file):
+        agendas = store.read_agendas(data_file)
+        moved = move_to_archive(agendas, archivable(agendas, after, now), data_file)
+        if moved:
+            store.write_agendas(agendas, data_file)
+    return agendas, moved
+
+def load_hot(data_file: Path, after: Optional[timedelta]) -> Dict:
+    """Load the hot agendas, first archiving any that have aged out since the last load
+
+    The check runs on the agendas just read under the shared lock; the
+    exclusive lock is only taken when something is due to be archived.
+    """
+    agendas = store.load_agendas_from_file(data_file)
+    if not archivable(agendas, after):
+        return agendas
+    return archive_old(data_file, after)[0]
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+def months(data_file: Path = None) -> List[str]:
+    """Months that have a segment, newest first"""
+    return sorted((path.name[:7] for path in archive_dir(data_file).glob('*.json.gz')), reverse=True)
+
+def search(data_file: Path, query: Callable[[Dict], List[dict]], limit: Optional[int] = None,
+           exclude: Optional[Dict] = None) -> Tuple[List[dict], int]:
+    """Run `query` over segments newest month first until it has returned `limit` agendas
+
+    Agendas whose ID is in `exclude` (normally the hot agendas, which win if
+    an agenda is in both) are skipped. Returns the matches and how many
+    segments were opened.
+    """
+    matches, opened = [], 0
+    for month in months(data_file):
+        if limit is not None and len(matches) >= limit:
+            break
+        opened += 1
+        found = query(read_segment(segment_path(data_file, month)))
+        matches.extend(agenda for agenda in found if not exclude or agenda['id'] not in exclude)
+    return matches[:limit], opened
+
+def archived_ids(data_file: Path = None) -> Set[str]:
+    """IDs of every archived agenda, from the index where it lists them"""
+    ids = set()
+    for month, entry in read_index(data_file).items():
+        # Indexes written before IDs were recorded only have the segment to go by
+        ids.update(entry['ids'] if 'ids' in entry else read_segment(segment_path(data_file, month)))
+    return ids
+
+def stats(data_file: Path = None) -> Dict[str, int]:
+    """Totals over every segment, from the index alone"""
+    index = read_index(data_file)
+    return {
+        'segments': len(index),
+        'agendas': sum(entry['agendas'] for entry in index.values()),
+        'bytes': sum(entry['bytes'] for entry in index.values()),
+        'raw_bytes': sum(entry['raw_bytes'] for entry in index.values())
+    }
@@ -0,0 +1,256 @@
+"""
+Backup - incremental, deduplicated snapshots of the agenda store
+Snapshots live in a directory next to the data file
+(agendas_data.json -> agendas_data_backups/) as three content-addressed
+layers:
+
+    blobs/<sha256>          decoded attachment and topic-image bytes
+    agendas/<sha256>.json   one agenda with its blobs replaced by references
+    snapshots/<stamp>.json  manifest mapping agenda IDs to agenda objects
+
+An agenda whose updated_at matches the previous manifest is carried over by
+reference without being serialised or hashed, and objects already on disk
+are never rewritten, so a backup costs time and space in proportion to what
+changed since the last one. Rotation keeps the newest snapshots plus one per
+day and then deletes objects no kept manifest refers to.
+
+Agendas in the archive segments (see archive.py) are backed up too. A
+restore writes them back into the data file, and the next load archives
+them again.
+
+    python agenda_cli.py backup
+    python agenda_cli.py backups
+    python agenda_cli.py restore --at 2026-10-01T09:00 --to restored.json
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import agenda_store as store
+import archive
+
+BACKUP_INTERVAL = 3600          # seconds between scheduled backups
+KEEP_LAST = 24                  # newest snapshots always kept
+KEEP_DAILY = 14                 # plus the newest snapshot of each of this many days
+
+def backup_dir(data_file: Path = None) -> Path:
+    data_file = Path(data_file or store.DATA_FILE)
+    return data_file.with_name(f"{data_file.stem}_backups")
+
+# ============================================================================
+# OBJECTS
+# ============================================================================
+
+def _digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+def _put(path: Path, payload: bytes) -> int:
+    """Write an object once; returns the bytes written (0 if it already existed)"""
+    if path.exists():
+        return 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp, path)
+    return len(payload)
+
+def _files(agenda: dict) -> List[dict]:
+    """Every attachment-like dict of an agenda that carries base64 data"""
+    files = [a for a in agenda.get('attachments') or [] if isinstance(a, dict) and 'data' in a]
+    if isinstance(agenda.get('topic_image'), dict) and 'data' in agenda['topic_image']:
+        files.append(agenda['topic_image'])
+    return files
+
+def _strip(agenda: dict) -> Tuple[dict, Dict[str, bytes]]:
+    """Copy of an agenda with file data swapped for blob digests, plus the blobs"""
+    blobs = {}
+    stripped = json.loads(json.dumps(agenda, default=str))
+    for file in _files(stripped):
+        payload = base64.b64decode(file.pop('data'))
+        file['blob'] = _digest(payload)
+        blobs[file['blob']] = payload
+    return stripped, blobs
+
+def _inflate(root: Path, agenda: dict) -> dict:
+    """Put blob contents back into a stored agenda"""
+    for file in agenda.get('attachments') or []:
+        if isinstance(file, dict) and 'blob' in file:
+            file['data'] = base64.b64encode((root / 'blobs' / file.pop('blob')).read_bytes()).decode('utf-8')
+    image = agenda.get('topic_image')
+    if isinstance(image, dict) and 'blob' in image:
+        image['data'] = base64.b64encode((root / 'blobs' / image.pop('blob')).read_bytes()).decode('utf-8')
+    return agenda
+
+# ============================================================================
+# SNAPSHOTS
+# ============================================================================
+
+def list_snapshots(data_file: Path = None) -> List[Dict]:
+    """Manifests of every snapshot, oldest first"""
+    snapshots = sorted((backup_dir(data_file) / 'snapshots').glob('*.json'))
+    return [dict(json.loads(path.read_text()), name=path.stem) for path in snapshots]
+
+def _back_up_agenda(root: Path, agenda: dict, last: Optional[Dict]) -> Tuple[Dict, int, bool]:
+    """Manifest entry for one agenda, the bytes written and whether its object changed"""
+    if last and agenda.get('updated_at') and last['updated_at'] == agenda['updated_at']:
+        return last, 0, False
+    stripped, blobs = _strip(agenda)
+    written = sum(_put(root / 'blobs' / digest, payload) for digest, payload in blobs.items())
+    body = json.dumps(stripped, sort_keys=True).encode('utf-8')
+    digest = _digest(body)
+    written += _put(root / 'agendas' / f"{digest}.json", body)
+    entry = {'updated_at': agenda.get('updated_at'), 'object': digest, 'blobs': sorted(blobs)}
+    return entry, written, last is None or last['object'] != digest
+
+def take_snapshot(data_file: Path = None, now: datetime = None) -> Optional[Dict]:
+    """Back up whatever changed since the last snapshot
+
+    Archived agendas are included and tagged with their segment's month. A
+    segment whose index stamp matches the last snapshot is carried over
+    without being opened. Returns the new manifest, or None if nothing changed.
+    """
+    root = backup_dir(data_file)
+    with store.locked(root):
+        snapshots = sorted((root / 'snapshots').glob('*.json'))
+        latest = json.loads(snapshots[-1].read_text()) if snapshots else {}
+        previous = latest.get('agendas', {})
+
+        entries, written, changed = {}, 0, 0
+        with store.locked(data_file, exclusive=False):
+            agendas = store.read_agendas(data_file)
+            segments = {month: entry['updated_at'] for month, entry in archive.read_index(data_file).items()}
+            for month, stamp in segments.items():
+                if latest.get('archive', {}).get(month) == stamp:
+                    entries.update((agenda_id, entry) for agenda_id, entry in previous.items()
+                                   if entry.get('month') == month)
+                    continue
+                for agenda_id, agenda in archive.read_segment(archive.segment_path(data_file, month)).items():
+                    entry, size, moved = _back_up_agenda(root, agenda, previous.get(agenda_id))
+                    entries[agenda_id] = dict(entry, month=month)
+                    written += size
+                    changed += moved
+        # A hot agenda wins over an archived copy of itself
+        for agenda_id, agenda in agendas.items():
+            entry, size, moved = _back_up_agenda(root, agenda, previous.get(agenda_id))
+            entries[agenda_id] = {key: value for key, value in entry.items() if key != 'month'}
+            written += size
+            changed += moved
+        if not changed and entries.keys() == previous.keys() and segments == latest.get('archive', {}):
+            return None
+
+        now = now or datetime.now()
+        name = now.strftime('%Y%m%dT%H%M%S%f')
+        manifest = {
+            'taken_at': now.isoformat(),
+            'agendas': entries,
+            'archive': segments,
+            'changed': changed,
+            'removed': len(previous.keys() - entries.keys()),
+            'bytes_written': written
+        }
+        _put(root / 'snapshots' / f"{name}.json", json.dumps(manifest).encode('utf-8'))
+        return dict(manifest, name=name)
+
+def find_snapshot(data_file: Path = None, at: datetime = None) -> Optional[Dict]:
+    """The newest snapshot taken at or before `at` (the newest overall by default)"""
+    snapshots = list_snapshots(data_file)
+    if at is not None:
+        snapshots = [s for s in snapshots if s['taken_at'] <= at.isoformat()]
+    return snapshots[-1] if snapshots else None
+
+def load_snapshot(manifest: Dict, data_file: Path = None) -> Dict:
+    """Rebuild the full agendas dict a snapshot describes"""
+    root = backup_dir(data_file)
+    return {agenda_id: _inflate(root, json.loads((root / 'agendas' / f"{entry['object']}.json").read_text()))
+            for agenda_id, entry in manifest['agendas'].items()}
+
+def restore_snapshot(manifest: Dict, data_file: Path = None, target: Path = None) -> int:
+    """Write a snapshot's agendas to `target` (the live data file by default); returns the count"""
+    agendas = load_snapshot(manifest, data_file)
+    store.save_agendas_to_file(agendas, target or data_file)
+    return len(agendas)
+
+# ============================================================================
+# ROTATION
+# ============================================================================
+
+def rotate(data_file: Path = None, keep_last: int = KEEP_LAST, keep_daily: int = KEEP_DAILY) -> Dict[str, int]:
+    """Drop snapshots outside the retention policy and the objects only they used"""
+    root = backup_dir(data_file)
+    with store.locked(root):
+        paths = sorted((root / 'snapshots').glob('*.json'))
+        newest_per_day = {path.stem[:8]: path for path in paths}
+        keep = set(paths[-keep_last:] if keep_last else [])
+        if keep_daily:
+            keep.update(newest_per_day[day] for day in sorted(newest_per_day)[-keep_daily:])
+
+        for path in paths:
+            if path not in keep:
+                path.unlink()
+        objects, blobs = set(), set()
+        for path in keep:
+            for entry in json.loads(path.read_text())['agendas'].values():
+                objects.add(f"{entry['object']}.json")
+                blobs.update(entry['blobs'])
+
+        freed = 0
+        for folder, referenced in (('agendas', objects), ('blobs', blobs)):
+            for path in (root / folder).glob('*'):
+                if path.name not in referenced:
+                    freed += path.stat().st_size
+                    path.unlink()
+        return {'snapshots': len(paths) - len(keep), 'bytes_freed': freed}
+
+# ============================================================================
+# SCHEDULING
+# ============================================================================
+
+class BackupScheduler:
+    """Background thread that takes a snapshot and rotates on a fixed interval"""
+
+    def __init__(self, data_file: Path = None, interval: float = BACKUP_INTERVAL,
+                 keep_last: int = KEEP_LAST, keep_daily: int = KEEP_DAILY):
+        self.data_file = Path(data_file or store.DATA_FILE)
+        self.interval = interval
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_run: Optional[datetime] = None
+        self.last_snapshot: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+
+    def start(self) -> None:
+        """Start the background thread if it is not already running"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="agenda-backup", daemon=True)
+            self._thread.start()
+
+    def trigger(self) -> None:
+        """Take a backup now instead of waiting for the interval"""
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.backup_once()
+            except Exception as e:
+                self.last_error = f"Backup failed: {e}"
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def backup_once(self) -> Optional[Dict]:
+        """Snapshot and rotate; returns the new manifest, or None if nothing changed"""
+        snapshot = take_snapshot(self.data_file)
+        rotate(self.data_file, self.keep_last, self.keep_daily)
+        self.last_run = datetime.now()
+        self.last_snapshot = snapshot or self.last_snapshot
+        self.last_error = None
+        return snapshot
@@ -0,0 +1,172 @@
+"""
+Instrumentation - lightweight timing spans, per-rerun breakdowns and metrics export
+Hot paths are wrapped in named spans (`with span('storage.save'):` or
+`@timed('filter')`). Each observation costs two perf_counter() calls and a
+dict update. Spans feed process-wide histograms and, when they run inside a
+rerun on the script thread, that rerun's breakdown. At the end of a rerun the
+histograms are written to a local file at most every EXPORT_INTERVAL
+seconds, as Prometheus text (metrics.prom) or JSON (any *.json path), so
+latency can be watched without attaching a profiler.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WINDOW = 1000                   # recent observations per span kept for rolling quantiles
+EXPORT_INTERVAL = 15            # seconds between metrics file writes
+EXPORT_PATH = Path('metrics.prom')
+
+class Metrics:
+    """Process-wide span histograms plus the breakdown of the rerun in progress on each thread"""
+
+    def __init__(self, buckets: tuple = BUCKETS, window: int = WINDOW,
+                 export_path: Path = EXPORT_PATH, export_interval: float = EXPORT_INTERVAL):
+        self.buckets = buckets
+        self.window = window
+        self.export_path = Path(export_path)
+        self.export_interval = export_interval
+        self._lock = threading.Lock()
+        self._series: Dict[str, dict] = {}
+        self._local = threading.local()
+        self._last_export = 0.0
+
+    # -- recording -------------------------------------------------------------
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = {'counts': [0] * len(self.buckets), 'count': 0, 'sum': 0.0,
+                                               'recent': deque(maxlen=self.window)}
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series['counts'][i] += 1
+                    break
+            series['count'] += 1
+            series['sum'] += seconds
+            series['recent'].append(seconds)
+        breakdown = getattr(self._local, 'breakdown', None)
+        if breakdown is not None:
+            calls, total = breakdown.get(name, (0, 0.0))
+            breakdown[name] = (calls + 1, total + seconds)
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the block under `name`"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def timed(self, name: str):
+        """Decorator form of span()"""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    @property
+    def in_rerun(self) -> bool:
+        """Whether a rerun is being collected on this thread"""
+        return getattr(self._local, 'breakdown', None) is not None
+
+    @contextmanager
+    def rerun(self, name: str = 'rerun'):
+        """Collect the spans of one script run (or fragment rerun) into a breakdown
+
+        Yields the breakdown dict {span: (calls, seconds)}; it is complete,
+        including the run's own total under `name`, once the block exits.
+        A rerun nested in another (a fragment called by the full run) is
+        timed as a plain span.
+        """
+        if self.in_rerun:
+            with self.span(name):
+                yield self._local.breakdown
+            return
+        breakdown = self._local.breakdown = {}
+        started = time.perf_counter()
+        try:
+            yield breakdown
+        finally:
+            self.observe(name, time.perf_counter() - started)
+            self._local.breakdown = None
+            self.maybe_export()
+
+    # -- reporting -------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Count, total and rolling quantiles (in ms) of every span"""
+        with self._lock:
+            series = {name: (s['count'], s['sum'], sorted(s['recent'])) for name, s in self._series.items()}
+        report = {}
+        for name, (count, total, recent) in sorted(series.items()):
+            report[name] = {
+                'count': count,
+                'total_ms': round(total * 1000, 2),
+                'p50_ms': round(recent[len(recent) // 2] * 1000, 2),
+                'p95_ms': round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 2),
+                'max_ms': round(recent[-1] * 1000, 2)
+            }
+        return report
+
+    def prometheus(self) -> str:
+        """Histograms in the Prometheus text exposition format"""
+        lines = ['# HELP agenda_span_seconds Time spent in instrumented spans',
+                 '# TYPE agenda_span_seconds histogram']
+        with self._lock:
+            for name, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series['counts']):
+                    cumulative += count
+                    lines.append(f'agenda_span_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'agenda_span_seconds_bucket{{span="{name}",le="+Inf"}} {series["count"]}')
+                lines.append(f'agenda_span_seconds_sum{{span="{name}"}} {series["sum"]:.6f}')
+                lines.append(f'agenda_span_seconds_count{{span="{name}"}} {series["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: Optional[Path] = None) -> Path:
+        """Write the metrics file atomically; JSON for *.json paths, Prometheus text otherwise"""
+        path = Path(path or self.export_path)
+        if path.suffix == '.json':
+            body = json.dumps({'exported_at': time.time(), 'spans': self.snapshot()}, indent=2)
+        else:
+            body = self.prometheus()
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(body)
+        os.replace(tmp, path)
+        return path
+
+    def maybe_export(self) -> None:
+        now = time.monotonic()
+        if now - self._last_export < self.export_interval:
+            return
+        self._last_export = now
+        try:
+            self.export()
+        except OSError:
+            pass  # metrics must never break a rerun
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+METRICS = Metrics()
+span = METRICS.span
+timed = METRICS.timed
+
+def breakdown_rows(breakdown: Dict[str, tuple]) -> List[Dict]:
+    """A rerun breakdown as table rows, slowest first"""
+    return [{'Span': name, 'Calls': calls, 'ms': round(seconds * 1000, 2)}
+            for name, (calls, seconds) in sorted(breakdown.items(), key=lambda kv: -kv[1][1])]
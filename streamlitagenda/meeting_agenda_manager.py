@@ -7,7 +7,6 @@ with notes, to-dos, action items, and email distribution capabilities.
 import streamlit as st
 import json
 import base64
-import uuid
 from datetime import datetime, date, time
 import calendar
 from typing import Dict, List, Optional
@@ -18,30 +17,155 @@ from email.mime.base import MIMEBase
 from email import encoders
 import io
 import re
+import functools
+import math
 from pathlib import Path
+import pandas as pd
+
+import agenda_store as store
+from schedule_index import ScheduleIndex
+from action_index import ActionIndex
+from operation_log import OperationLog, item_position
+from revision_history import RevisionHistory, diff as diff_revisions, history_for
+import trash
+import backup
+import memory_usage
+import analytics
+import archive
+from reminders import ReminderScheduler
+from write_behind import WriteBehind
+from instrumentation import METRICS, breakdown_rows, span, timed
+from profiling import DEFAULT_RUNS, ProfileCapture
+from static_assets import build_stylesheet, stylesheet_tag
 
 # ============================================================================
 # PERSISTENT STORAGE CONFIGURATION
 # ============================================================================
-DATA_FILE = Path('agendas_data.json')
+# Agenda fields that determine its slot in the schedule index
+SCHEDULE_FIELDS = {'date', 'time', 'duration', 'presenter'}
+
+ITEM_LABELS = {'notes': 'note', 'todos': 'to-do', 'action_items': 'action item'}
+
+# Agenda fields grouped for memory accounting; anything else counts as 'fields'
+MEMORY_CATEGORIES = {'attachments': 'attachments', 'topic_image': 'images', 'notes': 'notes', 'todos': 'to-dos',
+                     'action_items': 'action items', 'urls': 'links'}
+
+# Session keys derived from the workspace's agendas, dropped when the session switches workspace
+WORKSPACE_STATE = ('agendas', 'schedule_index', 'action_index', 'operation_log', 'writer', 'analytics_cache',
+                   'memory_accountant', 'payload_cache', 'template_choice')
+
+def data_file() -> Path:
+    """Data file of this session's workspace, which starts as the one named by ?workspace= if it exists"""
+    if 'workspace' not in st.session_state:
+        requested = st.query_params.get('workspace', store.DEFAULT_WORKSPACE)
+        st.session_state.workspace = (requested if requested in store.list_workspaces()
+                                      else store.DEFAULT_WORKSPACE)
+    return store.workspace_path(st.session_state.workspace)
+
+# Archived agendas an "include archived" search shows at most
+ARCHIVE_SEARCH_LIMIT = 50
 
 def load_agendas_from_file() -> Dict:
-    """Load all agendas from persistent storage"""
-    if DATA_FILE.exists():
-        try:
-            with open(DATA_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    """Load the hot agendas of this session's workspace, archiving any that have aged out"""
+    return archive.load_hot(data_file(), archive.ARCHIVE_AFTER)
+
+def get_writer() -> WriteBehind:
+    """This session's write-behind layer over the data file"""
+    if 'writer' not in st.session_state:
+        st.session_state.writer = WriteBehind(data_file())
+    return st.session_state.writer
 
 def save_agendas_to_file(agendas: Dict) -> None:
-    """Save all agendas to persistent storage"""
-    try:
-        with open(DATA_FILE, 'w') as f:
-            json.dump(agendas, f, indent=2, default=str)
-    except IOError as e:
-        st.error(f"Error saving data: {e}")
+    """Save all agendas to persistent storage once the current run finishes"""
+    get_writer().save(agendas)
+
+def coalesce_writes(func):
+    """Run a script or fragment body as one write batch"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            with get_writer().batch():
+                return func(*args, **kwargs)
+        except IOError as e:
+            st.error(f"Error saving data: {e}")
+    return wrapper
+
+def measure_rerun(func):
+    """Time a script or fragment run and keep its span breakdown for the diagnostics panel"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        name = f"rerun.{func.__name__}"
+        nested = METRICS.in_rerun
+        breakdown = {}
+        try:
+            with METRICS.rerun(name) as breakdown:
+                return func(*args, **kwargs)
+        finally:
+            if not nested:
+                st.session_state.last_rerun = (name, breakdown)
+    return wrapper
+
+def profile_rerun(func):
+    """Run the wrapped script under cProfile while this session has a capture armed"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        capture = st.session_state.get('profile_capture')
+        if capture is None or not capture.active:
+            return func(*args, **kwargs)
+        with capture.record(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+def get_payload_cache() -> memory_usage.PayloadCache:
+    """This session's cache of decoded attachment and image payloads"""
+    if 'payload_cache' not in st.session_state:
+        st.session_state.payload_cache = memory_usage.PayloadCache()
+    return st.session_state.payload_cache
+
+def measure_memory() -> Dict:
+    """Deep size of this session's state, split by key, agenda and field category"""
+    if 'memory_accountant' not in st.session_state:
+        st.session_state.memory_accountant = memory_usage.MemoryAccountant(MEMORY_CATEGORIES, 'updated_at')
+    state = {key: st.session_state[key] for key in st.session_state.keys()}
+    return st.session_state.memory_accountant.measure(st.session_state.agendas, state, 'agendas')
+
+def check_memory_budget() -> None:
+    """Every MEASURE_INTERVAL, free decoded payloads or warn if this session is over MEMORY_BUDGET_MB"""
+    if memory_usage.MEMORY_BUDGET_MB is None:
+        return
+    accountant = st.session_state.get('memory_accountant')
+    report = measure_memory() if accountant is None or accountant.due() else accountant.last_report
+    excess = memory_usage.over_budget(report)
+    if excess and memory_usage.BUDGET_ACTION == 'evict' and get_payload_cache().evict(excess):
+        excess = memory_usage.over_budget(measure_memory())
+    if excess:
+        st.sidebar.warning(f"This session holds {report['total'] / 1e6:.1f} MB, "
+                           f"over the {memory_usage.MEMORY_BUDGET_MB} MB memory budget")
+
+def get_revision_history() -> RevisionHistory:
+    """Revision history kept alongside the data file"""
+    return history_for(data_file())
+
+@st.cache_resource
+def get_compactor(path: Path) -> trash.Compactor:
+    """Process-wide background compaction of a workspace's trash and revision history"""
+    compactor = trash.Compactor(path)
+    compactor.start()
+    return compactor
+
+@st.cache_resource
+def get_backup_scheduler(path: Path) -> backup.BackupScheduler:
+    """Process-wide scheduled incremental backups of a workspace's data file"""
+    scheduler = backup.BackupScheduler(path)
+    scheduler.start()
+    return scheduler
+
+@st.cache_resource
+def get_reminder_scheduler(path: Path) -> ReminderScheduler:
+    """Process-wide reminder scheduler shared by every session in a workspace"""
+    scheduler = ReminderScheduler()
+    scheduler.rebuild(store.load_agendas_from_file(path))
+    return scheduler
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -56,206 +180,16 @@ st.set_page_config(
 # ============================================================================
 # CUSTOM CSS STYLING
 # ============================================================================
-st.markdown("""
-<style>
-    /* Import fonts */
-    @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=Space+Mono:wght@400;700&display=swap');
-    
-    /* Root variables */
-    :root {
-        --primary: #2563eb;
-        --primary-dark: #1d4ed8;
-        --secondary: #0891b2;
-        --success: #059669;
-        --warning: #d97706;
-        --danger: #dc2626;
-        --dark: #1e293b;
-        --light: #f8fafc;
-        --border: #e2e8f0;
-        --shadow: 0 4px 6px -1px rgb(0 0 0 / 0.1);
-    }
-    
-    /* Global styling */
-    .stApp {
-        font-family: 'DM Sans', sans-serif;
-        background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 50%, #f0fdf4 100%);
-    }
-    
-    /* Headers */
-    h1, h2, h3 {
-        font-family: 'DM Sans', sans-serif;
-        font-weight: 700;
-        color: var(--dark);
-    }
-    
-    /* Main title */
-    .main-title {
-        background: linear-gradient(135deg, #1e40af, #0891b2);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-size: 2.5rem;
-        font-weight: 700;
-        text-align: center;
-        padding: 1rem 0;
-        margin-bottom: 1rem;
-    }
-    
-    /* Cards */
-    .agenda-card {
-        background: white;
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        border: 1px solid var(--border);
-        transition: all 0.3s ease;
-    }
-    
-    .agenda-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 30px rgba(0,0,0,0.12);
-    }
-    
-    /* Status badges */
-    .badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        border-radius: 9999px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    .badge-primary { background: #dbeafe; color: #1e40af; }
-    .badge-success { background: #d1fae5; color: #065f46; }
-    .badge-warning { background: #fef3c7; color: #92400e; }
-    .badge-danger { background: #fee2e2; color: #991b1b; }
-    
-    /* Section headers */
-    .section-header {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        font-size: 1.25rem;
-        font-weight: 600;
-        color: var(--dark);
-        margin: 1.5rem 0 1rem 0;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid var(--primary);
-    }
-    
-    /* Item lists */
-    .item-card {
-        background: #f8fafc;
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        margin: 0.5rem 0;
-        border-left: 3px solid var(--primary);
-    }
-    
-    .item-card.completed {
-        border-left-color: var(--success);
-        opacity: 0.7;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.2s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-1px);
-    }
-    
-    /* Form inputs */
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div > select {
-        border-radius: 8px;
-        border: 1px solid var(--border);
-    }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background: white;
-    }
-    
-    /* Expanders */
-    .streamlit-expanderHeader {
-        font-weight: 600;
-        font-size: 1rem;
-    }
-    
-    /* Tables */
-    .dataframe {
-        border-radius: 8px;
-        overflow: hidden;
-    }
-    
-    /* Info boxes */
-    .info-box {
-        background: linear-gradient(135deg, #eff6ff, #f0fdf4);
-        border-radius: 12px;
-        padding: 1rem;
-        border: 1px solid #bfdbfe;
-        margin: 0.5rem 0;
-    }
-    
-    /* Attachment display */
-    .attachment-item {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        background: #f1f5f9;
-        padding: 0.5rem 1rem;
-        border-radius: 8px;
-        margin: 0.25rem;
-        font-size: 0.875rem;
-    }
-    
-    /* Topic image */
-    .topic-image {
-        border-radius: 12px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        max-width: 150px;
-        max-height: 150px;
-        object-fit: cover;
-    }
-    
-    /* URL link styling */
-    .url-link {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.25rem;
-        color: var(--primary);
-        text-decoration: none;
-        font-weight: 500;
-    }
-    
-    .url-link:hover {
-        text-decoration: underline;
-    }
-    
-    /* Priority colors */
-    .priority-high { color: var(--danger); }
-    .priority-medium { color: var(--warning); }
-    .priority-low { color: var(--success); }
-    
-    /* Animation */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .animate-in {
-        animation: fadeIn 0.3s ease-out;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def get_stylesheet():
+    """Build the minified, content-hashed stylesheet once per server process"""
+    return build_stylesheet()
+
+stylesheet_name, stylesheet_css = get_stylesheet()
+st.markdown(
+    stylesheet_tag(stylesheet_name, stylesheet_css, st.get_option('server.enableStaticServing')),
+    unsafe_allow_html=True
+)
 
 # ============================================================================
 # DATA STRUCTURES & INITIALIZATION
@@ -266,6 +200,19 @@ def init_session_state():
     if 'agendas' not in st.session_state:
         # Load agendas from persistent storage
         st.session_state.agendas = load_agendas_from_file()
+        get_writer().track(st.session_state.agendas)
+    
+    if 'schedule_index' not in st.session_state:
+        st.session_state.schedule_index = ScheduleIndex.from_agendas(st.session_state.agendas)
+    
+    if 'action_index' not in st.session_state:
+        st.session_state.action_index = ActionIndex.from_agendas(st.session_state.agendas)
+    
+    if 'operation_log' not in st.session_state:
+        st.session_state.operation_log = OperationLog()
+    
+    get_compactor(data_file())
+    get_backup_scheduler(data_file())
     
     if 'current_view' not in st.session_state:
         st.session_state.current_view = 'list'
@@ -282,32 +229,22 @@ def init_session_state():
             'smtp_port': 587,
             'sender_email': '',
             'sender_password': '',
-            'distribution_list': []
+            'distribution_list': [],
+            'reminders_enabled': False,
+            'reminder_lead_days': 1
         }
 
 def create_agenda(topic: str, presenter: str, meeting_date: date, meeting_time: time,
                   duration: int, topic_image: Optional[dict] = None,
-                  urls: List[dict] = None, attachments: List[dict] = None) -> str:
+                  urls: List[dict] = None, attachments: List[dict] = None,
+                  template_id: Optional[str] = None) -> str:
     """Create a new meeting agenda and return its ID"""
-    agenda_id = str(uuid.uuid4())[:8]
-    
-    st.session_state.agendas[agenda_id] = {
-        'id': agenda_id,
-        'topic': topic,
-        'presenter': presenter,
-        'date': meeting_date.isoformat(),
-        'time': meeting_time.isoformat(),
-        'duration': duration,
-        'topic_image': topic_image,
-        'urls': urls or [],
-        'attachments': attachments or [],
-        'notes': [],
-        'todos': [],
-        'action_items': [],
-        'created_at': datetime.now().isoformat(),
-        'updated_at': datetime.now().isoformat(),
-        'status': 'scheduled'
-    }
+    agenda_id = store.create_agenda(
+        st.session_state.agendas, topic, presenter, meeting_date, meeting_time,
+        duration, topic_image, urls, attachments, template_id
+    )
+    st.session_state.schedule_index.add(st.session_state.agendas[agenda_id])
+    record_operation(f"Create '{topic}'", [('remove_record', agenda_id)])
     
     # Save to persistent storage
     save_agendas_to_file(st.session_state.agendas)
@@ -316,95 +253,342 @@ def create_agenda(topic: str, presenter: str, meeting_date: date, meeting_time:
 
 def update_agenda(agenda_id: str, **kwargs):
     """Update an existing agenda with provided fields"""
-    if agenda_id in st.session_state.agendas:
-        for key, value in kwargs.items():
-            if key == 'date' and isinstance(value, date):
-                value = value.isoformat()
-            elif key == 'time' and isinstance(value, time):
-                value = value.isoformat()
-            st.session_state.agendas[agenda_id][key] = value
-        st.session_state.agendas[agenda_id]['updated_at'] = datetime.now().isoformat()
+    agenda = st.session_state.agendas.get(agenda_id)
+    previous = {key: agenda.get(key) for key in [*kwargs, 'updated_at']} if agenda else {}
+    if store.update_agenda(st.session_state.agendas, agenda_id, **kwargs):
+        record_operation(f"Edit '{agenda['topic']}'", [('set_fields', agenda_id, previous)])
+        if SCHEDULE_FIELDS.intersection(kwargs):
+            st.session_state.schedule_index.add(st.session_state.agendas[agenda_id])
         # Save to persistent storage
         save_agendas_to_file(st.session_state.agendas)
 
+def find_schedule_conflicts(meeting_date: date, meeting_time: time, duration: int,
+                            presenter: str, agenda_id: Optional[str] = None) -> List[dict]:
+    """Return agendas whose slot overlaps the given one, flagging presenter double-bookings"""
+    return st.session_state.schedule_index.conflicts_for({
+        'id': agenda_id,
+        'presenter': presenter,
+        'date': meeting_date.isoformat(),
+        'time': meeting_time.isoformat(),
+        'duration': duration
+    })
+
+def describe_conflict(conflict: dict) -> str:
+    """Format a schedule conflict for display"""
+    other = st.session_state.agendas.get(conflict['agenda_id'], {})
+    label = "👤 Presenter double-booked" if conflict['type'] == 'double_booked' else "⏰ Overlaps"
+    return (f"{label}: **{other.get('topic', conflict['agenda_id'])}** ({other.get('presenter', '')}) "
+            f"{conflict['start'].strftime('%Y-%m-%d %H:%M')}–{conflict['end'].strftime('%H:%M')}")
+
 def delete_agenda(agenda_id: str):
     """Delete an agenda by ID"""
-    if agenda_id in st.session_state.agendas:
-        del st.session_state.agendas[agenda_id]
+    agenda = store.delete_agenda(st.session_state.agendas, agenda_id)
+    if agenda is not None:
+        record_operation(f"Delete '{agenda['topic']}'", [('insert_record', agenda_id, agenda)])
+        get_reminder_scheduler(data_file()).cancel_agenda(agenda)
+        st.session_state.schedule_index.remove(agenda_id)
+        st.session_state.action_index.remove_agenda(agenda_id)
         # Save to file
         save_agendas_to_file(st.session_state.agendas)
 
 def add_note(agenda_id: str, content: str):
     """Add a note to an agenda"""
-    if agenda_id in st.session_state.agendas:
-        note = {
-            'id': str(uuid.uuid4())[:8],
-            'content': content,
-            'created_at': datetime.now().isoformat()
-        }
-        st.session_state.agendas[agenda_id]['notes'].append(note)
+    stamp = _stamp(agenda_id)
+    note = store.add_note(st.session_state.agendas, agenda_id, content)
+    if note:
+        record_operation("Add note", [stamp, ('remove_item', agenda_id, 'notes', note['id'])])
         # Save to persistent storage
         save_agendas_to_file(st.session_state.agendas)
 
 def add_todo(agenda_id: str, task: str, priority: str = 'medium', assignee: str = ''):
     """Add a to-do item to an agenda"""
-    if agenda_id in st.session_state.agendas:
-        todo = {
-            'id': str(uuid.uuid4())[:8],
-            'task': task,
-            'priority': priority,
-            'assignee': assignee,
-            'completed': False,
-            'created_at': datetime.now().isoformat()
-        }
-        st.session_state.agendas[agenda_id]['todos'].append(todo)
+    stamp = _stamp(agenda_id)
+    todo = store.add_todo(st.session_state.agendas, agenda_id, task, priority, assignee)
+    if todo:
+        record_operation("Add to-do", [stamp, ('remove_item', agenda_id, 'todos', todo['id'])])
         # Save to persistent storage
         save_agendas_to_file(st.session_state.agendas)
 
 def add_action_item(agenda_id: str, action: str, owner: str, due_date: date, priority: str = 'medium'):
     """Add an action item to an agenda"""
-    if agenda_id in st.session_state.agendas:
-        action_item = {
-            'id': str(uuid.uuid4())[:8],
-            'action': action,
-            'owner': owner,
-            'due_date': due_date.isoformat(),
-            'priority': priority,
-            'status': 'pending',
-            'created_at': datetime.now().isoformat()
-        }
-        st.session_state.agendas[agenda_id]['action_items'].append(action_item)
+    stamp = _stamp(agenda_id)
+    action_item = store.add_action_item(st.session_state.agendas, agenda_id, action, owner, due_date, priority)
+    if action_item:
+        record_operation("Add action item", [stamp, ('remove_item', agenda_id, 'action_items', action_item['id'])])
+        st.session_state.action_index.add(agenda_id, action_item)
+        get_reminder_scheduler(data_file()).schedule(st.session_state.agendas[agenda_id], action_item)
         # Save to persistent storage
         save_agendas_to_file(st.session_state.agendas)
 
 def toggle_todo(agenda_id: str, todo_id: str):
     """Toggle a to-do item's completion status"""
-    if agenda_id in st.session_state.agendas:
-        for todo in st.session_state.agendas[agenda_id]['todos']:
-            if todo['id'] == todo_id:
-                todo['completed'] = not todo['completed']
-                # Save to persistent storage
-                save_agendas_to_file(st.session_state.agendas)
-                break
+    stamp = _stamp(agenda_id)
+    todo = store.toggle_todo(st.session_state.agendas, agenda_id, todo_id)
+    if todo:
+        record_operation("Toggle to-do", [
+            stamp, ('set_item_fields', agenda_id, 'todos', todo_id, {'completed': not todo['completed']})
+        ])
+        # Save to persistent storage
+        save_agendas_to_file(st.session_state.agendas)
 
 def update_action_status(agenda_id: str, action_id: str, status: str):
     """Update an action item's status"""
-    if agenda_id in st.session_state.agendas:
-        for action in st.session_state.agendas[agenda_id]['action_items']:
-            if action['id'] == action_id:
-                action['status'] = status
-                # Save to persistent storage
-                save_agendas_to_file(st.session_state.agendas)
-                break
+    stamp = _stamp(agenda_id)
+    previous = store.find_item(st.session_state.agendas, agenda_id, 'action_items', action_id)
+    # completed_at goes back too, so undoing a completion doesn't leave it counted as closed
+    previous_fields = {'status': previous['status'], 'completed_at': previous.get('completed_at')} if previous else {}
+    action = store.update_action_status(st.session_state.agendas, agenda_id, action_id, status)
+    if action:
+        record_operation("Change action status", [
+            stamp, ('set_item_fields', agenda_id, 'action_items', action_id, previous_fields)
+        ])
+        st.session_state.action_index.set_status(action_id, status)
+        get_reminder_scheduler(data_file()).schedule(st.session_state.agendas[agenda_id], action)
+        # Save to persistent storage
+        save_agendas_to_file(st.session_state.agendas)
 
 def delete_item(agenda_id: str, item_type: str, item_id: str):
     """Delete a note, todo, or action item"""
-    if agenda_id in st.session_state.agendas:
-        items = st.session_state.agendas[agenda_id][item_type]
-        st.session_state.agendas[agenda_id][item_type] = [i for i in items if i['id'] != item_id]
+    stamp = _stamp(agenda_id)
+    position = item_position(st.session_state.agendas, agenda_id, item_type, item_id)
+    item = store.delete_item(st.session_state.agendas, agenda_id, item_type, item_id)
+    if item:
+        record_operation(f"Delete {ITEM_LABELS[item_type]}", [
+            stamp, ('insert_item', agenda_id, item_type, position, item)
+        ])
+        if item_type == 'action_items':
+            st.session_state.action_index.remove(item_id)
+            get_reminder_scheduler(data_file()).cancel(item_id)
         # Save to persistent storage
         save_agendas_to_file(st.session_state.agendas)
 
+# ============================================================================
+# WORKSPACES
+# ============================================================================
+# A session works in one workspace at a time and loads only that workspace's
+# shard (see agenda_store.workspace_path). Views across workspaces read the
+# other shards through agenda_store.fan_out and never touch session state.
+
+def switch_workspace(name: str) -> None:
+    """Flush this session's pending writes and start over on another workspace's agendas"""
+    if name == st.session_state.get('workspace'):
+        return
+    writer = st.session_state.get('writer')
+    if writer is not None:
+        writer.flush()
+    for key in (*WORKSPACE_STATE, 'workspace_select'):
+        st.session_state.pop(key, None)
+    st.session_state.workspace = name
+    st.session_state.current_view = 'list'
+    st.session_state.selected_agenda_id = None
+    st.session_state.edit_mode = False
+    st.query_params['workspace'] = name
+
+def on_workspace_selected() -> None:
+    try:
+        switch_workspace(st.session_state.workspace_select)
+    except IOError as e:
+        st.session_state.workspace_select = st.session_state.workspace
+        st.error(f"Error saving data: {e}")
+
+def search_workspaces(search: str) -> List[dict]:
+    """Agendas of every workspace whose topic or presenter matches, newest first"""
+    def query(name: str, agendas: Dict) -> List[dict]:
+        return [{'Workspace': name, 'Date': a['date'], 'Topic': a['topic'], 'Presenter': a['presenter'],
+                 'Status': a['status'].replace('_', ' ').title()}
+                for a in filter_agendas(agendas, search)]
+    results = store.fan_out(query)
+    return sorted((row for rows in results.values() for row in rows), key=lambda r: r['Date'], reverse=True)
+
+# ============================================================================
+# TEMPLATES
+# ============================================================================
+# Templates live in their own file next to the data file. An agenda created from
+# one keeps a template_id and shares the template's links, attachments and topic
+# image until it is given its own (see agenda_store.TEMPLATE_FIELDS).
+
+def load_templates() -> Dict:
+    """All templates, reusing the parsed template file while it is unchanged"""
+    with store.locked(data_file(), exclusive=False):
+        return store.read_templates(data_file())
+
+def save_as_template(agenda_id: str, name: str) -> str:
+    """Store an agenda's details and static content as a template and link the agenda to it"""
+    agenda = st.session_state.agendas[agenda_id]
+    with store.locked(data_file()):
+        templates = store.read_templates(data_file())
+        template_id = store.create_template(templates, name, agenda)
+        store.write_templates(templates, data_file())
+    update_agenda(agenda_id, template_id=template_id)
+    return template_id
+
+def delete_template(template_id: str) -> int:
+    """Delete a template; agendas created from it keep their own copy of its static content"""
+    detached = store.detach_template(st.session_state.agendas, template_id)
+    if detached:
+        # The agendas have to hold the content on disk before the template goes
+        save_agendas_to_file(st.session_state.agendas)
+        get_writer().flush()
+    with store.locked(data_file()):
+        templates = store.read_templates(data_file())
+        templates.pop(template_id, None)
+        store.write_templates(templates, data_file())
+    return len(detached)
+
+# ============================================================================
+# BULK OPERATIONS
+# ============================================================================
+# Each applies all its changes in memory, logs them as one undoable operation
+# and saves once, so a bulk edit costs a single write of the data file.
+
+def bulk_update_status(agenda_ids: List[str], status: str) -> int:
+    """Set the status of several agendas and return how many changed"""
+    undo = []
+    for agenda_id in agenda_ids:
+        agenda = st.session_state.agendas.get(agenda_id)
+        if agenda is None or agenda['status'] == status:
+            continue
+        undo.append(('set_fields', agenda_id, {'status': agenda['status'], 'updated_at': agenda['updated_at']}))
+        store.update_agenda(st.session_state.agendas, agenda_id, status=status)
+    if undo:
+        record_operation(f"Set {len(undo)} agenda(s) to {status.replace('_', ' ')}", undo)
+        save_agendas_to_file(st.session_state.agendas)
+    return len(undo)
+
+def bulk_delete(agenda_ids: List[str]) -> int:
+    """Move several agendas to the trash and return how many were deleted"""
+    undo = []
+    for agenda_id in agenda_ids:
+        agenda = store.delete_agenda(st.session_state.agendas, agenda_id)
+        if agenda is None:
+            continue
+        undo.append(('insert_record', agenda_id, agenda))
+        get_reminder_scheduler(data_file()).cancel_agenda(agenda)
+        st.session_state.schedule_index.remove(agenda_id)
+        st.session_state.action_index.remove_agenda(agenda_id)
+    if undo:
+        record_operation(f"Delete {len(undo)} agenda(s)", undo)
+        save_agendas_to_file(st.session_state.agendas)
+    return len(undo)
+
+def bulk_reassign_actions(agenda_ids: List[str], to_owner: str, from_owner: Optional[str] = None,
+                          open_only: bool = True) -> int:
+    """Hand the action items of several agendas (optionally only one owner's) to `to_owner`"""
+    old_owner = from_owner.strip().lower() if from_owner else None
+    undo, touched = [], []
+    for agenda_id in agenda_ids:
+        agenda = st.session_state.agendas.get(agenda_id)
+        if agenda is None:
+            continue
+        stamp = _stamp(agenda_id)
+        changed = []
+        for action in agenda['action_items']:
+            if old_owner is not None and action['owner'].strip().lower() != old_owner:
+                continue
+            if (open_only and action['status'] == 'completed') or action['owner'] == to_owner:
+                continue
+            changed.append(('set_item_fields', agenda_id, 'action_items', action['id'], {'owner': action['owner']}))
+            store.update_item(st.session_state.agendas, agenda_id, 'action_items', action['id'], owner=to_owner)
+        if changed:
+            undo += [stamp] + changed
+            touched.append(agenda_id)
+    if touched:
+        for agenda_id in touched:
+            reindex_agenda(agenda_id)
+        count = len(undo) - len(touched)
+        record_operation(f"Reassign {count} action item(s) to {to_owner}", undo)
+        save_agendas_to_file(st.session_state.agendas)
+        return count
+    return 0
+
+def export_agendas(agenda_ids: List[str]) -> str:
+    """Export a selection of agendas as JSON in the import format"""
+    agendas = st.session_state.agendas
+    return json.dumps({agenda_id: agendas[agenda_id] for agenda_id in agenda_ids if agenda_id in agendas}, indent=2)
+
+# ============================================================================
+# GRID EDITING
+# ============================================================================
+# Editable columns of each item list in grid mode, in display order; the first is required
+GRID_FIELDS = {
+    'todos': ['task', 'assignee', 'priority', 'completed'],
+    'action_items': ['action', 'owner', 'due_date', 'priority', 'status']
+}
+GRID_DEFAULTS = {'task': '', 'action': '', 'assignee': '', 'owner': '', 'priority': 'medium',
+                 'completed': False, 'status': 'pending', 'due_date': None}
+
+def grid_row(row: dict, fields: List[str]) -> dict:
+    """A data editor row in the stored item format (ISO dates, no NaN)"""
+    cleaned = {'id': row.get('id') if isinstance(row.get('id'), str) else None}
+    for field in fields:
+        value = row.get(field)
+        if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NaT:
+            value = GRID_DEFAULTS[field]
+        elif isinstance(value, datetime):
+            value = value.date().isoformat()
+        elif isinstance(value, date):
+            value = value.isoformat()
+        elif isinstance(value, str):
+            value = value.strip()
+        elif field == 'completed':
+            value = bool(value)
+        cleaned[field] = value
+    return cleaned
+
+def diff_item_rows(items: List[dict], rows: List[dict], fields: List[str]) -> tuple:
+    """Split edited grid rows into (added rows, {item ID: changed fields}, removed item IDs)"""
+    current = {item['id']: item for item in items}
+    kept = set()
+    added, changed = [], {}
+    for row in rows:
+        item = current.get(row['id'])
+        if item is None:
+            added.append(row)
+            continue
+        kept.add(item['id'])
+        changes = {field: row[field] for field in fields if row[field] != item.get(field)}
+        if changes:
+            changed[item['id']] = changes
+    removed = [item_id for item_id in current if item_id not in kept]
+    return added, changed, removed
+
+def apply_item_grid(agenda_id: str, item_type: str, rows: List[dict]) -> int:
+    """Apply an edited grid's row diffs to one agenda as one undoable change and one save"""
+    agendas = st.session_state.agendas
+    if agenda_id not in agendas:
+        return 0
+    fields = GRID_FIELDS[item_type]
+    added, changed, removed = diff_item_rows(agendas[agenda_id][item_type], rows, fields)
+    added = [row for row in added if row[fields[0]]]  # blank rows left in the grid
+    if not (added or changed or removed):
+        return 0
+    
+    undo = [_stamp(agenda_id)]
+    for item_id in removed:
+        position = item_position(agendas, agenda_id, item_type, item_id)
+        item = store.delete_item(agendas, agenda_id, item_type, item_id)
+        undo.append(('insert_item', agenda_id, item_type, position, item))
+    for item_id, changes in changed.items():
+        item = store.find_item(agendas, agenda_id, item_type, item_id)
+        restored = list(changes) + (['completed_at'] if 'status' in changes else [])
+        undo.append(('set_item_fields', agenda_id, item_type, item_id, {field: item.get(field) for field in restored}))
+        store.update_item(agendas, agenda_id, item_type, item_id, **changes)
+    for row in added:
+        if item_type == 'todos':
+            item = store.add_todo(agendas, agenda_id, row['task'], row['priority'], row['assignee'])
+        else:
+            item = store.add_action_item(agendas, agenda_id, row['action'], row['owner'], row['due_date'],
+                                         row['priority'])
+        store.update_item(agendas, agenda_id, item_type, item['id'], **{field: row[field] for field in fields})
+        undo.append(('remove_item', agenda_id, item_type, item['id']))
+    
+    count = len(added) + len(changed) + len(removed)
+    record_operation(f"Edit {count} {ITEM_LABELS[item_type]}(s) in grid", undo)
+    if item_type == 'action_items':
+        reindex_agenda(agenda_id)
+    save_agendas_to_file(agendas)
+    return count
+
 def file_to_base64(uploaded_file) -> dict:
     """Convert uploaded file to base64 encoded dict"""
     if uploaded_file is not None:
@@ -417,14 +601,102 @@ def file_to_base64(uploaded_file) -> dict:
         }
     return None
 
+@timed('base64.decode')
 def base64_to_bytes(encoded_data: str) -> bytes:
-    """Convert base64 string back to bytes"""
-    return base64.b64decode(encoded_data)
+    """Convert base64 string back to bytes, reusing this session's earlier decodes"""
+    return get_payload_cache().decode(encoded_data)
+
+# ============================================================================
+# UNDO / REDO
+# ============================================================================
+
+def record_operation(label: str, undo_deltas: list) -> None:
+    """Log the deltas that reverse a mutation this session just made"""
+    st.session_state.operation_log.record(label, undo_deltas)
+    update_trash(undo_deltas)
+
+def update_trash(deltas: list) -> None:
+    """Tombstone whatever a change removed and drop tombstones of whatever it brought back"""
+    if any(d[0] in ('insert_record', 'insert_item', 'remove_record', 'remove_item') for d in deltas):
+        with store.locked(data_file()):
+            bin_ = trash.read_trash(data_file())
+            if trash.track_removals(bin_, deltas):
+                trash.write_trash(bin_, data_file())
+
+def _stamp(agenda_id: str) -> tuple:
+    """Delta restoring an agenda's current updated_at"""
+    agenda = st.session_state.agendas.get(agenda_id) or {}
+    return ('set_fields', agenda_id, {'updated_at': agenda.get('updated_at')})
+
+def reindex_agenda(agenda_id: str) -> None:
+    """Bring the indexes and reminder schedule in line with one agenda's stored state"""
+    scheduler = get_reminder_scheduler(data_file())
+    for action_id in st.session_state.action_index.actions_of(agenda_id):
+        scheduler.cancel(action_id)
+    st.session_state.action_index.remove_agenda(agenda_id)
+    st.session_state.schedule_index.remove(agenda_id)
+    
+    agenda = st.session_state.agendas.get(agenda_id)
+    if agenda is not None:
+        st.session_state.schedule_index.add(agenda)
+        for action in agenda['action_items']:
+            st.session_state.action_index.add(agenda_id, action)
+            scheduler.schedule(agenda, action)
+
+def _replay(result: Optional[tuple]) -> Optional[str]:
+    if result is None:
+        return None
+    label, agenda_ids, inverse = result
+    update_trash(inverse)
+    for agenda_id in agenda_ids:
+        reindex_agenda(agenda_id)
+    if st.session_state.selected_agenda_id not in st.session_state.agendas:
+        st.session_state.selected_agenda_id = None
+        if st.session_state.current_view == 'detail':
+            st.session_state.current_view = 'list'
+    save_agendas_to_file(st.session_state.agendas)
+    return label
+
+def restore_from_trash(agenda_id: Optional[str] = None, item_id: Optional[str] = None) -> bool:
+    """Move a trashed agenda or item back into the store"""
+    with trash.trash_transaction(data_file()) as bin_:
+        if agenda_id:
+            restored = trash.restore_agenda(st.session_state.agendas, bin_, agenda_id)
+            undo = [('remove_record', agenda_id)]
+            label = f"Restore '{restored['topic']}'" if restored else None
+        else:
+            entry = bin_['items'].get(item_id)
+            stamp = _stamp(entry['agenda_id']) if entry else None
+            restored = trash.restore_item(st.session_state.agendas, bin_, item_id)
+            if restored:
+                agenda_id = entry['agenda_id']
+                undo = [stamp, ('remove_item', agenda_id, entry['item_type'], item_id)]
+                label = f"Restore {ITEM_LABELS[entry['item_type']]}"
+    if restored is None:
+        return False
+    st.session_state.operation_log.record(label, undo)
+    reindex_agenda(agenda_id)
+    save_agendas_to_file(st.session_state.agendas)
+    return True
+
+def purge_from_trash(kind: str, key: str) -> None:
+    """Permanently delete one tombstone"""
+    with trash.trash_transaction(data_file()) as bin_:
+        bin_[kind].pop(key, None)
+
+def undo_last() -> Optional[str]:
+    """Reverse this session's latest change and return its label"""
+    return _replay(st.session_state.operation_log.undo(st.session_state.agendas))
+
+def redo_last() -> Optional[str]:
+    """Re-apply the latest undone change and return its label"""
+    return _replay(st.session_state.operation_log.redo(st.session_state.agendas))
 
 # ============================================================================
 # EMAIL FUNCTIONALITY
 # ============================================================================
 
+@timed('html.email')
 def generate_email_content(agenda: dict, include_items: dict) -> str:
     """Generate HTML email content from agenda"""
     html = f"""
@@ -565,7 +837,7 @@ Please view this email in HTML format for the full content.
                 msg.attach(attachment)
         
         # Send email
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
+        with span('smtp.send'), smtplib.SMTP(smtp_server, smtp_port) as server:
             server.starttls()
             server.login(sender_email, sender_password)
             server.send_message(msg)
@@ -587,10 +859,56 @@ def import_data(json_string: str) -> tuple:
     try:
         data = json.loads(json_string)
         st.session_state.agendas.update(data)
+        st.session_state.schedule_index = ScheduleIndex.from_agendas(st.session_state.agendas)
+        st.session_state.action_index = ActionIndex.from_agendas(st.session_state.agendas)
+        get_reminder_scheduler(data_file()).rebuild(st.session_state.agendas)
+        st.session_state.operation_log.clear()
         return True, f"Successfully imported {len(data)} agenda(s)"
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON format: {str(e)}"
 
+def archive_now() -> int:
+    """Move aged-out completed agendas to the archive and reload the hot set; returns how many moved"""
+    writer = get_writer()
+    writer.flush()
+    agendas, moved = archive.archive_old(data_file(), archive.ARCHIVE_AFTER)
+    if moved:
+        st.session_state.agendas = agendas
+        st.session_state.schedule_index = ScheduleIndex.from_agendas(agendas)
+        st.session_state.action_index = ActionIndex.from_agendas(agendas)
+        get_reminder_scheduler(data_file()).rebuild(agendas)
+        st.session_state.operation_log.clear()
+        writer.track(agendas)
+    return sum(moved.values())
+
+# ============================================================================
+# ANALYTICS
+# ============================================================================
+# Meeting date windows offered by the analytics view, in days back from today
+ANALYTICS_PERIODS = {'All time': None, 'Last 12 months': 365, 'Last 90 days': 90}
+
+def build_analytics_frames(agendas: Dict) -> Dict[str, pd.DataFrame]:
+    """Agendas, action items and to-dos as columnar frames"""
+    return {
+        'agendas': analytics.parse_dates(
+            analytics.records_frame(agendas, ['id', 'presenter', 'date', 'status']), ['date']),
+        'actions': analytics.parse_dates(
+            analytics.items_frame(agendas, 'action_items',
+                                  ['owner', 'due_date', 'priority', 'status', 'created_at', 'completed_at'], ['date']),
+            ['record_date', 'due_date', 'created_at', 'completed_at']),
+        'todos': analytics.parse_dates(
+            analytics.items_frame(agendas, 'todos', ['assignee', 'priority', 'completed'], ['date']),
+            ['record_date'])
+    }
+
+def get_analytics_frames() -> Dict[str, pd.DataFrame]:
+    """This session's analytics frames, flattened again only after the agendas change"""
+    if 'analytics_cache' not in st.session_state:
+        st.session_state.analytics_cache = analytics.FrameCache()
+    return st.session_state.analytics_cache.frames(
+        st.session_state.agendas, st.session_state.operation_log.revision, build_analytics_frames
+    )
+
 # ============================================================================
 # UI COMPONENTS
 # ============================================================================
@@ -598,14 +916,24 @@ def import_data(json_string: str) -> tuple:
 def render_sidebar():
     """Render the sidebar navigation and controls"""
     with st.sidebar:
+        workspaces = store.list_workspaces()
+        st.selectbox("🏢 Workspace", workspaces, index=workspaces.index(st.session_state.workspace),
+                     key="workspace_select", on_change=on_workspace_selected)
+        
         st.markdown("## 🗂️ Navigation")
         
         # View selector
         view_options = {
             'list': '📋 All Agendas',
             'create': '➕ Create New',
+            'actions': '🎯 Action Tracker',
+            'conflicts': '⚠️ Schedule Conflicts',
+            'analytics': '📈 Analytics',
             'settings': '⚙️ Email Settings',
-            'import_export': '📁 Import/Export'
+            'import_export': '📁 Import/Export',
+            'templates': '📑 Templates',
+            'trash': '🗑️ Trash',
+            'workspaces': '🏢 Workspaces'
         }
         
         for key, label in view_options.items():
@@ -615,6 +943,24 @@ def render_sidebar():
                 st.session_state.edit_mode = False
                 st.rerun()
         
+        # Undo / redo this session's changes
+        log = st.session_state.operation_log
+        col_undo, col_redo = st.columns(2)
+        with col_undo:
+            if st.button("↩️ Undo", key="undo", use_container_width=True, disabled=log.undo_label() is None,
+                         help=f"Undo: {log.undo_label()}" if log.undo_label() else "Nothing to undo"):
+                label = undo_last()
+                if label:
+                    st.toast(f"Undid: {label}")
+                st.rerun()
+        with col_redo:
+            if st.button("↪️ Redo", key="redo", use_container_width=True, disabled=log.redo_label() is None,
+                         help=f"Redo: {log.redo_label()}" if log.redo_label() else "Nothing to redo"):
+                label = redo_last()
+                if label:
+                    st.toast(f"Redid: {label}")
+                st.rerun()
+        
         st.markdown("---")
         
         # Quick stats
@@ -629,11 +975,19 @@ def render_sidebar():
             st.metric("Scheduled", scheduled)
         with col2:
             st.metric("Completed", completed)
-            pending_actions = sum(
-                len([ai for ai in a['action_items'] if ai['status'] != 'completed'])
-                for a in st.session_state.agendas.values()
-            )
+            pending_actions = st.session_state.action_index.counts(date.today())['open']
             st.metric("Pending Actions", pending_actions)
+        archived = archive.stats(data_file())['agendas']
+        if archived:
+            st.caption(f"🧊 {archived} older completed agenda(s) archived")
+        
+        writer = get_writer()
+        if writer.last_error:
+            st.error(writer.last_error)
+        if writer.stats['commits']:
+            amplification = writer.amplification()
+            st.caption(f"💾 {writer.stats['requests']} save(s) in {writer.stats['commits']} write(s) · "
+                       f"{amplification['write_amplification']}× write amplification")
         
         st.markdown("---")
         
@@ -651,6 +1005,87 @@ def render_sidebar():
                     st.session_state.current_view = 'detail'
                     st.session_state.selected_agenda_id = agenda['id']
                     st.rerun()
+        
+        # Timing diagnostics, hidden unless the page is opened with ?diagnostics=1
+        if st.query_params.get('diagnostics') == '1':
+            render_diagnostics()
+
+def render_diagnostics():
+    """Render the previous run's span breakdown and this process's rolling span latencies"""
+    with st.expander("🩺 Diagnostics", expanded=True):
+        last_rerun = st.session_state.get('last_rerun')
+        if last_rerun:
+            name, breakdown = last_rerun
+            total_ms = breakdown.get(name, (0, 0.0))[1] * 1000
+            st.caption(f"Previous run ({name}): {total_ms:.1f} ms")
+            st.dataframe(breakdown_rows(breakdown), hide_index=True, use_container_width=True)
+        
+        snapshot = METRICS.snapshot()
+        if snapshot:
+            st.caption(f"Last {METRICS.window} calls per span, all sessions")
+            st.dataframe([{'Span': name, 'Calls': s['count'], 'p50 ms': s['p50_ms'], 'p95 ms': s['p95_ms'],
+                           'max ms': s['max_ms']} for name, s in snapshot.items()],
+                         hide_index=True, use_container_width=True)
+        
+        if st.button("📤 Export metrics", key="export_metrics", use_container_width=True):
+            try:
+                st.toast(f"Wrote {METRICS.export()}")
+            except OSError as e:
+                st.error(f"Error writing metrics: {e}")
+        st.caption(f"Exported every {METRICS.export_interval}s to `{METRICS.export_path}`")
+        
+        render_profiler()
+        render_memory()
+
+def render_profiler():
+    """Render the controls and hotspots of this session's profile capture"""
+    st.markdown("**🔬 Profiler**")
+    capture = st.session_state.get('profile_capture')
+    if capture is not None and capture.active:
+        st.caption(f"Profiling: {capture.remaining} of {capture.runs} run(s) left")
+        if st.button("⏹️ Stop profiling", key="profile_stop", use_container_width=True):
+            capture.runs = len(capture.dumps)
+            st.rerun()
+    else:
+        runs = st.number_input("Runs to profile", min_value=1, max_value=50, value=DEFAULT_RUNS, key="profile_runs")
+        if st.button("▶️ Profile next runs", key="profile_start", use_container_width=True):
+            st.session_state.profile_capture = ProfileCapture(int(runs))
+            st.toast(f"Profiling this session's next {int(runs)} run(s)")
+    
+    if capture is None:
+        return
+    if capture.last_error:
+        st.error(capture.last_error)
+    if capture.skipped:
+        st.caption(f"{capture.skipped} run(s) skipped while another session was being profiled")
+    hotspots = capture.hotspots()
+    if hotspots:
+        st.caption(f"Top functions by own time over {len(capture.dumps)} run(s), dumps in `{capture.directory}`")
+        st.dataframe(hotspots, hide_index=True, use_container_width=True)
+
+def render_memory():
+    """Render this session's memory accounting and the sizes of the other sessions"""
+    st.markdown("**🧠 Memory**")
+    report = measure_memory()
+    budget = memory_usage.MEMORY_BUDGET_MB
+    st.caption(f"This session: {report['total'] / 1e6:.1f} MB for {report['records']} agendas"
+               + (f" · budget {budget} MB" if budget is not None else ""))
+    st.dataframe(memory_usage.rows(report['by_category'], 'Category'), hide_index=True, use_container_width=True)
+    topics = {agenda_id: agenda['topic'] for agenda_id, agenda in st.session_state.agendas.items()}
+    st.dataframe(memory_usage.rows(report['by_record'], 'Agenda', topics, limit=10),
+                 hide_index=True, use_container_width=True)
+    st.dataframe(memory_usage.rows(report['by_key'], 'Session key', limit=10),
+                 hide_index=True, use_container_width=True)
+    
+    cache = get_payload_cache()
+    st.caption(f"Decoded payloads: {len(cache)} cached, {cache.nbytes / 1e6:.1f} MB, "
+               f"{cache.hits} hit(s) / {cache.misses} miss(es)")
+    if st.button("🧹 Evict decoded payloads", key="evict_payloads", use_container_width=True,
+                 disabled=not len(cache)):
+        st.toast(f"Freed {cache.evict() / 1e6:.1f} MB")
+    
+    st.caption("Sessions in this process")
+    st.dataframe(memory_usage.session_table(), hide_index=True, use_container_width=True)
 
 def render_agenda_form(agenda: dict = None):
     """Render the agenda creation/edit form"""
@@ -658,19 +1093,41 @@ def render_agenda_form(agenda: dict = None):
     
     st.markdown(f"### {'✏️ Edit Agenda' if is_edit else '➕ Create New Agenda'}")
     
+    # A new agenda can start from a template: its details are prefilled and its
+    # static content is shared with the template rather than copied
+    template = None
+    if not is_edit:
+        templates = load_templates()
+        if st.session_state.get('template_choice') not in templates:
+            st.session_state.pop('template_choice', None)
+        if templates:
+            choice = st.selectbox(
+                "📑 Start from template",
+                [None, *templates],
+                format_func=lambda t: "Blank agenda" if t is None else templates[t]['name'],
+                key="template_choice"
+            )
+            template = templates.get(choice)
+    elif agenda.get('template_id'):
+        template = load_templates().get(agenda['template_id'])
+    base = agenda if is_edit else (template or {})
+    if template:
+        st.caption(f"📑 Links, attachments and the image are shared with the template '{template['name']}'; "
+                   "adding to them gives this agenda its own copy.")
+    
     with st.form(key="agenda_form", clear_on_submit=not is_edit):
         col1, col2 = st.columns([2, 1])
         
         with col1:
             topic = st.text_input(
                 "📌 Topic *",
-                value=agenda['topic'] if is_edit else '',
+                value=base.get('topic', ''),
                 placeholder="Enter meeting topic"
             )
             
             presenter = st.text_input(
                 "👤 Presenter Name *",
-                value=agenda['presenter'] if is_edit else '',
+                value=base.get('presenter', ''),
                 placeholder="Enter presenter's name"
             )
             
@@ -685,7 +1142,7 @@ def render_agenda_form(agenda: dict = None):
             with col_time:
                 meeting_time = st.time_input(
                     "🕐 Time *",
-                    value=time.fromisoformat(agenda['time']) if is_edit else time(9, 0)
+                    value=time.fromisoformat(base['time']) if base else time(9, 0)
                 )
             
             with col_duration:
@@ -693,7 +1150,7 @@ def render_agenda_form(agenda: dict = None):
                     "⏱️ Duration (min) *",
                     min_value=5,
                     max_value=480,
-                    value=agenda['duration'] if is_edit else 60,
+                    value=base.get('duration', 60),
                     step=5
                 )
         
@@ -705,9 +1162,9 @@ def render_agenda_form(agenda: dict = None):
                 key="topic_image_upload"
             )
             
-            if is_edit and agenda.get('topic_image') and not topic_image:
+            if base.get('topic_image') and not topic_image:
                 st.image(
-                    base64_to_bytes(agenda['topic_image']['data']),
+                    base64_to_bytes(base['topic_image']['data']),
                     caption="Current image",
                     width=150
                 )
@@ -723,8 +1180,8 @@ def render_agenda_form(agenda: dict = None):
         with url_col2:
             url_value = st.text_input("URL", placeholder="https://example.com", key="url_value")
         
-        # Display existing URLs if editing
-        existing_urls = agenda.get('urls', []) if is_edit else []
+        # Display existing URLs if editing or starting from a template
+        existing_urls = base.get('urls', [])
         if existing_urls:
             st.markdown("**Existing URLs:**")
             for i, url in enumerate(existing_urls):
@@ -741,14 +1198,20 @@ def render_agenda_form(agenda: dict = None):
             key="attachments_upload"
         )
         
-        # Display existing attachments if editing
-        if is_edit and agenda.get('attachments'):
+        # Display existing attachments if editing or starting from a template
+        if base.get('attachments'):
             st.markdown("**Existing Attachments:**")
-            for att in agenda['attachments']:
+            for att in base['attachments']:
                 st.markdown(f"- 📄 {att['name']}")
         
         st.markdown("---")
         
+        allow_conflicts = st.checkbox(
+            "Save even if this overlaps other meetings",
+            value=False,
+            key="allow_schedule_conflicts"
+        )
+        
         col_submit, col_cancel = st.columns(2)
         with col_submit:
             submitted = st.form_submit_button(
@@ -764,23 +1227,33 @@ def render_agenda_form(agenda: dict = None):
                 st.rerun()
         
         if submitted:
+            conflicts = find_schedule_conflicts(
+                meeting_date, meeting_time, duration, presenter,
+                agenda['id'] if is_edit else None
+            ) if topic and presenter else []
+            
             if not topic or not presenter:
                 st.error("Please fill in all required fields (Topic and Presenter)")
+            elif conflicts and not allow_conflicts:
+                st.warning("⚠️ This time slot conflicts with existing meetings:")
+                for conflict in conflicts:
+                    st.markdown(f"- {describe_conflict(conflict)}")
+                st.info("Adjust the date/time, or tick \"Save even if this overlaps other meetings\".")
             else:
                 # Process topic image
                 processed_image = None
                 if topic_image:
                     processed_image = file_to_base64(topic_image)
-                elif is_edit and agenda.get('topic_image'):
-                    processed_image = agenda['topic_image']
+                elif base.get('topic_image'):
+                    processed_image = base['topic_image']
                 
                 # Process URLs
-                urls_list = existing_urls.copy() if is_edit else []
+                urls_list = existing_urls.copy()
                 if url_name and url_value:
                     urls_list.append({'name': url_name, 'url': url_value})
                 
                 # Process attachments
-                attachments_list = agenda.get('attachments', []).copy() if is_edit else []
+                attachments_list = base.get('attachments', []).copy()
                 if attachments:
                     for att in attachments:
                         attachments_list.append(file_to_base64(att))
@@ -807,7 +1280,8 @@ def render_agenda_form(agenda: dict = None):
                         duration=duration,
                         topic_image=processed_image,
                         urls=urls_list,
-                        attachments=attachments_list
+                        attachments=attachments_list,
+                        template_id=template['id'] if template else None
                     )
                     st.success(f"✅ Agenda created successfully! ID: {new_id}")
                 
@@ -815,22 +1289,11 @@ def render_agenda_form(agenda: dict = None):
                 st.session_state.current_view = 'list'
                 st.rerun()
 
-def render_agenda_list():
-    """Render the list of all agendas"""
-    st.markdown('<h2 class="main-title">🏢 AWM Community of Practice (CoP)</h2>', unsafe_allow_html=True)
-    st.markdown('<h1 class="main-title">📋 Meeting Agenda & Note Manager</h1>', unsafe_allow_html=True)
-    
-    # Search and filter
-    col1, col2, col3 = st.columns([2, 1, 1])
-    with col1:
-        search = st.text_input("🔍 Search agendas", placeholder="Search by topic or presenter...")
-    with col2:
-        status_filter = st.selectbox("Status", ['All', 'Scheduled', 'In Progress', 'Completed'])
-    with col3:
-        sort_by = st.selectbox("Sort by", ['Date (newest)', 'Date (oldest)', 'Topic A-Z', 'Topic Z-A'])
-    
-    # Filter and sort agendas
-    filtered_agendas = list(st.session_state.agendas.values())
+@timed('filter')
+def filter_agendas(agendas: Dict, search: str, status_filter: str = 'All',
+                   sort_by: str = 'Date (newest)') -> List[dict]:
+    """Agendas matching the list view's search box and status filter, in its sort order"""
+    filtered_agendas = list(agendas.values())
     
     if search:
         search_lower = search.lower()
@@ -855,6 +1318,102 @@ def render_agenda_list():
     elif sort_by == 'Topic Z-A':
         filtered_agendas.sort(key=lambda x: x['topic'].lower(), reverse=True)
     
+    return filtered_agendas
+
+def selected_agenda_ids(agendas: List[dict]) -> List[str]:
+    """IDs of the listed agendas whose Select box is ticked"""
+    return [a['id'] for a in agendas if st.session_state.get(f"select_{a['id']}")]
+
+def set_selection(agenda_ids: List[str], selected: bool) -> None:
+    """Tick or clear the Select box of several agendas"""
+    for agenda_id in agenda_ids:
+        st.session_state[f"select_{agenda_id}"] = selected
+
+def finish_bulk(agenda_ids: List[str], message: str) -> None:
+    """Clear the selection a bulk action worked on and rerun with a confirmation"""
+    set_selection(agenda_ids, False)
+    st.session_state.confirm_bulk_delete = False
+    st.toast(message)
+    st.rerun()
+
+def render_bulk_actions(agendas: List[dict]):
+    """Render selection controls and the bulk actions for the ticked agendas"""
+    shown = [a['id'] for a in agendas]
+    selected = selected_agenda_ids(agendas)
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        st.caption(f"☑️ {len(selected)} of {len(shown)} listed agenda(s) selected")
+    with col2:
+        st.button("Select all", key="bulk_select_all", use_container_width=True,
+                  on_click=set_selection, args=(shown, True))
+    with col3:
+        st.button("Clear selection", key="bulk_clear", use_container_width=True, disabled=not selected,
+                  on_click=set_selection, args=(shown, False))
+    
+    if not selected:
+        return
+    
+    with st.container(border=True):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            status = st.selectbox("Set status", ['scheduled', 'in_progress', 'completed'],
+                                  format_func=lambda s: s.replace('_', ' ').title(), key="bulk_status")
+            if st.button("✅ Apply status", key="bulk_apply_status", use_container_width=True):
+                changed = bulk_update_status(selected, status)
+                finish_bulk(selected, f"Updated {changed} agenda(s)")
+        with col2:
+            owners = sorted({action['owner'] for agenda_id in selected
+                             for action in st.session_state.agendas[agenda_id]['action_items'] if action['owner']},
+                            key=str.lower)
+            from_owner = st.selectbox("Action items of", ['Anyone'] + owners, key="bulk_from_owner")
+            to_owner = st.text_input("Reassign to", key="bulk_to_owner").strip()
+            open_only = st.checkbox("Open items only", value=True, key="bulk_open_only")
+            if st.button("👤 Reassign", key="bulk_reassign", use_container_width=True, disabled=not to_owner):
+                count = bulk_reassign_actions(selected, to_owner, None if from_owner == 'Anyone' else from_owner,
+                                              open_only)
+                finish_bulk(selected, f"Reassigned {count} action item(s) to {to_owner}")
+        with col3:
+            st.download_button("📥 Export selected", export_agendas(selected), key="bulk_export",
+                               file_name=f"agendas_{len(selected)}_{date.today().isoformat()}.json",
+                               mime="application/json", use_container_width=True)
+            if st.button("🗑️ Delete selected", key="bulk_delete", use_container_width=True):
+                st.session_state.confirm_bulk_delete = True
+                st.rerun()
+        
+        if st.session_state.get('confirm_bulk_delete'):
+            st.warning(f"⚠️ Delete {len(selected)} agenda(s)? They will be kept in the 🗑️ Trash for 30 days.")
+            col_yes, col_no = st.columns(2)
+            with col_yes:
+                if st.button("Yes, Delete", key="bulk_delete_yes", use_container_width=True, type="primary"):
+                    deleted = bulk_delete(selected)
+                    finish_bulk(selected, f"Deleted {deleted} agenda(s)")
+            with col_no:
+                if st.button("Cancel", key="bulk_delete_no", use_container_width=True):
+                    st.session_state.confirm_bulk_delete = False
+                    st.rerun()
+
+def render_agenda_list():
+    """Render the list of all agendas"""
+    st.markdown('<h2 class="main-title">🏢 AWM Community of Practice (CoP)</h2>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-title">📋 Meeting Agenda & Note Manager</h1>', unsafe_allow_html=True)
+    
+    # Search and filter
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        search = st.text_input("🔍 Search agendas", placeholder="Search by topic or presenter...", key="agenda_search")
+        include_archived = st.checkbox("🧊 Include archived", key="include_archived",
+                                       help="Also search older completed agendas in the archive")
+    with col2:
+        status_filter = st.selectbox("Status", ['All', 'Scheduled', 'In Progress', 'Completed'])
+    with col3:
+        sort_by = st.selectbox("Sort by", ['Date (newest)', 'Date (oldest)', 'Topic A-Z', 'Topic Z-A'])
+    
+    filtered_agendas = filter_agendas(st.session_state.agendas, search, status_filter, sort_by)
+    
+    if filtered_agendas:
+        render_bulk_actions(filtered_agendas)
+    
     st.markdown("---")
     
     if not filtered_agendas:
@@ -920,8 +1479,37 @@ def render_agenda_list():
                                 st.session_state.current_view = 'detail'
                                 st.session_state.selected_agenda_id = agenda['id']
                                 st.rerun()
+                            st.checkbox("Select", key=f"select_{agenda['id']}")
                         
                         st.markdown('</div>', unsafe_allow_html=True)
+    
+    if include_archived:
+        render_archived_matches(search, status_filter, sort_by)
+
+def render_archived_matches(search: str, status_filter: str, sort_by: str):
+    """Render archived agendas matching the list view's search, read-only, opening segments only as needed"""
+    st.markdown("### 🧊 Archived")
+    if not search:
+        st.caption("Type a search to look through the archive.")
+        return
+    
+    matches, opened = archive.search(
+        data_file(), lambda segment: filter_agendas(segment, search, status_filter, sort_by),
+        ARCHIVE_SEARCH_LIMIT, st.session_state.agendas
+    )
+    st.caption(f"{len(matches)} match(es) from {opened} of {len(archive.months(data_file()))} monthly segment(s)"
+               + (f", showing the first {ARCHIVE_SEARCH_LIMIT}" if len(matches) >= ARCHIVE_SEARCH_LIMIT else ""))
+    for agenda in matches:
+        with st.expander(f"📅 {agenda['date']} — {agenda['topic']} ({agenda['presenter']})"):
+            st.markdown(f"🕐 {agenda['time']} &nbsp;|&nbsp; ⏱️ {agenda['duration']} min &nbsp;|&nbsp; "
+                        f"📝 {len(agenda.get('notes', []))} notes &nbsp;|&nbsp; "
+                        f"✅ {len(agenda.get('todos', []))} to-dos &nbsp;|&nbsp; "
+                        f"🎯 {len(agenda.get('action_items', []))} actions")
+            for note in agenda.get('notes', []):
+                st.markdown(f"- 📝 {note['content']}")
+            for action in agenda.get('action_items', []):
+                st.markdown(f"- 🎯 {action['action']} — {action['owner'] or 'Unassigned'} "
+                            f"({action['status'].replace('_', ' ')})")
 
 def render_agenda_detail(agenda_id: str):
     """Render detailed view of a single agenda"""
@@ -949,12 +1537,10 @@ def render_agenda_detail(agenda_id: str):
             st.session_state.edit_mode = True
             st.rerun()
     with col2:
-        status_options = ['scheduled', 'in_progress', 'completed']
-        current_idx = status_options.index(agenda['status']) if agenda['status'] in status_options else 0
-        new_status = st.selectbox("Status", status_options, index=current_idx, key="status_select", label_visibility="collapsed")
-        if new_status != agenda['status']:
-            update_agenda(agenda_id, status=new_status)
-            st.rerun()
+        # Show the stored status, which an undo or another agenda's page may have left the widget out of step with
+        st.session_state.status_select = agenda['status']
+        st.selectbox("Status", list(store.AGENDA_STATUSES), key="status_select", label_visibility="collapsed",
+                     on_change=on_agenda_status_change, args=(agenda_id,))
     with col3:
         if st.button("📧 Email", use_container_width=True):
             st.session_state.show_email_modal = True
@@ -975,7 +1561,7 @@ def render_agenda_detail(agenda_id: str):
     
     # Confirm delete dialog
     if st.session_state.get('confirm_delete'):
-        st.warning("⚠️ Are you sure you want to delete this agenda? This action cannot be undone.")
+        st.warning("⚠️ Are you sure you want to delete this agenda? It will be kept in the 🗑️ Trash for 30 days.")
         col_yes, col_no = st.columns(2)
         with col_yes:
             if st.button("Yes, Delete", use_container_width=True, type="primary"):
@@ -1008,6 +1594,10 @@ def render_agenda_detail(agenda_id: str):
         st.markdown(f"**⏱️ Duration:** {agenda['duration']} minutes")
         st.markdown('</div>', unsafe_allow_html=True)
         
+        template = load_templates().get(agenda['template_id']) if agenda.get('template_id') else None
+        if template:
+            st.caption(f"📑 Based on template '{template['name']}'")
+        
         # URLs
         if agenda.get('urls'):
             st.markdown('<div class="section-header">🔗 Related Links</div>', unsafe_allow_html=True)
@@ -1034,38 +1624,128 @@ def render_agenda_detail(agenda_id: str):
                 use_container_width=True
             )
     
+    with st.expander("📑 Save as template", expanded=False):
+        st.caption("Agendas created from the template share its links, attachments and image "
+                   "instead of storing their own copy.")
+        template_name = st.text_input("Template name", value=agenda['topic'], key=f"template_name_{agenda_id}")
+        if st.button("💾 Save template", key=f"save_template_{agenda_id}"):
+            if template_name.strip():
+                save_as_template(agenda_id, template_name.strip())
+                st.toast(f"Saved template '{template_name.strip()}'")
+                st.rerun()
+            else:
+                st.error("Please enter a template name")
+    
     st.markdown("---")
     
     # Tabs for Notes, To-Dos, and Action Items
-    tab1, tab2, tab3 = st.tabs(["📝 Notes", "✅ To-Do Items", "🎯 Action Items"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📝 Notes", "✅ To-Do Items", "🎯 Action Items", "🕘 History"])
     
     with tab1:
-        render_notes_section(agenda_id, agenda)
+        render_notes_section(agenda_id)
     
     with tab2:
-        render_todos_section(agenda_id, agenda)
+        render_todos_section(agenda_id)
     
     with tab3:
-        render_action_items_section(agenda_id, agenda)
+        render_action_items_section(agenda_id)
+    
+    with tab4:
+        render_history_section(agenda_id)
     
     # Email modal
     if st.session_state.get('show_email_modal'):
         render_email_modal(agenda)
 
-def render_notes_section(agenda_id: str, agenda: dict):
+# Widget callbacks of the detail view. They run before the script or fragment rerun
+# that the interaction triggers, so that run already renders the new state and
+# none of them has to rerun anything itself. Elements drawn from a callback would
+# land at the top of the page, so their messages are shown by the section instead.
+
+def notify(message: str, icon: Optional[str] = None):
+    """Queue a toast for the section rerun that follows the current callback"""
+    st.session_state.setdefault('pending_toasts', []).append((message, icon))
+
+def show_notifications():
+    for message, icon in st.session_state.pop('pending_toasts', []):
+        st.toast(message, icon=icon)
+
+@coalesce_writes
+def on_agenda_status_change(agenda_id: str):
+    update_agenda(agenda_id, status=st.session_state.status_select)
+
+@coalesce_writes
+def on_save_note(agenda_id: str):
+    content = st.session_state.new_note.strip()
+    if not content:
+        notify("Please enter some content", "⚠️")
+        return
+    add_note(agenda_id, content)
+    st.session_state.new_note = ""
+    notify("Note added!")
+
+@coalesce_writes
+def on_save_todo(agenda_id: str):
+    task = st.session_state.new_todo_task.strip()
+    if not task:
+        notify("Please enter a task", "⚠️")
+        return
+    add_todo(agenda_id, task, st.session_state.new_todo_priority, st.session_state.new_todo_assignee)
+    st.session_state.new_todo_task = ""
+    notify("To-do added!")
+
+@coalesce_writes
+def on_save_action_item(agenda_id: str):
+    action = st.session_state.new_action.strip()
+    owner = st.session_state.new_action_owner.strip()
+    if not (action and owner):
+        notify("Please fill in action and owner", "⚠️")
+        return
+    add_action_item(agenda_id, action, owner, st.session_state.new_action_due,
+                    st.session_state.new_action_priority)
+    st.session_state.new_action = ""
+    notify("Action item added!")
+
+@coalesce_writes
+def on_toggle_todo(agenda_id: str, todo_id: str):
+    toggle_todo(agenda_id, todo_id)
+
+@coalesce_writes
+def on_action_status_change(agenda_id: str, action_id: str):
+    update_action_status(agenda_id, action_id, st.session_state[f"status_{action_id}"])
+
+@coalesce_writes
+def on_delete_item(agenda_id: str, item_type: str, item_id: str):
+    delete_item(agenda_id, item_type, item_id)
+
+@coalesce_writes
+def on_apply_item_grid(agenda_id: str, item_type: str, editor_key: str, rows: List[dict]):
+    """Apply a submitted grid from the data editor's recorded edits to the rows it was given"""
+    edits = st.session_state.get(editor_key) or {}
+    edited_rows = {int(index): values for index, values in edits.get('edited_rows', {}).items()}
+    deleted = {int(index) for index in edits.get('deleted_rows', [])}
+    submitted = [dict(row, **edited_rows.get(index, {})) for index, row in enumerate(rows) if index not in deleted]
+    submitted += [dict(row) for row in edits.get('added_rows', [])]
+    count = apply_item_grid(agenda_id, item_type, [grid_row(row, GRID_FIELDS[item_type]) for row in submitted])
+    notify(f"Applied {count} change(s)" if count else "No changes to apply")
+
+@st.fragment
+@measure_rerun
+@coalesce_writes
+def render_notes_section(agenda_id: str):
     """Render the notes section"""
+    # Look the record up on every run, so a fragment rerun sees its latest state
+    agenda = st.session_state.agendas.get(agenda_id)
+    if agenda is None:
+        return
+    show_notifications()
+    
     st.markdown("### 📝 Meeting Notes")
     
     # Add new note
     with st.expander("➕ Add New Note", expanded=False):
-        new_note = st.text_area("Note content", key="new_note", placeholder="Enter your note here...")
-        if st.button("💾 Save Note", key="save_note"):
-            if new_note.strip():
-                add_note(agenda_id, new_note.strip())
-                st.success("Note added!")
-                st.rerun()
-            else:
-                st.warning("Please enter some content")
+        st.text_area("Note content", key="new_note", placeholder="Enter your note here...")
+        st.button("💾 Save Note", key="save_note", on_click=on_save_note, args=(agenda_id,))
     
     # Display existing notes
     if agenda.get('notes'):
@@ -1076,34 +1756,40 @@ def render_notes_section(agenda_id: str, agenda: dict):
                 st.markdown(note['content'])
                 st.caption(f"Added: {note['created_at'][:16]}")
             with col2:
-                if st.button("🗑️", key=f"del_note_{note['id']}", help="Delete note"):
-                    delete_item(agenda_id, 'notes', note['id'])
-                    st.rerun()
+                st.button("🗑️", key=f"del_note_{note['id']}", help="Delete note",
+                          on_click=on_delete_item, args=(agenda_id, 'notes', note['id']))
             st.markdown('</div>', unsafe_allow_html=True)
     else:
         st.info("No notes yet. Add your first note above!")
 
-def render_todos_section(agenda_id: str, agenda: dict):
+@st.fragment
+@measure_rerun
+@coalesce_writes
+def render_todos_section(agenda_id: str):
     """Render the to-do items section"""
+    # Look the record up on every run, so a fragment rerun sees its latest state
+    agenda = st.session_state.agendas.get(agenda_id)
+    if agenda is None:
+        return
+    show_notifications()
+    
     st.markdown("### ✅ To-Do Items")
     
     # Add new to-do
     with st.expander("➕ Add New To-Do", expanded=False):
         col1, col2, col3 = st.columns(3)
         with col1:
-            task = st.text_input("Task", key="new_todo_task", placeholder="Enter task...")
+            st.text_input("Task", key="new_todo_task", placeholder="Enter task...")
         with col2:
-            priority = st.selectbox("Priority", ['low', 'medium', 'high'], index=1, key="new_todo_priority")
+            st.selectbox("Priority", ['low', 'medium', 'high'], index=1, key="new_todo_priority")
         with col3:
-            assignee = st.text_input("Assignee", key="new_todo_assignee", placeholder="Who is responsible?")
+            st.text_input("Assignee", key="new_todo_assignee", placeholder="Who is responsible?")
         
-        if st.button("💾 Save To-Do", key="save_todo"):
-            if task.strip():
-                add_todo(agenda_id, task.strip(), priority, assignee)
-                st.success("To-do added!")
-                st.rerun()
-            else:
-                st.warning("Please enter a task")
+        st.button("💾 Save To-Do", key="save_todo", on_click=on_save_todo, args=(agenda_id,))
+    
+    if st.toggle("▦ Grid view", key="todos_grid_mode", help="Edit all to-dos in one table and apply them at once"):
+        render_item_grid(agenda_id, agenda, 'todos')
+        return
     
     # Display existing to-dos
     if agenda.get('todos'):
@@ -1121,38 +1807,44 @@ def render_todos_section(agenda_id: str, agenda: dict):
                 priority_colors = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
                 st.markdown(f"{priority_colors.get(todo['priority'], '⚪')} {todo['priority'].upper()}")
             with col3:
-                if st.button("✓/✗", key=f"toggle_{todo['id']}", help="Toggle completion"):
-                    toggle_todo(agenda_id, todo['id'])
-                    st.rerun()
+                st.button("✓/✗", key=f"toggle_{todo['id']}", help="Toggle completion",
+                          on_click=on_toggle_todo, args=(agenda_id, todo['id']))
             with col4:
-                if st.button("🗑️", key=f"del_todo_{todo['id']}", help="Delete"):
-                    delete_item(agenda_id, 'todos', todo['id'])
-                    st.rerun()
+                st.button("🗑️", key=f"del_todo_{todo['id']}", help="Delete",
+                          on_click=on_delete_item, args=(agenda_id, 'todos', todo['id']))
             st.markdown('</div>', unsafe_allow_html=True)
     else:
         st.info("No to-do items yet. Add your first task above!")
 
-def render_action_items_section(agenda_id: str, agenda: dict):
+@st.fragment
+@measure_rerun
+@coalesce_writes
+def render_action_items_section(agenda_id: str):
     """Render the action items section"""
+    # Look the record up on every run, so a fragment rerun sees its latest state
+    agenda = st.session_state.agendas.get(agenda_id)
+    if agenda is None:
+        return
+    show_notifications()
+    
     st.markdown("### 🎯 Action Items")
     
     # Add new action item
     with st.expander("➕ Add New Action Item", expanded=False):
         col1, col2 = st.columns(2)
         with col1:
-            action = st.text_input("Action", key="new_action", placeholder="What needs to be done?")
-            owner = st.text_input("Owner", key="new_action_owner", placeholder="Who is responsible?")
+            st.text_input("Action", key="new_action", placeholder="What needs to be done?")
+            st.text_input("Owner", key="new_action_owner", placeholder="Who is responsible?")
         with col2:
-            due_date = st.date_input("Due Date", key="new_action_due")
-            priority = st.selectbox("Priority", ['low', 'medium', 'high'], index=1, key="new_action_priority")
+            st.date_input("Due Date", key="new_action_due")
+            st.selectbox("Priority", ['low', 'medium', 'high'], index=1, key="new_action_priority")
         
-        if st.button("💾 Save Action Item", key="save_action"):
-            if action.strip() and owner.strip():
-                add_action_item(agenda_id, action.strip(), owner.strip(), due_date, priority)
-                st.success("Action item added!")
-                st.rerun()
-            else:
-                st.warning("Please fill in action and owner")
+        st.button("💾 Save Action Item", key="save_action", on_click=on_save_action_item, args=(agenda_id,))
+    
+    if st.toggle("▦ Grid view", key="actions_grid_mode",
+                 help="Edit all action items in one table and apply them at once"):
+        render_item_grid(agenda_id, agenda, 'action_items')
+        return
     
     # Display existing action items
     if agenda.get('action_items'):
@@ -1167,24 +1859,248 @@ def render_action_items_section(agenda_id: str, agenda: dict):
                 priority_colors = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
                 st.markdown(f"{priority_colors.get(action['priority'], '⚪')} {action['priority'].upper()}")
             with col3:
-                new_status = st.selectbox(
+                # Show the stored status, which an undo or another view may have changed since the last run
+                st.session_state[f"status_{action['id']}"] = action['status']
+                st.selectbox(
                     "Status",
                     ['pending', 'in_progress', 'completed'],
-                    index=['pending', 'in_progress', 'completed'].index(action['status']),
                     key=f"status_{action['id']}",
-                    label_visibility="collapsed"
+                    label_visibility="collapsed",
+                    on_change=on_action_status_change,
+                    args=(agenda_id, action['id'])
                 )
-                if new_status != action['status']:
-                    update_action_status(agenda_id, action['id'], new_status)
-                    st.rerun()
             with col4:
-                if st.button("🗑️", key=f"del_action_{action['id']}", help="Delete"):
-                    delete_item(agenda_id, 'action_items', action['id'])
-                    st.rerun()
+                st.button("🗑️", key=f"del_action_{action['id']}", help="Delete",
+                          on_click=on_delete_item, args=(agenda_id, 'action_items', action['id']))
             st.markdown('</div>', unsafe_allow_html=True)
     else:
         st.info("No action items yet. Add your first action item above!")
 
+def render_item_grid(agenda_id: str, agenda: dict, item_type: str):
+    """Render an agenda's to-dos or action items as one editable grid, applied on submit"""
+    fields = GRID_FIELDS[item_type]
+    rows = [{'id': item['id'], **{field: item.get(field) for field in fields}} for item in agenda[item_type]]
+    frame = pd.DataFrame(rows, columns=['id'] + fields)
+    if 'due_date' in fields:
+        frame['due_date'] = [date.fromisoformat(d) if d else None for d in frame['due_date']]
+    if 'completed' in fields:
+        frame['completed'] = frame['completed'].astype(bool)
+    
+    priorities = st.column_config.SelectboxColumn("Priority", options=['low', 'medium', 'high'], default='medium')
+    columns = {
+        'todos': {
+            'task': st.column_config.TextColumn("Task", required=True, width="large"),
+            'assignee': st.column_config.TextColumn("Assignee"),
+            'priority': priorities,
+            'completed': st.column_config.CheckboxColumn("Done", default=False)
+        },
+        'action_items': {
+            'action': st.column_config.TextColumn("Action", required=True, width="large"),
+            'owner': st.column_config.TextColumn("Owner"),
+            'due_date': st.column_config.DateColumn("Due", format="YYYY-MM-DD"),
+            'priority': priorities,
+            'status': st.column_config.SelectboxColumn("Status", options=['pending', 'in_progress', 'completed'],
+                                                       default='pending')
+        }
+    }[item_type]
+    
+    # Edits stay in the browser until submitted; the key changes with the agenda so a fresh grid follows each apply
+    editor_key = f"{item_type}_grid_{agenda_id}_{agenda['updated_at']}"
+    with st.form(f"{item_type}_grid_form", border=False):
+        st.data_editor(frame, key=editor_key, column_config={'id': None, **columns}, num_rows="dynamic",
+                       hide_index=True, use_container_width=True)
+        st.form_submit_button("💾 Apply changes", type="primary", on_click=on_apply_item_grid,
+                              args=(agenda_id, item_type, editor_key, rows))
+
+@st.fragment
+def render_history_section(agenda_id: str):
+    """Render the revision history of an agenda with a diff between two revisions"""
+    st.markdown("### 🕘 Revision History")
+    
+    history = get_revision_history()
+    revisions = history.revisions(agenda_id)
+    if len(revisions) < 2:
+        st.info("No earlier revisions yet. Every saved change to this agenda is recorded here.")
+        return
+    
+    labels = {r.rev: f"r{r.rev} · {datetime.fromisoformat(r.at).strftime('%Y-%m-%d %H:%M:%S')}"
+                     f"{' · deleted' if r.kind == 'deleted' else ''}" for r in revisions}
+    latest = revisions[-1].rev
+    col1, col2 = st.columns(2)
+    with col1:
+        old_rev = st.selectbox("From", list(labels), index=len(labels) - 2, format_func=labels.get,
+                               key=f"history_from_{agenda_id}")
+    with col2:
+        new_rev = st.selectbox("To", list(labels), index=len(labels) - 1, format_func=labels.get,
+                               key=f"history_to_{agenda_id}")
+    
+    changes = diff_revisions(history.reconstruct(agenda_id, old_rev), history.reconstruct(agenda_id, new_rev))
+    if changes:
+        st.dataframe(changes, use_container_width=True, hide_index=True,
+                     column_config={'field': 'Field', 'change': 'Change', 'before': f"r{old_rev}",
+                                    'after': f"r{new_rev}"})
+    else:
+        st.success("No differences between these revisions.")
+    st.caption(f"{latest + 1} revision(s), stored as field-level deltas with a full copy every "
+               f"{history.keyframe_interval} revisions.")
+
+def render_action_tracker():
+    """Render the cross-agenda action item tracker"""
+    st.markdown('<h1 class="main-title">🎯 Action Item Tracker</h1>', unsafe_allow_html=True)
+    
+    index = st.session_state.action_index
+    today = date.today()
+    counts = index.counts(today)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Open", counts['open'])
+    with col2:
+        st.metric("Overdue", counts['overdue'])
+    with col3:
+        st.metric("Owners", len(index.owners()))
+    
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        owner = st.selectbox("Owner", ['All'] + index.owners(), key="tracker_owner")
+    with col2:
+        bucket = st.selectbox("Show", ['Overdue', 'Upcoming', 'All open', 'All (incl. completed)'], key="tracker_bucket")
+    with col3:
+        days = st.number_input("Upcoming days", min_value=1, max_value=365, value=7, key="tracker_days",
+                               disabled=bucket != 'Upcoming')
+    
+    owner = None if owner == 'All' else owner
+    if bucket == 'Overdue':
+        pairs = index.overdue(today, owner)
+    elif bucket == 'Upcoming':
+        pairs = index.upcoming(today, int(days), owner)
+    else:
+        pairs = index.query(owner, open_only=bucket == 'All open')
+    
+    if not pairs:
+        st.info("📭 No action items match these filters.")
+        return
+    
+    rows = []
+    for agenda_id, action_id in pairs:
+        agenda = st.session_state.agendas[agenda_id]
+        action = next(a for a in agenda['action_items'] if a['id'] == action_id)
+        rows.append({
+            'Due': action['due_date'],
+            'Owner': action['owner'],
+            'Action': action['action'],
+            'Priority': action['priority'],
+            'Status': action['status'].replace('_', ' ').title(),
+            'Agenda': agenda['topic'],
+            'Overdue': bool(action['due_date']) and action['due_date'] < today.isoformat()
+                       and action['status'] != 'completed'
+        })
+    
+    st.caption(f"{len(rows)} action item(s)")
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+def render_conflicts_report():
+    """Render the schedule conflicts report across all agendas"""
+    st.markdown('<h1 class="main-title">⚠️ Schedule Conflicts</h1>', unsafe_allow_html=True)
+    
+    report = st.session_state.schedule_index.conflicts_report()
+    only_double_booked = st.checkbox("Only show presenter double-bookings", value=False)
+    if only_double_booked:
+        report = [c for c in report if c['type'] == 'double_booked']
+    
+    if not report:
+        st.success("✅ No overlapping or double-booked meetings found.")
+        return
+    
+    st.info(f"📊 {len(report)} conflicting pair(s) found")
+    
+    for conflict in report:
+        first = st.session_state.agendas[conflict['first_id']]
+        second = st.session_state.agendas[conflict['second_id']]
+        badge = ('<span class="badge badge-danger">DOUBLE-BOOKED</span>'
+                 if conflict['type'] == 'double_booked'
+                 else '<span class="badge badge-warning">OVERLAP</span>')
+        
+        st.markdown('<div class="item-card">', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            st.markdown(f"{badge} &nbsp; **{first['topic']}** ({first['presenter']}) ↔ "
+                        f"**{second['topic']}** ({second['presenter']})", unsafe_allow_html=True)
+            st.caption(f"🕐 {conflict['overlap_start'].strftime('%Y-%m-%d %H:%M')}"
+                       f"–{conflict['overlap_end'].strftime('%H:%M')}")
+        for col, agenda in ((col2, first), (col3, second)):
+            with col:
+                if st.button(f"📖 {agenda['topic'][:12]}", key=f"conflict_{conflict['first_id']}_{conflict['second_id']}_{agenda['id']}",
+                             use_container_width=True):
+                    st.session_state.current_view = 'detail'
+                    st.session_state.selected_agenda_id = agenda['id']
+                    st.rerun()
+        st.markdown('</div>', unsafe_allow_html=True)
+
+def render_analytics_view():
+    """Render meeting and action item metrics computed over the cached analytics frames"""
+    st.markdown('<h1 class="main-title">📈 Analytics</h1>', unsafe_allow_html=True)
+    
+    frames = get_analytics_frames()
+    agendas, actions, todos = frames['agendas'], frames['actions'], frames['todos']
+    if agendas.empty:
+        st.info("📭 No agendas yet.")
+        return
+    
+    col_period, col_top = st.columns([3, 1])
+    with col_period:
+        period = st.selectbox("Meeting date", list(ANALYTICS_PERIODS), key="analytics_period")
+    with col_top:
+        top = st.number_input("Presenters shown", min_value=1, max_value=20, value=8, key="analytics_top")
+    today = pd.Timestamp(date.today())
+    if ANALYTICS_PERIODS[period]:
+        start = today - pd.Timedelta(days=ANALYTICS_PERIODS[period])
+        agendas = agendas[agendas['date'].between(start, today)]
+        actions = actions[actions['record_date'].between(start, today)]
+        todos = todos[todos['record_date'].between(start, today)]
+    
+    done = actions['status'].eq('completed')
+    stats = analytics.completion(actions, done)
+    overdue = analytics.overdue_by_owner(actions, ~done, 'owner', today=today)
+    todos_done = todos['completed'].fillna(False).astype(bool)
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("Meetings", f"{len(agendas):,}")
+    with col2:
+        st.metric("Action Items", f"{stats['total']:,}")
+    with col3:
+        st.metric("Actions Completed", f"{stats['rate']:.0%}" if stats['rate'] is not None else "—")
+    with col4:
+        median = stats['median_days_to_close']
+        st.metric("Median Days to Close", median if median is not None else "—",
+                  help=f"Over {stats['timed']:,} action item(s) completed since completion times were recorded")
+    with col5:
+        st.metric("Overdue Actions", f"{int(overdue['Overdue'].sum()):,}")
+    
+    st.markdown("### 📅 Meetings per Month")
+    if agendas['date'].notna().any():
+        st.bar_chart(analytics.monthly_counts(agendas, 'date', 'presenter', top=int(top)))
+    else:
+        st.info("No meetings in this period.")
+    
+    col_overdue, col_priority = st.columns(2)
+    with col_overdue:
+        st.markdown("### ⏰ Overdue by Owner")
+        if overdue.empty:
+            st.success("✅ No overdue action items.")
+        else:
+            st.dataframe(overdue.head(25), use_container_width=True, hide_index=True)
+    with col_priority:
+        st.markdown("### 🎯 Action Items by Priority")
+        st.dataframe(analytics.priority_mix(actions, 'priority', done, ['high', 'medium', 'low']),
+                     use_container_width=True, hide_index=True)
+        if len(todos):
+            st.caption(f"✅ {int(todos_done.sum()):,} of {len(todos):,} to-do(s) done ({todos_done.mean():.0%})")
+    
+    st.caption(f"Computed over {len(frames['actions']):,} action item(s) and {len(frames['todos']):,} to-do(s); "
+               f"flattened {st.session_state.analytics_cache.builds} time(s) this session.")
+
 def render_email_modal(agenda: dict):
     """Render the email sending modal"""
     st.markdown("---")
@@ -1318,15 +2234,54 @@ def render_email_settings():
             placeholder="team.member1@company.com\nteam.member2@company.com"
         )
         
+        st.markdown("---")
+        st.markdown("### 🔔 Action Item Reminders")
+        st.markdown("Email owners about action items that are due soon or overdue. "
+                    "Owners are matched to the distribution list by name (e.g. *Alice Smith* → alice.smith@...).")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            reminders_enabled = st.checkbox(
+                "Send reminder emails",
+                value=st.session_state.email_settings.get('reminders_enabled', False)
+            )
+        with col2:
+            reminder_lead_days = st.number_input(
+                "Remind this many days before due",
+                value=st.session_state.email_settings.get('reminder_lead_days', 1),
+                min_value=0,
+                max_value=30
+            )
+        
         if st.form_submit_button("💾 Save Settings", use_container_width=True, type="primary"):
             st.session_state.email_settings = {
                 'smtp_server': smtp_server,
                 'smtp_port': smtp_port,
                 'sender_email': sender_email,
                 'sender_password': sender_password,
-                'distribution_list': [e.strip() for e in distribution_list.split('\n') if e.strip()]
+                'distribution_list': [e.strip() for e in distribution_list.split('\n') if e.strip()],
+                'reminders_enabled': reminders_enabled,
+                'reminder_lead_days': int(reminder_lead_days)
             }
+            get_reminder_scheduler(data_file()).configure(
+                st.session_state.email_settings,
+                enabled=reminders_enabled and bool(smtp_server and sender_email and sender_password),
+                lead_days=int(reminder_lead_days)
+            )
             st.success("✅ Settings saved successfully!")
+            if reminders_enabled and not (smtp_server and sender_email and sender_password):
+                st.warning("Reminders stay paused until the SMTP server, sender email and app password are set.")
+    
+    scheduler = get_reminder_scheduler(data_file())
+    next_due = scheduler.next_due()
+    st.caption(
+        f"🔔 Reminders {'active' if scheduler.enabled else 'paused'} · "
+        f"{scheduler.pending()} open item(s) scheduled · "
+        f"next: {next_due.strftime('%Y-%m-%d %H:%M') if next_due else '—'} · "
+        f"{scheduler.sent_count} email(s) sent"
+    )
+    if scheduler.last_error:
+        st.warning(scheduler.last_error)
 
 def render_import_export():
     """Render import/export page"""
@@ -1374,11 +2329,193 @@ def render_import_export():
                         st.error(message)
             except Exception as e:
                 st.error(f"Error reading file: {str(e)}")
+    
+    st.markdown("---")
+    st.markdown("### 🗄️ Backups")
+    scheduler = get_backup_scheduler(data_file())
+    st.markdown(f"An incremental snapshot is taken every {scheduler.interval // 60:.0f} minutes. Only agendas "
+                "changed since the last snapshot are stored, and attachments are stored once however many "
+                f"snapshots share them. The newest {scheduler.keep_last} snapshots and one per day for "
+                f"{scheduler.keep_daily} days are kept.")
+    if scheduler.last_error:
+        st.error(scheduler.last_error)
+    
+    snapshots = backup.list_snapshots(data_file())
+    if snapshots:
+        st.dataframe([{
+            'Snapshot': s['name'],
+            'Taken': s['taken_at'][:19].replace('T', ' '),
+            'Agendas': len(s['agendas']),
+            'Changed': s['changed'],
+            'Removed': s['removed'],
+            'Bytes written': s['bytes_written']
+        } for s in reversed(snapshots)], use_container_width=True, hide_index=True)
+        st.caption("Restore one with `python agenda_cli.py restore --snapshot <name>` "
+                   "or `--at YYYY-MM-DDTHH:MM`; add `--to <file>` to restore into a copy.")
+    else:
+        st.info("No backups yet.")
+    
+    if st.button("🗄️ Back up now", key="backup_now"):
+        scheduler.trigger()
+        st.toast("Backup started in the background")
+    
+    st.markdown("---")
+    st.markdown("### 🧊 Archive")
+    if archive.ARCHIVE_AFTER is None:
+        st.info("Archiving is turned off (`archive.ARCHIVE_AFTER = None`).")
+        return
+    st.markdown(f"Completed agendas whose meeting and last change are more than {archive.ARCHIVE_AFTER.days} days "
+                "old are moved out of the data file into compressed, read-only monthly segments when a session "
+                "loads. Tick **🧊 Include archived** next to the list's search box to search them.")
+    summary = archive.stats(data_file())
+    if summary['segments']:
+        st.caption(f"{summary['agendas']} agenda(s) in {summary['segments']} segment(s), "
+                   f"{summary['bytes']:,} bytes compressed from {summary['raw_bytes']:,}")
+    if st.button("🧊 Archive now", key="archive_now"):
+        moved = archive_now()
+        st.toast(f"Archived {moved} agenda(s)" if moved else "Nothing is old enough to archive")
+        st.rerun()
+
+def render_templates_view():
+    """Render the agenda templates with their usage and delete controls"""
+    st.markdown('<h1 class="main-title">📑 Templates</h1>', unsafe_allow_html=True)
+    st.caption("Save an agenda as a template from its detail page. Agendas created from a template "
+               "share its links, attachments and topic image and only store what they change.")
+    
+    templates = load_templates()
+    if not templates:
+        st.info("📑 No templates yet.")
+        return
+    
+    usage = store.template_usage(st.session_state.agendas)
+    for template_id, template in sorted(templates.items(), key=lambda kv: kv[1]['name'].lower()):
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            st.markdown(f"**{template['name']}** — {template['topic']} · {template['presenter']}")
+            st.caption(f"{len(template['urls'])} link(s) · {len(template['attachments'])} attachment(s) · "
+                       f"{'image' if template['topic_image'] else 'no image'} · "
+                       f"used by {usage.get(template_id, 0)} agenda(s)")
+        with col2:
+            if st.button("➕ New agenda", key=f"use_template_{template_id}", use_container_width=True):
+                st.session_state.template_choice = template_id
+                st.session_state.current_view = 'create'
+                st.rerun()
+        with col3:
+            if st.button("🗑️ Delete", key=f"delete_template_{template_id}", use_container_width=True,
+                         help="Agendas created from it keep their own copy of its content"):
+                detached = delete_template(template_id)
+                st.toast(f"Deleted template '{template['name']}'"
+                         + (f"; {detached} agenda(s) now store their own copy" if detached else ""))
+                st.rerun()
+
+def render_workspaces_view():
+    """Render every workspace's summary, a search across all of them and workspace creation"""
+    st.markdown('<h1 class="main-title">🏢 Workspaces</h1>', unsafe_allow_html=True)
+    st.caption("Each workspace keeps its agendas, templates, trash, history and backups in its own "
+               "data file. This page reads all of them; the rest of the app only loads the current one.")
+    
+    summaries = store.fan_out(lambda name, agendas: store.summarize_agendas(agendas))
+    st.dataframe([{'Workspace': name + (' (current)' if name == st.session_state.workspace else ''),
+                   'Agendas': s['agendas'], 'Scheduled': s['scheduled'], 'Completed': s['completed'],
+                   'Open actions': s['open_actions'], 'Overdue actions': s['overdue_actions'],
+                   'Last updated': s['last_updated'][:16].replace('T', ' ')}
+                  for name, s in summaries.items()],
+                 hide_index=True, use_container_width=True)
+    
+    st.markdown("### 🔍 Search all workspaces")
+    search = st.text_input("Topic or presenter", key="workspace_search")
+    if search:
+        matches = search_workspaces(search)
+        if matches:
+            st.dataframe(matches, hide_index=True, use_container_width=True)
+        else:
+            st.info("No agendas match in any workspace.")
+    
+    st.markdown("### ➕ New workspace")
+    with st.form("create_workspace_form", clear_on_submit=True):
+        name = st.text_input("Name", help="Lowercase letters, digits, '-' and '_'")
+        if st.form_submit_button("Create and switch", type="primary"):
+            try:
+                store.create_workspace(name.strip())
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                switch_workspace(name.strip())
+                st.rerun()
+
+def render_trash_view():
+    """Render deleted agendas and items with restore and purge controls"""
+    st.markdown('<h1 class="main-title">🗑️ Trash</h1>', unsafe_allow_html=True)
+    st.caption(f"Deleted agendas and items are kept for {trash.RETENTION.days} days, then purged "
+               "in the background along with their revision history.")
+    
+    bin_ = trash.load_trash(data_file())
+    if not bin_['agendas'] and not bin_['items']:
+        st.info("🗑️ The trash is empty.")
+    
+    if bin_['agendas']:
+        st.markdown("### 📋 Agendas")
+    for agenda_id, entry in sorted(bin_['agendas'].items(), key=lambda kv: kv[1]['deleted_at'], reverse=True):
+        agenda = entry['agenda']
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            st.markdown(f"**{agenda['topic']}** — {agenda['date']}")
+            st.caption(f"Deleted {entry['deleted_at'][:16].replace('T', ' ')} · "
+                       f"purged after {trash.expires_on(entry).strftime('%Y-%m-%d')}")
+        with col2:
+            if st.button("♻️ Restore", key=f"restore_agenda_{agenda_id}", use_container_width=True):
+                if restore_from_trash(agenda_id=agenda_id):
+                    st.toast(f"Restored '{agenda['topic']}'")
+                else:
+                    st.toast("An agenda with this ID already exists")
+                st.rerun()
+        with col3:
+            if st.button("❌ Delete forever", key=f"purge_agenda_{agenda_id}", use_container_width=True):
+                purge_from_trash('agendas', agenda_id)
+                st.rerun()
+    
+    if bin_['items']:
+        st.markdown("### 📝 Items")
+    for item_id, entry in sorted(bin_['items'].items(), key=lambda kv: kv[1]['deleted_at'], reverse=True):
+        item = entry['item']
+        parent = st.session_state.agendas.get(entry['agenda_id'])
+        text = item.get('content') or item.get('task') or item.get('action', '')
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            st.markdown(f"**{ITEM_LABELS[entry['item_type']].capitalize()}:** {text}")
+            where = f"from '{parent['topic']}'" if parent else "from a deleted agenda"
+            st.caption(f"{where} · deleted {entry['deleted_at'][:16].replace('T', ' ')} · "
+                       f"purged after {trash.expires_on(entry).strftime('%Y-%m-%d')}")
+        with col2:
+            if st.button("♻️ Restore", key=f"restore_item_{item_id}", use_container_width=True,
+                         disabled=parent is None, help=None if parent else "Restore its agenda first"):
+                restore_from_trash(item_id=item_id)
+                st.toast(f"Restored {ITEM_LABELS[entry['item_type']]}")
+                st.rerun()
+        with col3:
+            if st.button("❌ Delete forever", key=f"purge_item_{item_id}", use_container_width=True):
+                purge_from_trash('items', item_id)
+                st.rerun()
+    
+    st.markdown("---")
+    compactor = get_compactor(data_file())
+    if compactor.last_error:
+        st.error(compactor.last_error)
+    elif compactor.last_run:
+        st.caption(f"Last compaction {compactor.last_run.strftime('%Y-%m-%d %H:%M')}: "
+                   f"{compactor.last_result['tombstones']} expired tombstone(s), "
+                   f"{compactor.last_result['history_bytes']:,} byte(s) of history reclaimed")
+    if st.button("🧹 Run compaction now", key="compact_now"):
+        compactor.trigger()
+        st.toast("Compaction started in the background")
 
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
 
+@profile_rerun
+@measure_rerun
+@coalesce_writes
 def main():
     """Main application entry point"""
     init_session_state()
@@ -1393,12 +2530,26 @@ def main():
         render_agenda_form()
     elif view == 'detail' and st.session_state.selected_agenda_id:
         render_agenda_detail(st.session_state.selected_agenda_id)
+    elif view == 'actions':
+        render_action_tracker()
+    elif view == 'conflicts':
+        render_conflicts_report()
+    elif view == 'analytics':
+        render_analytics_view()
     elif view == 'settings':
         render_email_settings()
     elif view == 'import_export':
         render_import_export()
+    elif view == 'templates':
+        render_templates_view()
+    elif view == 'trash':
+        render_trash_view()
+    elif view == 'workspaces':
+        render_workspaces_view()
     else:
         render_agenda_list()
+    
+    check_memory_budget()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,203 @@
+"""
+Memory Usage - deep size accounting of session state and decoded payloads
+Every session holds its own copy of the records, so RAM grows with sessions
+times dataset size. The accountant walks a session's state and reports its
+deep size per session-state key, per record and per field category
+(attachments, images, notes, ...). Record sizes are cached against the
+record's change stamp, so re-measuring an unchanged dataset costs one dict
+lookup per record. Each measurement is also published to a process-wide
+table, so the diagnostics view can compare sessions.
+
+Decoded base64 payloads are kept in a small per-session LRU cache instead
+of being decoded on every rerun; it is the first thing given back when a
+session exceeds MEMORY_BUDGET_MB.
+"""
+
+import base64
+import sys
+import threading
+import time
+import types
+import uuid
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional
+
+MEMORY_BUDGET_MB: Optional[float] = None    # per session; None disables the check
+BUDGET_ACTION = 'evict'                     # 'warn' or 'evict' decoded payloads first
+MEASURE_INTERVAL = 30                       # seconds between budget checks of one session
+DECODED_CACHE_MB = 32                       # per-session cap on cached decoded payloads
+SESSION_TTL = 3600                          # drop sessions not measured for this long
+
+# Walked as a single object: following these leads out of session state into the interpreter
+_OPAQUE = (types.ModuleType, type, types.FunctionType, types.MethodType, types.BuiltinFunctionType,
+           threading.Thread)
+
+def deep_size(obj, seen: Optional[set] = None) -> int:
+    """Bytes held by `obj` and everything it references that `seen` has not counted yet"""
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj, 0)
+        if obj is None or isinstance(obj, (str, bytes, int, float, PayloadCache)) or isinstance(obj, _OPAQUE):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        else:
+            if hasattr(obj, '__dict__'):
+                stack.append(vars(obj))
+            for slot in getattr(type(obj), '__slots__', ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return size
+
+def _mb(nbytes: int) -> float:
+    return round(nbytes / 1e6, 2)
+
+# ============================================================================
+# DECODED PAYLOADS
+# ============================================================================
+
+class PayloadCache:
+    """A session's decoded base64 payloads, least recently used first"""
+
+    def __init__(self, max_bytes: int = DECODED_CACHE_MB * 1_000_000):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items: 'OrderedDict[str, bytes]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __sizeof__(self) -> int:
+        # The keys are the encoded strings the records already hold
+        return object.__sizeof__(self) + sys.getsizeof(self._items) + self.nbytes
+
+    def decode(self, encoded: str) -> bytes:
+        """The decoded payload, from the cache when this exact string was decoded before"""
+        data = self._items.get(encoded)
+        if data is not None:
+            self._items.move_to_end(encoded)
+            self.hits += 1
+            return data
+        self.misses += 1
+        data = base64.b64decode(encoded)
+        if len(data) <= self.max_bytes:
+            self._items[encoded] = data
+            self.nbytes += len(data)
+            self.evict(self.nbytes - self.max_bytes)
+        return data
+
+    def evict(self, nbytes: Optional[int] = None) -> int:
+        """Drop least recently used payloads until `nbytes` are freed (all of them by default)"""
+        freed = 0
+        while self._items and (nbytes is None or freed < nbytes):
+            _, data = self._items.popitem(last=False)
+            freed += len(data)
+        self.nbytes -= freed
+        return freed
+
+# ============================================================================
+# ACCOUNTING
+# ============================================================================
+
+_sessions: Dict[str, Dict] = {}
+_sessions_lock = threading.Lock()
+
+def publish(session_key: str, report: Dict) -> None:
+    """Record a session's latest measurement in the process-wide table"""
+    with _sessions_lock:
+        _sessions[session_key] = {'total': report['total'], 'records': report['records'],
+                                  'measured_at': report['measured_at']}
+
+def session_table() -> List[Dict]:
+    """The latest measurement of every live session in this process, largest first"""
+    cutoff = time.time() - SESSION_TTL
+    with _sessions_lock:
+        for key in [key for key, entry in _sessions.items() if entry['measured_at'] < cutoff]:
+            del _sessions[key]
+        entries = sorted(_sessions.items(), key=lambda kv: -kv[1]['total'])
+    return [{'Session': key, 'Records': entry['records'], 'MB': _mb(entry['total']),
+             'Measured': time.strftime('%H:%M:%S', time.localtime(entry['measured_at']))}
+            for key, entry in entries]
+
+class MemoryAccountant:
+    """Deep size of one session's state, split by key, record and field category"""
+
+    def __init__(self, categories: Dict[str, str], stamp_field: Optional[str] = None):
+        self.categories = categories
+        self.stamp_field = stamp_field
+        self.key = uuid.uuid4().hex[:8]
+        self.last_report: Optional[Dict] = None
+        self._records: Dict[str, tuple] = {}
+
+    def _measure_record(self, record: dict) -> tuple:
+        by_category: Dict[str, int] = {}
+        seen = {id(record)}
+        total = sys.getsizeof(record, 0)
+        for field, value in record.items():
+            category = self.categories.get(field, 'fields')
+            nbytes = deep_size(field, seen) + deep_size(value, seen)
+            by_category[category] = by_category.get(category, 0) + nbytes
+            total += nbytes
+        return total, by_category
+
+    def measure(self, records: Dict[str, dict], state: Dict[str, object], records_key: str) -> Dict:
+        """Measure `records` (cached by change stamp) and the rest of `state` in one report"""
+        by_record: Dict[str, int] = {}
+        by_category: Dict[str, int] = {}
+        cache = {}
+        for record_id, record in records.items():
+            stamp = record.get(self.stamp_field) if self.stamp_field else None
+            cached = self._records.get(record_id)
+            if stamp is None or cached is None or cached[0] != stamp:
+                cached = (stamp,) + self._measure_record(record)
+            cache[record_id] = cached
+            by_record[record_id] = cached[1]
+            for category, nbytes in cached[2].items():
+                by_category[category] = by_category.get(category, 0) + nbytes
+        self._records = cache
+
+        # Other keys that reference the records (write-behind buffers, snapshots) are not counted twice
+        seen = {id(records)} | {id(record) for record in records.values()}
+        by_key = {records_key: sys.getsizeof(records, 0) + sum(by_record.values())}
+        for key, value in state.items():
+            if key != records_key:
+                by_key[key] = deep_size(value, seen)
+
+        self.last_report = {
+            'total': sum(by_key.values()),
+            'records': len(records),
+            'by_key': by_key,
+            'by_record': by_record,
+            'by_category': by_category,
+            'measured_at': time.time()
+        }
+        publish(self.key, self.last_report)
+        return self.last_report
+
+    def due(self, interval: float = MEASURE_INTERVAL) -> bool:
+        """Whether the last measurement is older than `interval` seconds"""
+        return self.last_report is None or time.time() - self.last_report['measured_at'] >= interval
+
+def over_budget(report: Dict, budget_mb: Optional[float] = None) -> int:
+    """Bytes by which a report exceeds the budget, or 0"""
+    budget_mb = MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+    if budget_mb is None:
+        return 0
+    return max(0, report['total'] - int(budget_mb * 1_000_000))
+
+def rows(sizes: Dict[str, int], label: str, names: Optional[Dict[str, str]] = None,
+         limit: Optional[int] = None) -> List[Dict]:
+    """A {name: bytes} breakdown as table rows, largest first"""
+    ordered = sorted(sizes.items(), key=lambda kv: -kv[1])[:limit]
+    return [{label: (names or {}).get(key, key), 'MB': _mb(nbytes)} for key, nbytes in ordered]
@@ -0,0 +1,301 @@
+"""
+Reminder Scheduler - background emails for due and overdue action items
+A single daemon thread keeps a min-heap of upcoming reminder times and sleeps
+until the earliest one is due. When it wakes, every reminder that has come
+due is grouped by owner and sent over one SMTP connection.
+"""
+
+import heapq
+import smtplib
+import threading
+from datetime import date, datetime, time, timedelta
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Callable, Dict, List, Optional, Tuple
+
+from instrumentation import timed
+
+REMINDER_TIME = time(8, 0)
+RETRY_DELAY = timedelta(minutes=15)
+
+# ============================================================================
+# OWNER RESOLUTION & MESSAGE BUILDING
+# ============================================================================
+
+def _name_tokens(text: str) -> List[str]:
+    return [t for t in ''.join(c if c.isalnum() else ' ' for c in text.lower()).split() if t]
+
+def resolve_owner_email(owner: str, distribution_list: List[str]) -> Optional[str]:
+    """Map an action item owner to an address from the distribution list
+
+    Owners that are already email addresses are used as-is; otherwise the
+    owner's name is matched against the local part of each address
+    (e.g. "Alice Smith" -> alice.smith@company.com).
+    """
+    owner = (owner or '').strip()
+    if '@' in owner:
+        return owner
+    wanted = _name_tokens(owner)
+    if not wanted:
+        return None
+    for address in distribution_list:
+        local = _name_tokens(address.split('@')[0])
+        if local == wanted or ''.join(local) == ''.join(wanted):
+            return address
+    if len(wanted) == 1:
+        for address in distribution_list:
+            local = _name_tokens(address.split('@')[0])
+            if local and local[0] == wanted[0]:
+                return address
+    return None
+
+def build_reminder_message(sender: str, recipient: str, owner: str, reminders: List[dict]) -> MIMEMultipart:
+    """Build one email listing every reminder for an owner"""
+    overdue = [r for r in reminders if r['kind'] == 'overdue']
+    upcoming = [r for r in reminders if r['kind'] == 'upcoming']
+
+    msg = MIMEMultipart('alternative')
+    msg['From'] = sender
+    msg['To'] = recipient
+    msg['Subject'] = (f"Action item reminder: {len(overdue)} overdue, {len(upcoming)} due soon"
+                      if overdue else f"Action item reminder: {len(upcoming)} due soon")
+
+    plain_lines = [f"Hi {owner},", ""]
+    html = f'<div style="font-family: \'Segoe UI\', Arial, sans-serif; color: #1e293b;"><p>Hi {owner},</p>'
+    for title, items in (("Overdue", overdue), ("Due soon", upcoming)):
+        if not items:
+            continue
+        plain_lines.append(f"{title}:")
+        html += f'<h3 style="color: #1e40af;">{title}</h3><table style="border-collapse: collapse;">'
+        html += '<tr><th align="left">Action</th><th align="left">Meeting</th><th align="left">Due</th></tr>'
+        for r in sorted(items, key=lambda r: r['due_date']):
+            plain_lines.append(f"  - {r['action']} ({r['topic']}) due {r['due_date']}")
+            html += (f'<tr><td style="padding: 4px 12px 4px 0;">{r["action"]}</td>'
+                     f'<td style="padding: 4px 12px 4px 0;">{r["topic"]}</td>'
+                     f'<td style="padding: 4px 0;">{r["due_date"]}</td></tr>')
+        plain_lines.append("")
+        html += '</table>'
+    html += '<p style="color: #64748b;">Sent by Meeting Agenda &amp; Note Manager</p></div>'
+
+    msg.attach(MIMEText('\n'.join(plain_lines), 'plain'))
+    msg.attach(MIMEText(html, 'html'))
+    return msg
+
+@timed('smtp.send')
+def send_batch(messages: List[MIMEMultipart], smtp_server: str, smtp_port: int,
+               sender_email: str, sender_password: str) -> None:
+    """Send several messages over a single SMTP connection"""
+    with smtplib.SMTP(smtp_server, smtp_port) as server:
+        server.starttls()
+        server.login(sender_email, sender_password)
+        for msg in messages:
+            server.send_message(msg)
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+class ReminderScheduler:
+    """Min-heap of reminder times served by one sleeping background thread
+
+    Heap entries are (remind_at, seq, action_id, kind, version). Changing an
+    item bumps its version and pushes fresh entries; superseded entries are
+    discarded lazily when they reach the top, and the heap is re-heapified in
+    O(n) once stale entries outnumber live ones.
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = datetime.now,
+                 sender: Callable[..., None] = send_batch):
+        self._clock = clock
+        self._sender = sender
+        self._cond = threading.Condition()
+        self._heap: List[Tuple] = []
+        self._seq = 0
+        self._live: Dict[str, dict] = {}
+        self._sent = set()
+        self._settings: Dict = {}
+        self._lead_days = 1
+        self._enabled = False
+        self._thread: Optional[threading.Thread] = None
+        self.last_run: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.sent_count = 0
+
+    # -- configuration -------------------------------------------------------
+
+    def configure(self, email_settings: Dict, enabled: bool, lead_days: int = 1) -> None:
+        """Apply SMTP settings and reminder options, rescheduling if the lead time changed"""
+        with self._cond:
+            self._settings = dict(email_settings)
+            self._enabled = enabled
+            if lead_days != self._lead_days:
+                self._lead_days = lead_days
+                self._reheapify()
+            self._cond.notify()
+        if enabled:
+            self.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def lead_days(self) -> int:
+        return self._lead_days
+
+    def start(self) -> None:
+        """Start the background thread if it is not already running"""
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="reminder-scheduler", daemon=True)
+                self._thread.start()
+
+    # -- maintenance ---------------------------------------------------------
+
+    def _entries_for(self, action_id: str, item: dict) -> List[Tuple]:
+        try:
+            due = date.fromisoformat(item['due_date'])
+        except (TypeError, ValueError):
+            return []
+        entries = []
+        for kind, day in (('upcoming', due - timedelta(days=self._lead_days)),
+                          ('overdue', due + timedelta(days=1))):
+            if (action_id, kind, item['due_date']) in self._sent:
+                continue
+            self._seq += 1
+            entries.append((datetime.combine(day, REMINDER_TIME), self._seq, action_id, kind, item['version']))
+        return entries
+
+    def _reheapify(self) -> None:
+        self._heap = [e for a, item in self._live.items() for e in self._entries_for(a, item)]
+        heapq.heapify(self._heap)
+
+    def rebuild(self, agendas: Dict) -> None:
+        """Replace the schedule with every open action item in the store (O(n))"""
+        with self._cond:
+            self._live = {}
+            for agenda in agendas.values():
+                for action in agenda.get('action_items', []):
+                    if action.get('status') != 'completed' and action.get('due_date'):
+                        self._live[action['id']] = self._item(agenda, action, 0)
+            self._reheapify()
+            self._cond.notify()
+
+    def _item(self, agenda: dict, action: dict, version: int) -> dict:
+        return {
+            'topic': agenda['topic'],
+            'action': action['action'],
+            'owner': action['owner'],
+            'due_date': action['due_date'],
+            'version': version
+        }
+
+    def schedule(self, agenda: dict, action: dict) -> None:
+        """(Re)schedule reminders for one action item, or cancel them if it is closed"""
+        if action.get('status') == 'completed' or not action.get('due_date'):
+            self.cancel(action['id'])
+            return
+        with self._cond:
+            previous = self._live.get(action['id'])
+            item = self._item(agenda, action, previous['version'] + 1 if previous else 0)
+            self._live[action['id']] = item
+            for entry in self._entries_for(action['id'], item):
+                heapq.heappush(self._heap, entry)
+            self._cond.notify()
+
+    def cancel(self, action_id: str) -> None:
+        """Stop reminding about an action item"""
+        with self._cond:
+            if self._live.pop(action_id, None) is not None and len(self._heap) > 2 * len(self._live) + 64:
+                self._reheapify()
+
+    def cancel_agenda(self, agenda: dict) -> None:
+        """Stop reminding about every action item of an agenda"""
+        for action in agenda.get('action_items', []):
+            self.cancel(action['id'])
+
+    def next_due(self) -> Optional[datetime]:
+        """Return the earliest pending reminder time"""
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._live)
+
+    # -- worker --------------------------------------------------------------
+
+    def _drop_stale(self) -> None:
+        while self._heap:
+            _, _, action_id, _, version = self._heap[0]
+            item = self._live.get(action_id)
+            if item is not None and item['version'] == version:
+                return
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now: datetime) -> List[dict]:
+        due = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            _, _, action_id, kind, _ = heapq.heappop(self._heap)
+            item = self._live[action_id]
+            # Upcoming reminders that were only discovered after the item fell due are skipped
+            if kind == 'upcoming' and item['due_date'] < now.date().isoformat():
+                continue
+            due.append(dict(item, action_id=action_id, kind=kind))
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._drop_stale()
+                now = self._clock()
+                if not self._enabled or not self._heap:
+                    self._cond.wait()
+                    continue
+                wait = (self._heap[0][0] - now).total_seconds()
+                if wait > 0:
+                    self._cond.wait(timeout=wait)
+                    continue
+                batch = self._pop_due(now)
+                settings = dict(self._settings)
+            if batch:
+                self._deliver(batch, settings)
+
+    def _deliver(self, batch: List[dict], settings: Dict) -> None:
+        by_owner: Dict[str, List[dict]] = {}
+        for reminder in batch:
+            by_owner.setdefault(reminder['owner'], []).append(reminder)
+
+        messages, delivered, unresolved = [], [], []
+        for owner, reminders in by_owner.items():
+            recipient = resolve_owner_email(owner, settings.get('distribution_list', []))
+            if recipient is None:
+                unresolved.append(owner)
+                continue
+            messages.append(build_reminder_message(settings.get('sender_email', ''), recipient, owner, reminders))
+            delivered.extend(reminders)
+
+        self.last_run = self._clock()
+        try:
+            if messages:
+                self._sender(messages, settings.get('smtp_server', ''), int(settings.get('smtp_port', 587)),
+                             settings.get('sender_email', ''), settings.get('sender_password', ''))
+        except Exception as e:
+            self.last_error = f"Error sending reminders: {e}"
+            with self._cond:
+                retry_at = self._clock() + RETRY_DELAY
+                for r in delivered:
+                    item = self._live.get(r['action_id'])
+                    if item is not None:
+                        self._seq += 1
+                        heapq.heappush(self._heap, (retry_at, self._seq, r['action_id'], r['kind'], item['version']))
+            return
+
+        with self._cond:
+            for r in delivered:
+                self._sent.add((r['action_id'], r['kind'], r['due_date']))
+        self.sent_count += len(messages)
+        self.last_error = (f"No email address for: {', '.join(sorted(unresolved))}" if unresolved else None)
@@ -0,0 +1,355 @@
+"""
+Revision History - per-agenda version history as field-level deltas
+Every save appends one line per changed agenda to an append-only JSON Lines
+file next to the data file. Most lines are deltas: changed top-level fields
+plus changed, removed or reordered notes, to-dos and action items. Every
+`keyframe_interval`-th revision of an agenda is a full copy, so any revision
+is rebuilt from the nearest keyframe with at most `keyframe_interval - 1`
+deltas.
+
+    python revision_history.py stats
+    python revision_history.py log <agenda_id>
+"""
+
+import copy
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, List, NamedTuple, Optional, Set
+
+KEYFRAME_INTERVAL = 10
+
+# Agenda fields holding lists of child items that are diffed item by item
+ITEM_LISTS = ('notes', 'todos', 'action_items')
+
+class Revision(NamedTuple):
+    agenda_id: str
+    rev: int
+    at: str
+    updated_at: Optional[str]
+    kind: str           # 'keyframe', 'delta' or 'deleted'
+    size: int           # bytes a full copy of this revision would take
+    offset: int
+    length: int
+
+# ============================================================================
+# DELTAS
+# ============================================================================
+
+def _ids(items: List[dict]) -> List[str]:
+    return [item['id'] for item in items]
+
+def _apply_items(items: List[dict], change: dict) -> List[dict]:
+    removed = set(change.get('del', ()))
+    result = [item for item in items if item['id'] not in removed]
+    positions = {item['id']: pos for pos, item in enumerate(result)}
+    for item in change.get('put', ()):
+        if item['id'] in positions:
+            result[positions[item['id']]] = item
+        else:
+            positions[item['id']] = len(result)
+            result.append(item)
+    if 'order' in change:
+        by_id = {item['id']: item for item in result}
+        result = [by_id[item_id] for item_id in change['order'] if item_id in by_id]
+    return result
+
+def make_delta(old: dict, new: dict) -> dict:
+    """Field-level delta turning `old` into `new`; child lists are diffed by item ID"""
+    delta: Dict = {}
+    for key, value in new.items():
+        if key in ITEM_LISTS and isinstance(value, list):
+            before = old.get(key) or []
+            before_by_id = {item['id']: item for item in before}
+            new_ids = set(_ids(value))
+            change = {}
+            removed = [item_id for item_id in _ids(before) if item_id not in new_ids]
+            changed = [item for item in value if before_by_id.get(item['id']) != item]
+            if removed:
+                change['del'] = removed
+            if changed:
+                change['put'] = changed
+            if _ids(_apply_items(before, change)) != _ids(value):
+                change['order'] = _ids(value)
+            if change:
+                delta.setdefault('items', {})[key] = change
+        elif key not in old or old[key] != value:
+            delta.setdefault('set', {})[key] = value
+    unset = [key for key in old if key not in new]
+    if unset:
+        delta['unset'] = unset
+    return delta
+
+def apply_delta(state: dict, delta: dict) -> dict:
+    """Return a new agenda dict with a delta applied (the input is not modified)"""
+    result = dict(state)
+    result.update(delta.get('set', {}))
+    for key in delta.get('unset', ()):
+        result.pop(key, None)
+    for key, change in delta.get('items', {}).items():
+        result[key] = _apply_items(result.get(key) or [], change)
+    return result
+
+def _describe_item(item: dict) -> str:
+    for field in ('content', 'task', 'action'):
+        if field in item:
+            text = str(item[field])
+            return text if len(text) <= 60 else text[:57] + '...'
+    return item.get('id', '')
+
+def _short(value) -> str:
+    if isinstance(value, dict) and 'data' in value:
+        return f"{value.get('name', 'file')} ({len(value['data']) * 3 // 4 // 1024} KB)"
+    if isinstance(value, list):
+        return f"{len(value)} entr{'y' if len(value) == 1 else 'ies'}"
+    return '' if value is None else str(value)
+
+def diff(old: Optional[dict], new: Optional[dict]) -> List[dict]:
+    """Human-readable changes between two revisions of an agenda"""
+    old, new = old or {}, new or {}
+    rows = []
+    delta = make_delta(old, new)
+    for key, value in delta.get('set', {}).items():
+        if key == 'updated_at':
+            continue
+        rows.append({'field': key, 'change': 'added' if key not in old else 'changed',
+                     'before': _short(old.get(key)), 'after': _short(value)})
+    for key in delta.get('unset', ()):
+        rows.append({'field': key, 'change': 'removed', 'before': _short(old[key]), 'after': ''})
+    for key, change in delta.get('items', {}).items():
+        before_by_id = {item['id']: item for item in old.get(key) or []}
+        for item_id in change.get('del', ()):
+            rows.append({'field': key, 'change': 'removed', 'before': _describe_item(before_by_id[item_id]),
+                         'after': ''})
+        for item in change.get('put', ()):
+            previous = before_by_id.get(item['id'])
+            if previous is None:
+                rows.append({'field': key, 'change': 'added', 'before': '', 'after': _describe_item(item)})
+                continue
+            for field, value in item.items():
+                if previous.get(field) != value:
+                    rows.append({'field': f"{key} › {_describe_item(previous)} › {field}", 'change': 'changed',
+                                 'before': _short(previous.get(field)), 'after': _short(value)})
+        if 'order' in change and not change.get('put') and not change.get('del'):
+            rows.append({'field': key, 'change': 'reordered', 'before': '', 'after': ''})
+    return rows
+
+# ============================================================================
+# HISTORY FILE
+# ============================================================================
+
+def history_path(data_file: Path) -> Path:
+    """History file kept next to a data file (agendas_data.json -> agendas_data_history.jsonl)"""
+    data_file = Path(data_file)
+    return data_file.with_name(f"{data_file.stem}_history.jsonl")
+
+class RevisionHistory:
+    """Append-only revision log with an in-memory index of line offsets
+
+    Only the index (one small tuple per revision) and the latest state of
+    agendas recorded by this process are held in memory; revision payloads
+    are read back from disk on demand. Lines appended by other processes are
+    picked up on the next call.
+    """
+
+    def __init__(self, path: Path, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.path = Path(path)
+        self.keyframe_interval = keyframe_interval
+        self._index: Dict[str, List[Revision]] = {}
+        self._heads: Dict[str, Optional[dict]] = {}
+        self._read_offset = 0
+        self._inode: Optional[int] = None
+        # Guards the index and heads; always taken after the data file lock, never before
+        self._mutex = threading.RLock()
+
+    # -- reading -------------------------------------------------------------
+
+    def sync(self) -> None:
+        """Index lines appended since the last call"""
+        with self._mutex:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                return
+            if stat.st_ino != self._inode or stat.st_size < self._read_offset:
+                # First read, or the file was rewritten by compact(): index it from scratch
+                self._index, self._heads, self._read_offset = {}, {}, 0
+                self._inode = stat.st_ino
+            with open(self.path, 'rb') as f:
+                f.seek(self._read_offset)
+                offset = self._read_offset
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # partially written line; pick it up next time
+                    entry = json.loads(line)
+                    kind = 'keyframe' if 'keyframe' in entry else 'deleted' if entry.get('deleted') else 'delta'
+                    revision = Revision(entry['agenda_id'], entry['rev'], entry['at'], entry.get('updated_at'),
+                                        kind, entry.get('size', 0), offset, len(line))
+                    self._index.setdefault(revision.agenda_id, []).append(revision)
+                    self._heads.pop(revision.agenda_id, None)
+                    offset += len(line)
+                self._read_offset = offset
+
+    def _payload(self, revision: Revision) -> dict:
+        with open(self.path, 'rb') as f:
+            f.seek(revision.offset)
+            return json.loads(f.read(revision.length))
+
+    def revisions(self, agenda_id: str) -> List[Revision]:
+        """Every revision of an agenda, oldest first"""
+        with self._mutex:
+            self.sync()
+            return list(self._index.get(agenda_id, []))
+
+    def agenda_ids(self) -> List[str]:
+        with self._mutex:
+            self.sync()
+            return list(self._index)
+
+    def reconstruct(self, agenda_id: str, rev: int) -> Optional[dict]:
+        """Rebuild an agenda as of a revision (None if it was deleted at that point)"""
+        with self._mutex:
+            revisions = self.revisions(agenda_id)
+            if not 0 <= rev < len(revisions):
+                raise KeyError(f"{agenda_id} has no revision {rev}")
+            start = rev
+            while revisions[start].kind == 'delta':
+                start -= 1
+            if revisions[start].kind == 'deleted' and start == rev:
+                return None
+            state = None
+            for revision in revisions[start:rev + 1]:
+                entry = self._payload(revision)
+                if revision.kind == 'keyframe':
+                    state = entry['keyframe']
+                elif revision.kind == 'deleted':
+                    state = None
+                else:
+                    state = apply_delta(state or {}, entry['delta'])
+            return state
+
+    def _head(self, agenda_id: str) -> Optional[dict]:
+        if agenda_id not in self._heads:
+            revisions = self._index.get(agenda_id)
+            self._heads[agenda_id] = self.reconstruct(agenda_id, len(revisions) - 1) if revisions else None
+        return self._heads[agenda_id]
+
+    # -- writing -------------------------------------------------------------
+
+    def record(self, agendas: Dict, at: Optional[str] = None) -> int:
+        """Append a revision for every agenda whose updated_at moved, was created or was deleted
+
+        The caller must hold the data file's write lock. Returns the number of
+        revisions written.
+        """
+        with self._mutex:
+            self.sync()
+            at = at or datetime.now().isoformat()
+            lines = []
+            for agenda_id, agenda in agendas.items():
+                revisions = self._index.get(agenda_id)
+                last = revisions[-1] if revisions else None
+                if last is not None and last.kind != 'deleted' and last.updated_at == agenda.get('updated_at'):
+                    continue
+                rev = len(revisions) if revisions else 0
+                head = self._head(agenda_id) if last is not None and last.kind != 'deleted' else None
+                state = copy.deepcopy(agenda)
+                full = json.dumps(state, default=str)
+                entry = {'agenda_id': agenda_id, 'rev': rev, 'at': at, 'updated_at': agenda.get('updated_at'),
+                         'size': len(full)}
+                if head is None or rev % self.keyframe_interval == 0:
+                    entry['keyframe'] = state
+                else:
+                    entry['delta'] = make_delta(head, state)
+                lines.append((entry, state))
+            for agenda_id, revisions in self._index.items():
+                if agenda_id not in agendas and revisions[-1].kind != 'deleted':
+                    lines.append(({'agenda_id': agenda_id, 'rev': len(revisions), 'at': at, 'deleted': True}, None))
+            if not lines:
+                return 0
+
+            with open(self.path, 'ab') as f:
+                for entry, _ in lines:
+                    f.write(json.dumps(entry, default=str).encode('utf-8') + b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.sync()
+            for entry, state in lines:
+                self._heads[entry['agenda_id']] = state
+            return len(lines)
+
+    def compact(self, drop: Set[str], lock: Callable[[], ContextManager]) -> int:
+        """Rewrite the file without revisions of the agendas in `drop`; return bytes reclaimed
+
+        The bulk copy runs without the lock; only lines appended meanwhile and
+        the final rename happen while holding `lock()`, so writers wait for a
+        short tail copy rather than the whole rewrite. Only agendas named in
+        `drop` lose lines, so an agenda first saved while the copy runs keeps
+        its history.
+        """
+        with self._mutex:
+            self.sync()
+            drop = drop & self._index.keys()
+            if not drop:
+                return 0
+            kept = sorted((r for agenda_id, rs in self._index.items() if agenda_id not in drop for r in rs),
+                          key=lambda r: r.offset)
+            copied_to = self._read_offset
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(self.path, 'rb') as src, open(tmp, 'wb') as dst:
+            for revision in kept:
+                src.seek(revision.offset)
+                dst.write(src.read(revision.length))
+            with lock(), self._mutex:
+                src.seek(copied_to)
+                for line in src:
+                    if json.loads(line)['agenda_id'] not in drop:
+                        dst.write(line)
+                dst.flush()
+                os.fsync(dst.fileno())
+                before = os.fstat(src.fileno()).st_size
+                after = dst.tell()
+                os.replace(tmp, self.path)
+                self.sync()
+        return before - after
+
+    # -- reporting -----------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        """History file size versus storing every revision as a full copy"""
+        with self._mutex:
+            self.sync()
+            revisions = [r for rs in self._index.values() for r in rs]
+            full = sum(r.size for r in revisions)
+            stored = self.path.stat().st_size if self.path.exists() else 0
+            return {
+                'agendas': len(self._index),
+                'revisions': len(revisions),
+                'keyframes': sum(1 for r in revisions if r.kind == 'keyframe'),
+                'history_bytes': stored,
+                'full_copy_bytes': full,
+                'overhead_pct': round(100 * stored / full, 1) if full else 0.0
+            }
+
+_histories: Dict[Path, RevisionHistory] = {}
+
+def history_for(data_file: Path) -> RevisionHistory:
+    """Process-wide RevisionHistory for a data file"""
+    path = history_path(data_file).resolve()
+    if path not in _histories:
+        _histories[path] = RevisionHistory(path)
+    return _histories[path]
+
+if __name__ == "__main__":
+    from agenda_store import DATA_FILE
+
+    history = history_for(DATA_FILE)
+    if len(sys.argv) > 2 and sys.argv[1] == 'log':
+        for r in history.revisions(sys.argv[2]):
+            print(f"r{r.rev:<4} {r.at[:19]}  {r.kind:<8}  {r.size:>8} B")
+    else:
+        for key, value in history.stats().items():
+            print(f"{key:<16} {value}")
@@ -0,0 +1,253 @@
+"""
+Schedule Index - interval tree over meeting time slots
+Keeps every agenda's [start, end) slot in a balanced interval tree, both
+globally and per presenter, so overlapping or double-booked meetings can be
+found in O(log n + k) instead of scanning every agenda.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# ============================================================================
+# INTERVAL TREE
+# ============================================================================
+
+class _Node:
+    """AVL node ordered by (start, key) and augmented with the subtree max end"""
+    __slots__ = ('start', 'end', 'key', 'max_end', 'height', 'left', 'right')
+
+    def __init__(self, start, end, key):
+        self.start = start
+        self.end = end
+        self.key = key
+        self.max_end = end
+        self.height = 1
+        self.left = None
+        self.right = None
+
+def _height(node: Optional[_Node]) -> int:
+    return node.height if node else 0
+
+def _refresh(node: _Node) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.max_end = node.end
+    if node.left and node.left.max_end > node.max_end:
+        node.max_end = node.left.max_end
+    if node.right and node.right.max_end > node.max_end:
+        node.max_end = node.right.max_end
+
+def _rotate_right(node: _Node) -> _Node:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _refresh(node)
+    _refresh(pivot)
+    return pivot
+
+def _rotate_left(node: _Node) -> _Node:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _refresh(node)
+    _refresh(pivot)
+    return pivot
+
+def _rebalance(node: _Node) -> _Node:
+    _refresh(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+class IntervalTree:
+    """Balanced interval tree of half-open [start, end) intervals tagged with a key"""
+
+    def __init__(self):
+        self._root = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, start, end, key) -> None:
+        """Insert an interval; (start, key) must be unique within the tree"""
+        self._root = self._insert(self._root, start, end, key)
+        self._size += 1
+
+    def _insert(self, node, start, end, key):
+        if node is None:
+            return _Node(start, end, key)
+        if (start, key) < (node.start, node.key):
+            node.left = self._insert(node.left, start, end, key)
+        else:
+            node.right = self._insert(node.right, start, end, key)
+        return _rebalance(node)
+
+    def remove(self, start, key) -> bool:
+        """Remove the interval identified by (start, key); return True if found"""
+        before = self._size
+        self._root = self._remove(self._root, start, key)
+        return self._size < before
+
+    def _remove(self, node, start, key):
+        if node is None:
+            return None
+        if (start, key) < (node.start, node.key):
+            node.left = self._remove(node.left, start, key)
+        elif (start, key) > (node.start, node.key):
+            node.right = self._remove(node.right, start, key)
+        else:
+            self._size -= 1
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.start, node.end, node.key = successor.start, successor.end, successor.key
+            self._size += 1  # the successor removal below decrements again
+            node.right = self._remove(node.right, successor.start, successor.key)
+        return _rebalance(node)
+
+    def overlapping(self, start, end) -> List[Tuple]:
+        """Return (start, end, key) for every interval overlapping [start, end)"""
+        found = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            if node.max_end <= start:
+                continue
+            if node.left:
+                stack.append(node.left)
+            if node.start < end:
+                if node.end > start:
+                    found.append((node.start, node.end, node.key))
+                if node.right:
+                    stack.append(node.right)
+        return found
+
+    def __iter__(self) -> Iterator[Tuple]:
+        """Yield (start, end, key) in start order"""
+        stack, node = [], self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.end, node.key
+            node = node.right
+
+# ============================================================================
+# AGENDA SCHEDULE INDEX
+# ============================================================================
+
+def agenda_slot(agenda: dict) -> Optional[Tuple[datetime, datetime]]:
+    """Return the [start, end) datetimes of an agenda, or None if unscheduled"""
+    try:
+        start = datetime.fromisoformat(f"{agenda['date']}T{agenda['time']}")
+        duration = int(agenda.get('duration') or 0)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if duration <= 0:
+        return None
+    return start, start + timedelta(minutes=duration)
+
+def _presenter_key(presenter: str) -> str:
+    return (presenter or '').strip().lower()
+
+class ScheduleIndex:
+    """Global and per-presenter interval trees over agenda time slots"""
+
+    def __init__(self):
+        self._slots: Dict[str, Tuple[datetime, datetime, str]] = {}
+        self._global = IntervalTree()
+        self._by_presenter: Dict[str, IntervalTree] = {}
+
+    @classmethod
+    def from_agendas(cls, agendas: Dict) -> 'ScheduleIndex':
+        """Build an index over every agenda in the store"""
+        index = cls()
+        for agenda in agendas.values():
+            index.add(agenda)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add(self, agenda: dict) -> None:
+        """Index an agenda's slot, replacing any previous entry for it"""
+        self.remove(agenda['id'])
+        slot = agenda_slot(agenda)
+        if slot is None:
+            return
+        start, end = slot
+        presenter = _presenter_key(agenda.get('presenter'))
+        self._slots[agenda['id']] = (start, end, presenter)
+        self._global.insert(start, end, agenda['id'])
+        if presenter:
+            self._by_presenter.setdefault(presenter, IntervalTree()).insert(start, end, agenda['id'])
+
+    def remove(self, agenda_id: str) -> None:
+        """Drop an agenda from the index if present"""
+        entry = self._slots.pop(agenda_id, None)
+        if entry is None:
+            return
+        start, _, presenter = entry
+        self._global.remove(start, agenda_id)
+        tree = self._by_presenter.get(presenter)
+        if tree is not None:
+            tree.remove(start, agenda_id)
+            if not len(tree):
+                del self._by_presenter[presenter]
+
+    def find_conflicts(self, start: datetime, end: datetime, presenter: str = '',
+                       exclude_id: Optional[str] = None) -> List[dict]:
+        """Return agendas overlapping [start, end), flagging presenter double-bookings"""
+        presenter = _presenter_key(presenter)
+        double_booked = set()
+        if presenter and presenter in self._by_presenter:
+            double_booked = {key for _, _, key in self._by_presenter[presenter].overlapping(start, end)}
+
+        conflicts = []
+        for other_start, other_end, key in sorted(self._global.overlapping(start, end)):
+            if key == exclude_id:
+                continue
+            conflicts.append({
+                'agenda_id': key,
+                'start': other_start,
+                'end': other_end,
+                'type': 'double_booked' if key in double_booked else 'overlap'
+            })
+        return conflicts
+
+    def conflicts_for(self, agenda: dict) -> List[dict]:
+        """Return conflicts for an agenda as it would be saved"""
+        slot = agenda_slot(agenda)
+        if slot is None:
+            return []
+        return self.find_conflicts(slot[0], slot[1], agenda.get('presenter', ''), agenda.get('id'))
+
+    def conflicts_report(self) -> List[dict]:
+        """Return every conflicting pair across the whole dataset, ordered by start"""
+        report = []
+        for start, end, key in self._global:
+            presenter = self._slots[key][2]
+            for conflict in self.find_conflicts(start, end, presenter, exclude_id=key):
+                other = conflict['agenda_id']
+                # Each pair is found from both sides; keep the one seen from the earlier slot
+                if (start, key) < (conflict['start'], other):
+                    report.append({
+                        'first_id': key,
+                        'second_id': other,
+                        'overlap_start': max(start, conflict['start']),
+                        'overlap_end': min(end, conflict['end']),
+                        'type': conflict['type']
+                    })
+        return report
@@ -0,0 +1,86 @@
+"""Changes made by other writers survive a session's saves"""
+
+import json
+import threading
+import urllib.request
+from datetime import date, time
+from pathlib import Path
+
+import agenda_store as store
+import api_server
+from write_behind import WriteBehind
+
+APP = Path(__file__).resolve().parent.parent / 'meeting_agenda_manager.py'
+
+def make_store(path: Path) -> tuple:
+    agendas = {}
+    first = store.create_agenda(agendas, 'Planning', 'Ana', date(2030, 1, 10), time(9), 30)
+    second = store.create_agenda(agendas, 'Retro', 'Ben', date(2030, 1, 11), time(10), 45)
+    store.save_agendas_to_file(agendas, path)
+    return first, second
+
+def test_session_flush_keeps_other_writers_changes(tmp_path):
+    path = tmp_path / 'agendas_data.json'
+    first, second = make_store(path)
+    session = store.load_agendas_from_file(path)
+    writer = WriteBehind(path, durability='strict')
+    writer.track(session)
+
+    # Another writer (the CLI, the API or another session) changes the second agenda
+    with store.transaction(path) as agendas:
+        store.update_agenda(agendas, second, status='completed')
+    store.add_note(session, first, 'Agreed on scope')
+    writer.save(session)
+
+    stored = store.load_agendas_from_file(path)
+    assert stored[second]['status'] == 'completed'
+    assert [note['content'] for note in stored[first]['notes']] == ['Agreed on scope']
+
+def test_session_flush_applies_removals_only(tmp_path):
+    path = tmp_path / 'agendas_data.json'
+    first, second = make_store(path)
+    session = store.load_agendas_from_file(path)
+    writer = WriteBehind(path, durability='strict')
+    writer.track(session)
+
+    with store.transaction(path) as agendas:
+        third = store.create_agenda(agendas, 'Review', 'Cy', date(2030, 1, 12), time(11), 30)
+    del session[first]
+    writer.save(session)
+
+    assert set(store.load_agendas_from_file(path)) == {second, third}
+
+def test_api_patch_survives_later_app_change(tmp_path, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / store.DATA_FILE
+    first, second = make_store(path)
+    at = AppTest.from_file(str(APP), default_timeout=60)
+    at.session_state['current_view'] = 'detail'
+    at.session_state['selected_agenda_id'] = second
+    at.run()
+    assert not at.exception
+
+    server = api_server.make_server('127.0.0.1', 0, path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/agendas/{first}"
+        etag = urllib.request.urlopen(url).headers['ETag']
+        request = urllib.request.Request(url, data=json.dumps({'topic': 'Planning (moved)'}).encode(),
+                                         method='PATCH', headers={'Content-Type': 'application/json',
+                                                                  'If-Match': etag})
+        assert urllib.request.urlopen(request).status == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # The open session still holds the old copy of the first agenda and changes the second
+    at.text_area(key='new_note').input('Went well')
+    at.button(key='save_note').click().run()
+    assert not at.exception
+    at.session_state['writer'].flush()
+
+    stored = store.load_agendas_from_file(path)
+    assert stored[first]['topic'] == 'Planning (moved)'
+    assert [note['content'] for note in stored[second]['notes']] == ['Went well']
@@ -0,0 +1,239 @@
+"""
+Trash - soft deletion with tombstones and background compaction
+Deleted agendas and items are moved into a trash file next to the data file
+(agendas_data.json -> agendas_data_trash.json) as tombstones that keep the
+full record, so they can be restored until they expire. A background
+Compactor purges expired tombstones a small batch at a time, releasing the
+file lock between batches, and drops revision-history lines of agendas that
+no longer exist anywhere (live, trashed or archived), which is where their
+images and attachments would otherwise linger.
+
+    python trash.py          # run one compaction pass and print what it purged
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import agenda_store as store
+import archive
+from revision_history import history_for
+
+RETENTION = timedelta(days=30)
+COMPACT_INTERVAL = 3600         # seconds between background passes
+BATCH_SIZE = 50                 # tombstones purged per locked batch
+BATCH_PAUSE = 0.05              # seconds the lock is released between batches
+
+def trash_path(data_file: Path = None) -> Path:
+    data_file = Path(data_file or store.DATA_FILE)
+    return data_file.with_name(f"{data_file.stem}_trash.json")
+
+# ============================================================================
+# TRASH FILE
+# ============================================================================
+
+def read_trash(data_file: Path = None) -> Dict:
+    """Read the trash without taking the lock (caller holds it)"""
+    trash = store.read_agendas(trash_path(data_file))
+    return {'agendas': trash.get('agendas', {}), 'items': trash.get('items', {})}
+
+def load_trash(data_file: Path = None) -> Dict:
+    """Load the trash under a shared lock"""
+    with store.locked(data_file, exclusive=False):
+        return read_trash(data_file)
+
+def write_trash(trash: Dict, data_file: Path = None) -> None:
+    """Write the trash without taking the lock (caller holds it)
+
+    Replaced atomically through a temp file like the data file, so a crash
+    never leaves a truncated trash and loses every tombstone in it.
+    """
+    path = trash_path(data_file)
+    durable = store.DURABILITY == 'fsync'
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(trash, f, indent=2, default=str)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if durable:
+        store._fsync_dir(path)
+
+@contextmanager
+def trash_transaction(data_file: Path = None):
+    """Yield the trash under the data file's exclusive lock and write it back once"""
+    with store.locked(data_file):
+        trash = read_trash(data_file)
+        yield trash
+        write_trash(trash, data_file)
+
+# ============================================================================
+# TOMBSTONES
+# ============================================================================
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+def put_agenda(trash: Dict, agenda: dict, deleted_at: Optional[str] = None) -> None:
+    """Tombstone a deleted agenda (with all of its items)"""
+    trash['agendas'][agenda['id']] = {'deleted_at': deleted_at or _now(), 'agenda': agenda}
+
+def put_item(trash: Dict, agenda_id: str, item_type: str, position: Optional[int], item: dict,
+             deleted_at: Optional[str] = None) -> None:
+    """Tombstone a deleted note, todo, or action item"""
+    trash['items'][item['id']] = {
+        'deleted_at': deleted_at or _now(),
+        'agenda_id': agenda_id,
+        'item_type': item_type,
+        'position': position,
+        'item': item
+    }
+
+def take_agenda(trash: Dict, agenda_id: str) -> Optional[dict]:
+    """Remove an agenda's tombstone and return the agenda"""
+    entry = trash['agendas'].pop(agenda_id, None)
+    return entry['agenda'] if entry else None
+
+def take_item(trash: Dict, item_id: str) -> Optional[dict]:
+    """Remove an item's tombstone and return it"""
+    return trash['items'].pop(item_id, None)
+
+def restore_agenda(agendas: Dict, trash: Dict, agenda_id: str) -> Optional[dict]:
+    """Move a trashed agenda back into the store"""
+    if agenda_id in agendas:
+        return None
+    agenda = take_agenda(trash, agenda_id)
+    if agenda is not None:
+        agendas[agenda_id] = agenda
+        store.touch(agendas, agenda_id)
+    return agenda
+
+def restore_item(agendas: Dict, trash: Dict, item_id: str) -> Optional[dict]:
+    """Put a trashed item back where it was, if its agenda still exists"""
+    entry = trash['items'].get(item_id)
+    if entry is None or entry['agenda_id'] not in agendas:
+        return None
+    del trash['items'][item_id]
+    items = agendas[entry['agenda_id']][entry['item_type']]
+    position = entry['position'] if entry['position'] is not None else len(items)
+    items.insert(min(position, len(items)), entry['item'])
+    store.touch(agendas, entry['agenda_id'])
+    return entry
+
+def track_removals(trash: Dict, deltas: List[tuple]) -> bool:
+    """Keep tombstones in step with operation-log deltas (see operation_log.py)
+
+    `deltas` describe how to reverse a change that was just applied: an
+    insert means the change removed that agenda or item, so it is
+    tombstoned; a remove means it was (re)added, so any tombstone for it is
+    dropped. Returns True if the trash changed.
+    """
+    changed = False
+    for delta in deltas:
+        kind = delta[0]
+        if kind == 'insert_record':
+            put_agenda(trash, delta[2])
+        elif kind == 'insert_item':
+            put_item(trash, delta[1], delta[2], delta[3], delta[4])
+        elif kind == 'remove_record':
+            if take_agenda(trash, delta[1]) is None:
+                continue
+        elif kind == 'remove_item':
+            if take_item(trash, delta[3]) is None:
+                continue
+        else:
+            continue
+        changed = True
+    return changed
+
+def expired(trash: Dict, now: datetime, retention: timedelta = RETENTION) -> List[tuple]:
+    """(kind, id) of every tombstone older than the retention period"""
+    cutoff = (now - retention).isoformat()
+    return ([('agendas', k) for k, v in trash['agendas'].items() if v['deleted_at'] < cutoff] +
+            [('items', k) for k, v in trash['items'].items() if v['deleted_at'] < cutoff])
+
+def expires_on(entry: dict, retention: timedelta = RETENTION) -> datetime:
+    return datetime.fromisoformat(entry['deleted_at']) + retention
+
+# ============================================================================
+# COMPACTION
+# ============================================================================
+
+class Compactor:
+    """Background thread that purges expired tombstones and orphaned history"""
+
+    def __init__(self, data_file: Path = None, retention: timedelta = RETENTION,
+                 interval: float = COMPACT_INTERVAL, batch_size: int = BATCH_SIZE):
+        self.data_file = Path(data_file or store.DATA_FILE)
+        self.retention = retention
+        self.interval = interval
+        self.batch_size = batch_size
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_run: Optional[datetime] = None
+        self.last_result: Dict[str, int] = {}
+        self.last_error: Optional[str] = None
+
+    def start(self) -> None:
+        """Start the background thread if it is not already running"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="trash-compactor", daemon=True)
+            self._thread.start()
+
+    def trigger(self) -> None:
+        """Run a pass now instead of waiting for the interval"""
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.compact_once()
+            except Exception as e:
+                self.last_error = f"Compaction failed: {e}"
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def purge_expired(self) -> int:
+        """Purge expired tombstones in batches, releasing the lock between them"""
+        purged = 0
+        while True:
+            with store.locked(self.data_file):
+                trash = read_trash(self.data_file)
+                batch = expired(trash, datetime.now(), self.retention)[:self.batch_size]
+                for kind, key in batch:
+                    del trash[kind][key]
+                if batch:
+                    write_trash(trash, self.data_file)
+            purged += len(batch)
+            if len(batch) < self.batch_size:
+                return purged
+            time.sleep(BATCH_PAUSE)
+
+    def purge_orphaned_history(self) -> int:
+        """Drop revision history of agendas that are not live, in the trash or archived"""
+        history = history_for(self.data_file)
+        # Saves record history under the exclusive lock, so the file and the history agree here
+        with store.locked(self.data_file, exclusive=False):
+            keep = (set(store.read_agendas(self.data_file)) | set(read_trash(self.data_file)['agendas'])
+                    | archive.archived_ids(self.data_file))
+            drop = set(history.agenda_ids()) - keep
+        return history.compact(drop, lambda: store.locked(self.data_file))
+
+    def compact_once(self) -> Dict[str, int]:
+        """One full pass; returns what was purged"""
+        result = {'tombstones': self.purge_expired(), 'history_bytes': self.purge_orphaned_history()}
+        self.last_run = datetime.now()
+        self.last_result = result
+        self.last_error = None
+        return result
+
+if __name__ == "__main__":
+    outcome = Compactor().compact_once()
+    print(f"Purged {outcome['tombstones']} expired tombstone(s) and "
+          f"{outcome['history_bytes']} byte(s) of orphaned revision history")
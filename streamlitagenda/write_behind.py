@@ -0,0 +1,134 @@
+"""
+Write Behind - coalesced, group-committed saves of a session's agendas
+Mutators ask for a save after every change, but one user action often runs
+several of them. A WriteBehind only remembers that the store is dirty; the
+actual write happens once, when the outermost `batch()` (a script run or a
+fragment rerun) exits. Under 'group' durability, runs that follow each other
+within the commit window share one write, made by a timer thread once the
+burst is over. A write merges only the agendas this session changed or
+removed into the file as it is on disk, so changes other sessions, the API
+or the CLI made in the meantime are kept.
+
+Durability levels:
+    strict   write and fsync at the end of every run that changed something
+    group    fsync, but commit at most once per window (default)
+    relaxed  like group, without fsync; the OS decides when data hits disk
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+import agenda_store as store
+
+DURABILITY = 'group'
+COMMIT_WINDOW = 0.5             # seconds a group commit waits for further changes
+
+class WriteBehind:
+    """Per-session write coalescer with write amplification accounting"""
+
+    def __init__(self, path: Path = None, durability: str = DURABILITY, window: float = COMMIT_WINDOW):
+        if durability not in ('strict', 'group', 'relaxed'):
+            raise ValueError(f"Unknown durability {durability!r}")
+        self.path = path
+        self.durability = durability
+        self.window = window
+        # Held for the whole of a run, so the timer never serialises agendas mid-mutation
+        self._mutex = threading.RLock()
+        self._depth = 0
+        self._pending: Optional[Dict] = None
+        self._timer: Optional[threading.Timer] = None
+        self._last_commit = 0.0
+        self._flushed: Dict[str, Optional[str]] = {}
+        self.last_error: Optional[str] = None
+        self.stats = {'requests': 0, 'commits': 0, 'bytes_written': 0, 'bytes_changed': 0}
+
+    def track(self, agendas: Dict) -> None:
+        """Remember the stored state, so only later changes count as logical writes"""
+        self._flushed = {agenda_id: agenda.get('updated_at') for agenda_id, agenda in agendas.items()}
+
+    @contextmanager
+    def batch(self):
+        """Coalesce every save requested inside the block into at most one write"""
+        with self._mutex:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.commit()
+
+    def save(self, agendas: Dict) -> None:
+        """Request a save; written when the current batch ends"""
+        with self._mutex:
+            self._pending = agendas
+            self.stats['requests'] += 1
+            if self._depth == 0:
+                self.commit()
+
+    def commit(self) -> None:
+        """Write now, or under group durability defer to the end of the window"""
+        with self._mutex:
+            if self._pending is None or self._timer is not None:
+                return
+            wait = self._last_commit + self.window - time.monotonic()
+            if self.durability == 'strict' or wait <= 0:
+                self.flush()
+            else:
+                self._timer = threading.Timer(wait, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._mutex:
+            self._timer = None
+            try:
+                self.flush()
+            except Exception as e:
+                # Nobody is waiting on the timer thread, so the next request reports it
+                self.last_error = f"Error saving data: {e}"
+
+    def flush(self) -> None:
+        """Write any pending save immediately; on failure the save stays pending and the error is raised"""
+        with self._mutex:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            agendas, self._pending = self._pending, None
+            if agendas is None:
+                return
+            changed = {agenda_id: a for agenda_id, a in agendas.items()
+                       if self._flushed.get(agenda_id, '') != a.get('updated_at')}
+            removed = self._flushed.keys() - agendas.keys()
+            try:
+                # Only this session's own changes go in; other writers' changes since it loaded stay
+                written = store.save_changes_to_file(changed, removed, self.path,
+                                                     'none' if self.durability == 'relaxed' else 'fsync')
+            except Exception:
+                self._pending = agendas
+                raise
+            self._last_commit = time.monotonic()
+            self.track(agendas)
+            self.last_error = None
+            self.stats['commits'] += 1
+            self.stats['bytes_written'] += written
+            # A removed agenda counts as the size of its key; everything else as its serialised size
+            self.stats['bytes_changed'] += (sum(len(json.dumps(a, indent=2, default=str)) for a in changed.values())
+                                            + sum(len(agenda_id) for agenda_id in removed))
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def amplification(self) -> Dict[str, float]:
+        """Saves requested per physical write, and bytes written per byte that changed"""
+        stats = self.stats
+        return {
+            'requests_per_commit': round(stats['requests'] / stats['commits'], 2) if stats['commits'] else 0.0,
+            'write_amplification': (round(stats['bytes_written'] / stats['bytes_changed'], 1)
+                                    if stats['bytes_changed'] else 0.0)
+        }
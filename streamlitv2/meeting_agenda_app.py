@@ -4,9 +4,19 @@ Allows creating, updating, and deleting meeting agendas, notes, action items, an
 """
 
 import streamlit as st
+from dataclasses import dataclass
 from datetime import datetime, date, time
+from typing import Optional
 import uuid
 import json
+import functools
+
+from operation_log import OperationLog, item_position
+from instrumentation import METRICS, breakdown_rows, span, timed
+from profiling import DEFAULT_RUNS, ProfileCapture
+import memory_usage
+import analytics
+from static_assets import build_stylesheet, stylesheet_tag
 
 # Page configuration
 st.set_page_config(
@@ -17,692 +27,16 @@ st.set_page_config(
 )
 
 # Material UI Inspired CSS with Animations
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&family=Roboto:wght@300;400;500;700&display=swap');
-    
-    /* Root Variables - Material Design Color Palette */
-    :root {
-        --primary: #6366f1;
-        --primary-dark: #4f46e5;
-        --primary-light: #818cf8;
-        --secondary: #10b981;
-        --secondary-dark: #059669;
-        --accent: #f59e0b;
-        --danger: #ef4444;
-        --danger-dark: #dc2626;
-        --surface: #1e1e2e;
-        --surface-light: #2a2a3e;
-        --surface-lighter: #363650;
-        --text-primary: #f8fafc;
-        --text-secondary: #94a3b8;
-        --border: #3f3f5a;
-        --shadow: rgba(0, 0, 0, 0.3);
-        --gradient-primary: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-        --gradient-secondary: linear-gradient(135deg, #10b981 0%, #14b8a6 100%);
-    }
-    
-    /* Global Styles */
-    .stApp {
-        background: linear-gradient(180deg, #0f0f1a 0%, #1a1a2e 50%, #16213e 100%);
-        font-family: 'Poppins', sans-serif;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Animation Keyframes */
-    @keyframes fadeInUp {
-        from {
-            opacity: 0;
-            transform: translateY(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes fadeInLeft {
-        from {
-            opacity: 0;
-            transform: translateX(-30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    @keyframes fadeInRight {
-        from {
-            opacity: 0;
-            transform: translateX(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    @keyframes pulse {
-        0%, 100% {
-            transform: scale(1);
-            box-shadow: 0 0 0 0 rgba(99, 102, 241, 0.4);
-        }
-        50% {
-            transform: scale(1.02);
-            box-shadow: 0 0 20px 10px rgba(99, 102, 241, 0);
-        }
-    }
-    
-    @keyframes shimmer {
-        0% {
-            background-position: -200% center;
-        }
-        100% {
-            background-position: 200% center;
-        }
-    }
-    
-    @keyframes float {
-        0%, 100% {
-            transform: translateY(0);
-        }
-        50% {
-            transform: translateY(-10px);
-        }
-    }
-    
-    @keyframes glow {
-        0%, 100% {
-            box-shadow: 0 0 5px rgba(99, 102, 241, 0.5), 0 0 10px rgba(99, 102, 241, 0.3);
-        }
-        50% {
-            box-shadow: 0 0 20px rgba(99, 102, 241, 0.8), 0 0 30px rgba(99, 102, 241, 0.5);
-        }
-    }
-    
-    @keyframes slideIn {
-        from {
-            opacity: 0;
-            transform: translateX(-100%);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    @keyframes ripple {
-        0% {
-            transform: scale(0);
-            opacity: 1;
-        }
-        100% {
-            transform: scale(4);
-            opacity: 0;
-        }
-    }
-    
-    /* Main Header */
-    .main-header {
-        background: var(--gradient-primary);
-        padding: 2rem 2.5rem;
-        border-radius: 20px;
-        margin-bottom: 2rem;
-        animation: fadeInUp 0.8s ease-out;
-        position: relative;
-        overflow: hidden;
-        box-shadow: 0 10px 40px rgba(99, 102, 241, 0.3);
-    }
-    
-    .main-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -200%;
-        width: 200%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.1), transparent);
-        animation: shimmer 3s infinite;
-    }
-    
-    .main-header h1 {
-        color: white;
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-    }
-    
-    .main-header p {
-        color: rgba(255,255,255,0.9);
-        font-size: 1.1rem;
-        margin-top: 0.5rem;
-    }
-    
-    /* Card Styles */
-    .meeting-card {
-        background: var(--surface);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-        border: 1px solid var(--border);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        animation: fadeInUp 0.6s ease-out;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .meeting-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 4px;
-        height: 100%;
-        background: var(--gradient-primary);
-        border-radius: 4px 0 0 4px;
-    }
-    
-    .meeting-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 40px rgba(99, 102, 241, 0.2);
-        border-color: var(--primary);
-    }
-    
-    .meeting-card-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: flex-start;
-        margin-bottom: 1rem;
-    }
-    
-    .meeting-title {
-        color: var(--text-primary);
-        font-size: 1.4rem;
-        font-weight: 600;
-        margin: 0;
-    }
-    
-    .meeting-topic {
-        color: var(--primary-light);
-        font-size: 1rem;
-        font-weight: 500;
-        margin-top: 0.25rem;
-    }
-    
-    .meeting-meta {
-        display: flex;
-        gap: 1.5rem;
-        margin: 1rem 0;
-        flex-wrap: wrap;
-    }
-    
-    .meta-item {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        color: var(--text-secondary);
-        font-size: 0.9rem;
-    }
-    
-    .meta-icon {
-        width: 18px;
-        height: 18px;
-        fill: var(--primary-light);
-    }
-    
-    .meeting-description {
-        color: var(--text-secondary);
-        font-size: 0.95rem;
-        line-height: 1.6;
-        padding: 1rem;
-        background: var(--surface-light);
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    
-    /* Badge Styles */
-    .badge {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.35rem 0.85rem;
-        border-radius: 50px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        animation: fadeInRight 0.5s ease-out;
-    }
-    
-    .badge-primary {
-        background: rgba(99, 102, 241, 0.2);
-        color: var(--primary-light);
-        border: 1px solid rgba(99, 102, 241, 0.3);
-    }
-    
-    .badge-success {
-        background: rgba(16, 185, 129, 0.2);
-        color: #34d399;
-        border: 1px solid rgba(16, 185, 129, 0.3);
-    }
-    
-    .badge-warning {
-        background: rgba(245, 158, 11, 0.2);
-        color: #fbbf24;
-        border: 1px solid rgba(245, 158, 11, 0.3);
-    }
-    
-    .badge-danger {
-        background: rgba(239, 68, 68, 0.2);
-        color: #f87171;
-        border: 1px solid rgba(239, 68, 68, 0.3);
-    }
-    
-    /* Section Headers */
-    .section-header {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        margin: 1.5rem 0 1rem 0;
-        animation: fadeInLeft 0.5s ease-out;
-    }
-    
-    .section-header h3 {
-        color: var(--text-primary);
-        font-size: 1.1rem;
-        font-weight: 600;
-        margin: 0;
-    }
-    
-    .section-icon {
-        width: 24px;
-        height: 24px;
-        padding: 6px;
-        background: var(--gradient-primary);
-        border-radius: 8px;
-    }
-    
-    /* List Items */
-    .list-item {
-        display: flex;
-        align-items: flex-start;
-        gap: 0.75rem;
-        padding: 0.75rem 1rem;
-        background: var(--surface-light);
-        border-radius: 10px;
-        margin-bottom: 0.5rem;
-        transition: all 0.3s ease;
-        animation: slideIn 0.4s ease-out;
-        border-left: 3px solid transparent;
-    }
-    
-    .list-item:hover {
-        background: var(--surface-lighter);
-        border-left-color: var(--primary);
-        transform: translateX(5px);
-    }
-    
-    .list-item-content {
-        flex: 1;
-        color: var(--text-primary);
-        font-size: 0.9rem;
-    }
-    
-    .list-item-checkbox {
-        width: 20px;
-        height: 20px;
-        border-radius: 4px;
-        border: 2px solid var(--primary);
-        cursor: pointer;
-        transition: all 0.3s ease;
-    }
-    
-    .list-item-checkbox.checked {
-        background: var(--primary);
-    }
-    
-    /* Button Styles */
-    .stButton > button {
-        background: var(--gradient-primary) !important;
-        color: white !important;
-        border: none !important;
-        padding: 0.75rem 1.5rem !important;
-        border-radius: 12px !important;
-        font-weight: 600 !important;
-        font-family: 'Poppins', sans-serif !important;
-        font-size: 0.9rem !important;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 4px 15px rgba(99, 102, 241, 0.3) !important;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(99, 102, 241, 0.4) !important;
-    }
-    
-    .stButton > button:active {
-        transform: translateY(0) !important;
-    }
-    
-    /* Form Inputs */
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div > div {
-        background: var(--surface-light) !important;
-        border: 2px solid var(--border) !important;
-        border-radius: 12px !important;
-        color: var(--text-primary) !important;
-        font-family: 'Poppins', sans-serif !important;
-        padding: 0.75rem 1rem !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus {
-        border-color: var(--primary) !important;
-        box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.2) !important;
-    }
-    
-    .stTextInput > label,
-    .stTextArea > label,
-    .stSelectbox > label,
-    .stDateInput > label,
-    .stTimeInput > label {
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-        font-size: 0.9rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Date and Time Inputs */
-    .stDateInput > div > div > input,
-    .stTimeInput > div > div > input {
-        background: var(--surface-light) !important;
-        border: 2px solid var(--border) !important;
-        border-radius: 12px !important;
-        color: var(--text-primary) !important;
-    }
-    
-    /* Sidebar Styles */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, var(--surface) 0%, #12121e 100%) !important;
-        border-right: 1px solid var(--border);
-    }
-    
-    [data-testid="stSidebar"] .stMarkdown {
-        animation: fadeInLeft 0.6s ease-out;
-    }
-    
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        background: var(--surface) !important;
-        border-radius: 12px !important;
-        padding: 0.5rem !important;
-        gap: 0.5rem !important;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent !important;
-        border-radius: 10px !important;
-        color: var(--text-secondary) !important;
-        font-weight: 500 !important;
-        padding: 0.75rem 1.5rem !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: var(--surface-light) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: var(--gradient-primary) !important;
-        color: white !important;
-    }
-    
-    .stTabs [data-baseweb="tab-highlight"] {
-        display: none !important;
-    }
-    
-    .stTabs [data-baseweb="tab-border"] {
-        display: none !important;
-    }
-    
-    /* Expander */
-    .streamlit-expanderHeader {
-        background: var(--surface-light) !important;
-        border-radius: 12px !important;
-        border: 1px solid var(--border) !important;
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .streamlit-expanderHeader:hover {
-        border-color: var(--primary) !important;
-        background: var(--surface-lighter) !important;
-    }
-    
-    .streamlit-expanderContent {
-        background: var(--surface) !important;
-        border: 1px solid var(--border) !important;
-        border-top: none !important;
-        border-radius: 0 0 12px 12px !important;
-    }
-    
-    /* Divider */
-    hr {
-        border-color: var(--border) !important;
-        margin: 1.5rem 0 !important;
-    }
-    
-    /* Success/Warning/Error Messages */
-    .stSuccess, .stWarning, .stError, .stInfo {
-        border-radius: 12px !important;
-        animation: fadeInUp 0.5s ease-out;
-    }
-    
-    /* URL Link */
-    .url-link {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        color: var(--primary-light);
-        text-decoration: none;
-        padding: 0.5rem 1rem;
-        background: rgba(99, 102, 241, 0.1);
-        border-radius: 8px;
-        transition: all 0.3s ease;
-        font-size: 0.9rem;
-    }
-    
-    .url-link:hover {
-        background: rgba(99, 102, 241, 0.2);
-        transform: translateX(5px);
-    }
-    
-    /* Empty State */
-    .empty-state {
-        text-align: center;
-        padding: 3rem 2rem;
-        animation: fadeInUp 0.8s ease-out;
-    }
-    
-    .empty-state-icon {
-        font-size: 4rem;
-        margin-bottom: 1rem;
-        animation: float 3s ease-in-out infinite;
-    }
-    
-    .empty-state h3 {
-        color: var(--text-primary);
-        font-size: 1.5rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    .empty-state p {
-        color: var(--text-secondary);
-        font-size: 1rem;
-    }
-    
-    /* Action Buttons Container */
-    .action-buttons {
-        display: flex;
-        gap: 0.5rem;
-        margin-top: 1rem;
-    }
-    
-    /* Floating Action Button */
-    .fab {
-        position: fixed;
-        bottom: 2rem;
-        right: 2rem;
-        width: 60px;
-        height: 60px;
-        border-radius: 50%;
-        background: var(--gradient-primary);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        box-shadow: 0 6px 20px rgba(99, 102, 241, 0.4);
-        cursor: pointer;
-        transition: all 0.3s ease;
-        animation: pulse 2s infinite;
-        z-index: 1000;
-    }
-    
-    .fab:hover {
-        transform: scale(1.1);
-        box-shadow: 0 8px 30px rgba(99, 102, 241, 0.5);
-    }
-    
-    /* Stats Card */
-    .stats-card {
-        background: var(--surface);
-        border-radius: 16px;
-        padding: 1.5rem;
-        border: 1px solid var(--border);
-        text-align: center;
-        transition: all 0.3s ease;
-        animation: fadeInUp 0.6s ease-out;
-    }
-    
-    .stats-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-    }
-    
-    .stats-number {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: var(--gradient-primary);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .stats-label {
-        color: var(--text-secondary);
-        font-size: 0.9rem;
-        margin-top: 0.5rem;
-    }
-    
-    /* Checkbox styling */
-    .stCheckbox > label {
-        color: var(--text-primary) !important;
-    }
-    
-    .stCheckbox > label > span {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Radio buttons */
-    .stRadio > label {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Multiselect */
-    .stMultiSelect > div > div {
-        background: var(--surface-light) !important;
-        border: 2px solid var(--border) !important;
-        border-radius: 12px !important;
-    }
-    
-    /* File uploader */
-    .stFileUploader > div > div {
-        background: var(--surface-light) !important;
-        border: 2px dashed var(--border) !important;
-        border-radius: 12px !important;
-    }
-    
-    .stFileUploader > div > div:hover {
-        border-color: var(--primary) !important;
-    }
-    
-    /* Scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: var(--surface);
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: var(--border);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--primary);
-    }
-    
-    /* Animations for dynamic content */
-    .animate-in {
-        animation: fadeInUp 0.5s ease-out;
-    }
-    
-    .stMarkdown {
-        color: var(--text-primary);
-    }
-    
-    /* Delete button specific */
-    .delete-btn button {
-        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%) !important;
-        box-shadow: 0 4px 15px rgba(239, 68, 68, 0.3) !important;
-    }
-    
-    .delete-btn button:hover {
-        box-shadow: 0 8px 25px rgba(239, 68, 68, 0.4) !important;
-    }
-    
-    /* Edit button specific */
-    .edit-btn button {
-        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%) !important;
-        box-shadow: 0 4px 15px rgba(245, 158, 11, 0.3) !important;
-    }
-    
-    /* Secondary button */
-    .secondary-btn button {
-        background: var(--surface-lighter) !important;
-        border: 2px solid var(--border) !important;
-        box-shadow: none !important;
-    }
-    
-    .secondary-btn button:hover {
-        border-color: var(--primary) !important;
-        background: var(--surface-light) !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def get_stylesheet():
+    """Build the minified, content-hashed stylesheet once per server process"""
+    return build_stylesheet()
+
+stylesheet_name, stylesheet_css = get_stylesheet()
+st.markdown(
+    stylesheet_tag(stylesheet_name, stylesheet_css, st.get_option('server.enableStaticServing')),
+    unsafe_allow_html=True
+)
 
 # Initialize session state for data storage
 if 'meetings' not in st.session_state:
@@ -717,6 +51,65 @@ if 'editing_meeting' not in st.session_state:
 if 'selected_meeting' not in st.session_state:
     st.session_state.selected_meeting = None
 
+# Bounded per-session undo/redo history of inverse deltas
+if 'operation_log' not in st.session_state:
+    st.session_state.operation_log = OperationLog()
+
+if 'flash' not in st.session_state:
+    st.session_state.flash = {}
+
+# Script executions and applied commands; one interaction should cost one run
+if 'run_stats' not in st.session_state:
+    st.session_state.run_stats = {'script_runs': 0, 'commands': 0}
+st.session_state.run_stats['script_runs'] += 1
+
+def measure_rerun(func):
+    """Time a script or fragment run and keep its span breakdown for the diagnostics panel"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        name = f"rerun.{func.__name__}"
+        nested = METRICS.in_rerun
+        breakdown = {}
+        try:
+            with METRICS.rerun(name) as breakdown:
+                return func(*args, **kwargs)
+        finally:
+            if not nested:
+                st.session_state.last_rerun = (name, breakdown)
+    return wrapper
+
+def profile_rerun(func):
+    """Run the wrapped script under cProfile while this session has a capture armed"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        capture = st.session_state.get('profile_capture')
+        if capture is None or not capture.active:
+            return func(*args, **kwargs)
+        with capture.record(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+# Meeting fields grouped for memory accounting; anything else counts as 'fields'
+MEMORY_CATEGORIES = {'notes': 'notes', 'action_items': 'action items', 'follow_ups': 'follow-ups',
+                     'description': 'descriptions'}
+
+def measure_memory():
+    """Deep size of this session's state, split by key, meeting and field category"""
+    if 'memory_accountant' not in st.session_state:
+        st.session_state.memory_accountant = memory_usage.MemoryAccountant(MEMORY_CATEGORIES)
+    state = {key: st.session_state[key] for key in st.session_state.keys()}
+    return st.session_state.memory_accountant.measure(st.session_state.meetings, state, 'meetings')
+
+def check_memory_budget():
+    """Every MEASURE_INTERVAL, warn if this session is over MEMORY_BUDGET_MB"""
+    if memory_usage.MEMORY_BUDGET_MB is None:
+        return
+    accountant = st.session_state.get('memory_accountant')
+    report = measure_memory() if accountant is None or accountant.due() else accountant.last_report
+    if memory_usage.over_budget(report):
+        st.sidebar.warning(f"This session holds {report['total'] / 1e6:.1f} MB, "
+                           f"over the {memory_usage.MEMORY_BUDGET_MB} MB memory budget")
+
 def generate_id():
     """Generate a unique ID for meetings and items"""
     return str(uuid.uuid4())[:8]
@@ -739,11 +132,15 @@ def create_meeting(name, meeting_date, meeting_time, topic, description, attachm
         'action_items': [],
         'follow_ups': []
     }
+    st.session_state.operation_log.record(f"Create '{name}'", [('remove_record', meeting_id)])
     return meeting_id
 
 def update_meeting(meeting_id, **kwargs):
     """Update an existing meeting"""
     if meeting_id in st.session_state.meetings:
+        meeting = st.session_state.meetings[meeting_id]
+        previous = {key: meeting.get(key) for key in kwargs}
+        st.session_state.operation_log.record(f"Edit '{meeting['name']}'", [('set_fields', meeting_id, previous)])
         for key, value in kwargs.items():
             if key in ['date', 'time'] and value:
                 st.session_state.meetings[meeting_id][key] = value.isoformat()
@@ -755,7 +152,8 @@ def update_meeting(meeting_id, **kwargs):
 def delete_meeting(meeting_id):
     """Delete a meeting"""
     if meeting_id in st.session_state.meetings:
-        del st.session_state.meetings[meeting_id]
+        meeting = st.session_state.meetings.pop(meeting_id)
+        st.session_state.operation_log.record(f"Delete '{meeting['name']}'", [('insert_record', meeting_id, meeting)])
         return True
     return False
 
@@ -768,6 +166,7 @@ def add_note(meeting_id, note):
             'content': note,
             'created_at': datetime.now().isoformat()
         })
+        st.session_state.operation_log.record("Add note", [('remove_item', meeting_id, 'notes', note_id)])
         return note_id
     return None
 
@@ -783,6 +182,7 @@ def add_action_item(meeting_id, item, assignee="", due_date=None):
             'completed': False,
             'created_at': datetime.now().isoformat()
         })
+        st.session_state.operation_log.record("Add action item", [('remove_item', meeting_id, 'action_items', item_id)])
         return item_id
     return None
 
@@ -797,6 +197,7 @@ def add_follow_up(meeting_id, item, priority="Medium"):
             'completed': False,
             'created_at': datetime.now().isoformat()
         })
+        st.session_state.operation_log.record("Add follow-up", [('remove_item', meeting_id, 'follow_ups', item_id)])
         return item_id
     return None
 
@@ -805,7 +206,12 @@ def toggle_action_item(meeting_id, item_id):
     if meeting_id in st.session_state.meetings:
         for item in st.session_state.meetings[meeting_id]['action_items']:
             if item['id'] == item_id:
+                st.session_state.operation_log.record("Toggle action item", [
+                    ('set_item_fields', meeting_id, 'action_items', item_id,
+                     {'completed': item['completed'], 'completed_at': item.get('completed_at')})
+                ])
                 item['completed'] = not item['completed']
+                item['completed_at'] = datetime.now().isoformat() if item['completed'] else None
                 return True
     return False
 
@@ -814,37 +220,324 @@ def toggle_follow_up(meeting_id, item_id):
     if meeting_id in st.session_state.meetings:
         for item in st.session_state.meetings[meeting_id]['follow_ups']:
             if item['id'] == item_id:
+                st.session_state.operation_log.record("Toggle follow-up", [
+                    ('set_item_fields', meeting_id, 'follow_ups', item_id, {'completed': item['completed']})
+                ])
                 item['completed'] = not item['completed']
                 return True
     return False
 
+def remove_meeting_item(meeting_id, list_name, item_id, label):
+    """Remove a child item, logging where it sat so undo can put it back"""
+    position = item_position(st.session_state.meetings, meeting_id, list_name, item_id)
+    if position is not None:
+        item = st.session_state.meetings[meeting_id][list_name].pop(position)
+        st.session_state.operation_log.record(label, [('insert_item', meeting_id, list_name, position, item)])
+
 def delete_note(meeting_id, note_id):
     """Delete a note from a meeting"""
     if meeting_id in st.session_state.meetings:
-        st.session_state.meetings[meeting_id]['notes'] = [
-            n for n in st.session_state.meetings[meeting_id]['notes'] if n['id'] != note_id
-        ]
+        remove_meeting_item(meeting_id, 'notes', note_id, "Delete note")
         return True
     return False
 
 def delete_action_item(meeting_id, item_id):
     """Delete an action item from a meeting"""
     if meeting_id in st.session_state.meetings:
-        st.session_state.meetings[meeting_id]['action_items'] = [
-            i for i in st.session_state.meetings[meeting_id]['action_items'] if i['id'] != item_id
-        ]
+        remove_meeting_item(meeting_id, 'action_items', item_id, "Delete action item")
         return True
     return False
 
 def delete_follow_up(meeting_id, item_id):
     """Delete a follow-up item from a meeting"""
     if meeting_id in st.session_state.meetings:
-        st.session_state.meetings[meeting_id]['follow_ups'] = [
-            i for i in st.session_state.meetings[meeting_id]['follow_ups'] if i['id'] != item_id
-        ]
+        remove_meeting_item(meeting_id, 'follow_ups', item_id, "Delete follow-up")
         return True
     return False
 
+# Bulk operations apply every change first and log them as one undoable operation
+def bulk_delete_meetings(meeting_ids):
+    """Delete several meetings and return how many were deleted"""
+    undo = []
+    for meeting_id in meeting_ids:
+        meeting = st.session_state.meetings.pop(meeting_id, None)
+        if meeting is not None:
+            undo.append(('insert_record', meeting_id, meeting))
+    if undo:
+        st.session_state.operation_log.record(f"Delete {len(undo)} meeting(s)", undo)
+    return len(undo)
+
+def bulk_update_action_items(meeting_ids, label, open_only=True, **fields):
+    """Set fields on the action items of several meetings and return how many changed"""
+    undo = []
+    for meeting_id in meeting_ids:
+        meeting = st.session_state.meetings.get(meeting_id)
+        if meeting is None:
+            continue
+        for item in meeting['action_items']:
+            if (open_only and item['completed']) or all(item.get(key) == value for key, value in fields.items()):
+                continue
+            undo.append(('set_item_fields', meeting_id, 'action_items', item['id'],
+                         {key: item.get(key) for key in fields}))
+            item.update(fields)
+    if undo:
+        st.session_state.operation_log.record(label.format(count=len(undo)), undo)
+    return len(undo)
+
+def export_meetings(meeting_ids):
+    """Export a selection of meetings as JSON"""
+    meetings = st.session_state.meetings
+    return json.dumps({meeting_id: meetings[meeting_id] for meeting_id in meeting_ids if meeting_id in meetings},
+                      indent=2)
+
+def undo_last():
+    """Reverse this session's latest change and return its label"""
+    result = st.session_state.operation_log.undo(st.session_state.meetings)
+    return result[0] if result else None
+
+def redo_last():
+    """Re-apply the latest undone change and return its label"""
+    result = st.session_state.operation_log.redo(st.session_state.meetings)
+    return result[0] if result else None
+
+def build_analytics_frames(meetings):
+    """Meetings, action items and follow-ups as columnar frames"""
+    return {
+        'meetings': analytics.parse_dates(
+            analytics.records_frame(meetings, ['id', 'name', 'topic', 'date']), ['date']),
+        'actions': analytics.parse_dates(
+            analytics.items_frame(meetings, 'action_items',
+                                  ['assignee', 'due_date', 'completed', 'created_at', 'completed_at']),
+            ['due_date', 'created_at', 'completed_at']),
+        'follow_ups': analytics.items_frame(meetings, 'follow_ups', ['priority', 'completed'])
+    }
+
+def get_analytics_frames():
+    """This session's analytics frames, flattened again only after the meetings change"""
+    if 'analytics_cache' not in st.session_state:
+        st.session_state.analytics_cache = analytics.FrameCache()
+    return st.session_state.analytics_cache.frames(
+        st.session_state.meetings, st.session_state.operation_log.revision, build_analytics_frames
+    )
+
+# Commands: widgets pass one of these to dispatch() as their on_click/on_change
+# callback. Streamlit runs callbacks before the script, so each interaction is
+# applied and then rendered in a single pass, without a follow-up st.rerun().
+@dataclass(frozen=True)
+class Navigate:
+    selected_meeting: Optional[str] = None
+    editing_meeting: Optional[str] = None
+    current_view: Optional[str] = None  # None keeps the current list/create view
+
+@dataclass(frozen=True)
+class SaveMeeting:
+    form_key: str
+    meeting_id: Optional[str] = None  # None creates a new meeting
+
+@dataclass(frozen=True)
+class DeleteMeeting:
+    meeting_id: str
+
+@dataclass(frozen=True)
+class AddNote:
+    meeting_id: str
+    form_key: str
+
+@dataclass(frozen=True)
+class AddActionItem:
+    meeting_id: str
+    form_key: str
+
+@dataclass(frozen=True)
+class AddFollowUp:
+    meeting_id: str
+    form_key: str
+
+@dataclass(frozen=True)
+class ToggleActionItem:
+    meeting_id: str
+    item_id: str
+
+@dataclass(frozen=True)
+class ToggleFollowUp:
+    meeting_id: str
+    item_id: str
+
+@dataclass(frozen=True)
+class DeleteNote:
+    meeting_id: str
+    note_id: str
+
+@dataclass(frozen=True)
+class DeleteActionItem:
+    meeting_id: str
+    item_id: str
+
+@dataclass(frozen=True)
+class DeleteFollowUp:
+    meeting_id: str
+    item_id: str
+
+@dataclass(frozen=True)
+class SelectMeetings:
+    meeting_ids: tuple
+    selected: bool
+
+@dataclass(frozen=True)
+class BulkDelete:
+    meeting_ids: tuple
+
+@dataclass(frozen=True)
+class BulkReassign:
+    meeting_ids: tuple
+    form_key: str
+
+@dataclass(frozen=True)
+class BulkCompleteActions:
+    meeting_ids: tuple
+
+@dataclass(frozen=True)
+class Undo:
+    pass
+
+@dataclass(frozen=True)
+class Redo:
+    pass
+
+def flash(scope, kind, message):
+    """Queue a message for the next render of a page area ('page' or a section name)"""
+    st.session_state.flash[scope] = (kind, message)
+
+def show_flash(scope):
+    """Render and clear the queued message for a page area"""
+    message = st.session_state.flash.pop(scope, None)
+    if message:
+        getattr(st, message[0])(message[1])
+
+def form_value(form_key, field):
+    """Read a keyed form widget's submitted value"""
+    return st.session_state.get(f"{form_key}_{field}")
+
+def handle_navigate(cmd):
+    st.session_state.selected_meeting = cmd.selected_meeting
+    st.session_state.editing_meeting = cmd.editing_meeting
+    if cmd.current_view is not None:
+        st.session_state.current_view = cmd.current_view
+
+def handle_save_meeting(cmd):
+    name = form_value(cmd.form_key, 'name')
+    topic = form_value(cmd.form_key, 'topic')
+    if not name or not topic:
+        flash('page', 'error', "Please fill in all required fields (Name and Topic)")
+        return
+    fields = {
+        'name': name,
+        'topic': topic,
+        'description': form_value(cmd.form_key, 'description'),
+        'attachments': form_value(cmd.form_key, 'attachments'),
+        'url_name': form_value(cmd.form_key, 'url_name'),
+        'url': form_value(cmd.form_key, 'url')
+    }
+    if cmd.meeting_id:
+        update_meeting(cmd.meeting_id, date=form_value(cmd.form_key, 'date'),
+                       time=form_value(cmd.form_key, 'time'), **fields)
+        st.session_state.editing_meeting = None
+        flash('page', 'success', "✅ Meeting updated successfully!")
+    else:
+        create_meeting(meeting_date=form_value(cmd.form_key, 'date'),
+                       meeting_time=form_value(cmd.form_key, 'time'), **fields)
+        flash('page', 'success', "✅ Meeting created successfully!")
+
+def handle_delete_meeting(cmd):
+    delete_meeting(cmd.meeting_id)
+    if st.session_state.selected_meeting == cmd.meeting_id:
+        st.session_state.selected_meeting = None
+    flash('page', 'success', "Meeting deleted! Use ↩️ Undo in the sidebar to restore it.")
+
+def handle_select_meetings(cmd):
+    for meeting_id in cmd.meeting_ids:
+        st.session_state[f"select_{meeting_id}"] = cmd.selected
+
+def handle_bulk(cmd):
+    if isinstance(cmd, BulkDelete):
+        count = bulk_delete_meetings(cmd.meeting_ids)
+        if st.session_state.selected_meeting not in st.session_state.meetings:
+            st.session_state.selected_meeting = None
+        message = f"Deleted {count} meeting(s). Use ↩️ Undo in the sidebar to restore them."
+    elif isinstance(cmd, BulkReassign):
+        assignee = (form_value(cmd.form_key, 'assignee') or '').strip()
+        if not assignee:
+            flash('page', 'warning', "Please enter who to reassign the action items to")
+            return
+        count = bulk_update_action_items(cmd.meeting_ids, f"Reassign {{count}} action item(s) to {assignee}",
+                                         open_only=form_value(cmd.form_key, 'open_only'), assignee=assignee)
+        message = f"Reassigned {count} action item(s) to {assignee}"
+    else:
+        count = bulk_update_action_items(cmd.meeting_ids, "Complete {count} action item(s)", completed=True,
+                                         completed_at=datetime.now().isoformat())
+        message = f"Completed {count} action item(s)"
+    handle_select_meetings(SelectMeetings(cmd.meeting_ids, False))
+    flash('page', 'success', message)
+
+def handle_history(cmd):
+    label = undo_last() if isinstance(cmd, Undo) else redo_last()
+    if label:
+        flash('page', 'info', f"{'Undid' if isinstance(cmd, Undo) else 'Redid'}: {label}")
+    if st.session_state.selected_meeting not in st.session_state.meetings:
+        st.session_state.selected_meeting = None
+    if st.session_state.editing_meeting not in st.session_state.meetings:
+        st.session_state.editing_meeting = None
+
+def handle_add_note(cmd):
+    content = form_value(cmd.form_key, 'content') or ''
+    if content.strip():
+        add_note(cmd.meeting_id, content)
+        flash('notes', 'success', "Note added!")
+    else:
+        flash('notes', 'warning', "Please enter a note")
+
+def handle_add_action_item(cmd):
+    content = form_value(cmd.form_key, 'content') or ''
+    if content.strip():
+        add_action_item(cmd.meeting_id, content, form_value(cmd.form_key, 'assignee') or '',
+                        form_value(cmd.form_key, 'due_date'))
+        flash('action_items', 'success', "Action item added!")
+    else:
+        flash('action_items', 'warning', "Please enter an action item")
+
+def handle_add_follow_up(cmd):
+    content = form_value(cmd.form_key, 'content') or ''
+    if content.strip():
+        add_follow_up(cmd.meeting_id, content, form_value(cmd.form_key, 'priority') or "Medium")
+        flash('follow_ups', 'success', "Follow-up added!")
+    else:
+        flash('follow_ups', 'warning', "Please enter a follow-up item")
+
+COMMAND_HANDLERS = {
+    Navigate: handle_navigate,
+    SaveMeeting: handle_save_meeting,
+    DeleteMeeting: handle_delete_meeting,
+    AddNote: handle_add_note,
+    AddActionItem: handle_add_action_item,
+    AddFollowUp: handle_add_follow_up,
+    ToggleActionItem: lambda cmd: toggle_action_item(cmd.meeting_id, cmd.item_id),
+    ToggleFollowUp: lambda cmd: toggle_follow_up(cmd.meeting_id, cmd.item_id),
+    DeleteNote: lambda cmd: delete_note(cmd.meeting_id, cmd.note_id),
+    DeleteActionItem: lambda cmd: delete_action_item(cmd.meeting_id, cmd.item_id),
+    DeleteFollowUp: lambda cmd: delete_follow_up(cmd.meeting_id, cmd.item_id),
+    SelectMeetings: handle_select_meetings,
+    BulkDelete: handle_bulk,
+    BulkReassign: handle_bulk,
+    BulkCompleteActions: handle_bulk,
+    Undo: handle_history,
+    Redo: handle_history
+}
+
+def dispatch(command):
+    """Widget callback: apply a command before the script renders"""
+    COMMAND_HANDLERS[type(command)](command)
+    st.session_state.run_stats['commands'] += 1
+
 def render_header():
     """Render the main header"""
     st.markdown("""
@@ -854,6 +547,7 @@ def render_header():
         </div>
     """, unsafe_allow_html=True)
 
+@timed('html.stats')
 def render_stats():
     """Render statistics cards"""
     total_meetings = len(st.session_state.meetings)
@@ -898,109 +592,92 @@ def render_stats():
             </div>
         """, unsafe_allow_html=True)
 
-def render_meeting_form(editing=False, meeting_data=None):
+def render_meeting_form(editing=False, meeting_data=None, form_key="meeting_form"):
     """Render the meeting creation/edit form"""
-    with st.form(key="meeting_form", clear_on_submit=not editing):
+    if editing and meeting_data:
+        form_key = f"{form_key}_{meeting_data['id']}"
+    with st.form(key=form_key, clear_on_submit=not editing):
         st.markdown("### " + ("✏️ Edit Meeting" if editing else "➕ Create New Meeting"))
         
         col1, col2 = st.columns(2)
         
         with col1:
-            name = st.text_input(
+            st.text_input(
                 "Meeting Name *",
                 value=meeting_data.get('name', '') if meeting_data else '',
-                placeholder="e.g., Q1 Planning Session"
+                placeholder="e.g., Q1 Planning Session",
+                key=f"{form_key}_name"
             )
             
-            meeting_date = st.date_input(
+            st.date_input(
                 "Date *",
-                value=date.fromisoformat(meeting_data['date']) if meeting_data and meeting_data.get('date') else date.today()
+                value=date.fromisoformat(meeting_data['date']) if meeting_data and meeting_data.get('date') else date.today(),
+                key=f"{form_key}_date"
             )
             
-            topic = st.text_input(
+            st.text_input(
                 "Topic *",
                 value=meeting_data.get('topic', '') if meeting_data else '',
-                placeholder="e.g., Budget Review"
+                placeholder="e.g., Budget Review",
+                key=f"{form_key}_topic"
             )
             
-            url_name = st.text_input(
+            st.text_input(
                 "URL Name",
                 value=meeting_data.get('url_name', '') if meeting_data else '',
-                placeholder="e.g., Meeting Link"
+                placeholder="e.g., Meeting Link",
+                key=f"{form_key}_url_name"
             )
         
         with col2:
-            meeting_time = st.time_input(
+            st.time_input(
                 "Time *",
-                value=time.fromisoformat(meeting_data['time']) if meeting_data and meeting_data.get('time') else time(9, 0)
+                value=time.fromisoformat(meeting_data['time']) if meeting_data and meeting_data.get('time') else time(9, 0),
+                key=f"{form_key}_time"
             )
             
-            attachments = st.text_input(
+            st.text_input(
                 "Attachments",
                 value=meeting_data.get('attachments', '') if meeting_data else '',
-                placeholder="e.g., report.pdf, slides.pptx"
+                placeholder="e.g., report.pdf, slides.pptx",
+                key=f"{form_key}_attachments"
             )
             
-            url = st.text_input(
+            st.text_input(
                 "URL",
                 value=meeting_data.get('url', '') if meeting_data else '',
-                placeholder="e.g., https://zoom.us/j/123456"
+                placeholder="e.g., https://zoom.us/j/123456",
+                key=f"{form_key}_url"
             )
         
-        description = st.text_area(
+        st.text_area(
             "Brief Description",
             value=meeting_data.get('description', '') if meeting_data else '',
             placeholder="Enter a brief description of the meeting agenda...",
-            height=100
+            height=100,
+            key=f"{form_key}_description"
         )
         
         col1, col2, col3 = st.columns([1, 1, 2])
         
         with col1:
-            submitted = st.form_submit_button(
+            st.form_submit_button(
                 "💾 Save Meeting" if editing else "➕ Create Meeting",
-                use_container_width=True
+                use_container_width=True,
+                on_click=dispatch,
+                args=(SaveMeeting(form_key, meeting_data['id'] if editing and meeting_data else None),)
             )
         
         with col2:
             if editing:
-                cancel = st.form_submit_button("❌ Cancel", use_container_width=True)
-                if cancel:
-                    st.session_state.editing_meeting = None
-                    st.rerun()
-        
-        if submitted:
-            if not name or not topic:
-                st.error("Please fill in all required fields (Name and Topic)")
-            else:
-                if editing and meeting_data:
-                    update_meeting(
-                        meeting_data['id'],
-                        name=name,
-                        date=meeting_date,
-                        time=meeting_time,
-                        topic=topic,
-                        description=description,
-                        attachments=attachments,
-                        url_name=url_name,
-                        url=url
-                    )
-                    st.session_state.editing_meeting = None
-                    st.success("✅ Meeting updated successfully!")
-                else:
-                    create_meeting(
-                        name=name,
-                        meeting_date=meeting_date,
-                        meeting_time=meeting_time,
-                        topic=topic,
-                        description=description,
-                        attachments=attachments,
-                        url_name=url_name,
-                        url=url
-                    )
-                    st.success("✅ Meeting created successfully!")
-                st.rerun()
+                st.form_submit_button(
+                    "❌ Cancel",
+                    use_container_width=True,
+                    on_click=dispatch,
+                    args=(Navigate(selected_meeting=st.session_state.selected_meeting),)
+                )
 
+@timed('html.card')
 def render_meeting_card(meeting):
     """Render a single meeting card"""
     meeting_date = date.fromisoformat(meeting['date']) if meeting.get('date') else None
@@ -1050,15 +727,50 @@ def render_meeting_card(meeting):
     col1, col2, col3 = st.columns([1, 1, 2])
     
     with col1:
-        if st.button("📝 View/Edit", key=f"view_{meeting['id']}", use_container_width=True):
-            st.session_state.selected_meeting = meeting['id']
-            st.rerun()
+        st.button("📝 View/Edit", key=f"view_{meeting['id']}", use_container_width=True,
+                  on_click=dispatch, args=(Navigate(selected_meeting=meeting['id']),))
     
     with col2:
-        if st.button("🗑️ Delete", key=f"delete_{meeting['id']}", use_container_width=True):
-            delete_meeting(meeting['id'])
-            st.success("Meeting deleted!")
-            st.rerun()
+        st.button("🗑️ Delete", key=f"delete_{meeting['id']}", use_container_width=True,
+                  on_click=dispatch, args=(DeleteMeeting(meeting['id']),))
+    
+    with col3:
+        st.checkbox("Select", key=f"select_{meeting['id']}")
+
+def render_bulk_actions(meetings):
+    """Render selection controls and the bulk actions for the ticked meetings"""
+    shown = tuple(m['id'] for m in meetings)
+    selected = tuple(meeting_id for meeting_id in shown if st.session_state.get(f"select_{meeting_id}"))
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        st.caption(f"☑️ {len(selected)} of {len(shown)} listed meeting(s) selected")
+    with col2:
+        st.button("Select all", key="bulk_select_all", use_container_width=True,
+                  on_click=dispatch, args=(SelectMeetings(shown, True),))
+    with col3:
+        st.button("Clear selection", key="bulk_clear", use_container_width=True, disabled=not selected,
+                  on_click=dispatch, args=(SelectMeetings(shown, False),))
+    
+    if not selected:
+        return
+    
+    with st.container(border=True):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.button("✅ Complete action items", key="bulk_complete", use_container_width=True,
+                      on_click=dispatch, args=(BulkCompleteActions(selected),))
+            st.button("🗑️ Delete selected", key="bulk_delete", use_container_width=True,
+                      on_click=dispatch, args=(BulkDelete(selected),))
+        with col2:
+            st.text_input("Reassign action items to", key="bulk_assignee")
+            st.checkbox("Open items only", value=True, key="bulk_open_only")
+            st.button("👤 Reassign", key="bulk_reassign", use_container_width=True,
+                      on_click=dispatch, args=(BulkReassign(selected, 'bulk'),))
+        with col3:
+            st.download_button("📥 Export selected", export_meetings(selected), key="bulk_export",
+                               file_name=f"meetings_{len(selected)}_{date.today().isoformat()}.json",
+                               mime="application/json", use_container_width=True)
 
 def render_meeting_details(meeting_id):
     """Render detailed view of a meeting with notes, action items, and follow-ups"""
@@ -1069,9 +781,7 @@ def render_meeting_details(meeting_id):
         return
     
     # Back button
-    if st.button("← Back to Meetings"):
-        st.session_state.selected_meeting = None
-        st.rerun()
+    st.button("← Back to Meetings", on_click=dispatch, args=(Navigate(),))
     
     st.markdown("---")
     
@@ -1103,16 +813,12 @@ def render_meeting_details(meeting_id):
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("✏️ Edit Meeting Details", use_container_width=True):
-            st.session_state.editing_meeting = meeting_id
-            st.rerun()
+        st.button("✏️ Edit Meeting Details", use_container_width=True, on_click=dispatch,
+                  args=(Navigate(selected_meeting=meeting_id, editing_meeting=meeting_id),))
     
     with col2:
-        if st.button("🗑️ Delete Meeting", use_container_width=True):
-            delete_meeting(meeting_id)
-            st.session_state.selected_meeting = None
-            st.success("Meeting deleted!")
-            st.rerun()
+        st.button("🗑️ Delete Meeting", use_container_width=True, on_click=dispatch,
+                  args=(DeleteMeeting(meeting_id),))
     
     st.markdown("---")
     
@@ -1120,16 +826,23 @@ def render_meeting_details(meeting_id):
     tab1, tab2, tab3 = st.tabs(["📝 Meeting Notes", "✅ Action Items", "🔄 Follow-ups"])
     
     with tab1:
-        render_notes_section(meeting_id, meeting)
+        render_notes_section(meeting_id)
     
     with tab2:
-        render_action_items_section(meeting_id, meeting)
+        render_action_items_section(meeting_id)
     
     with tab3:
-        render_follow_ups_section(meeting_id, meeting)
+        render_follow_ups_section(meeting_id)
 
-def render_notes_section(meeting_id, meeting):
+@st.fragment
+@measure_rerun
+def render_notes_section(meeting_id):
     """Render the notes section"""
+    # Look the record up on every run, so a fragment rerun sees its latest state
+    meeting = st.session_state.meetings.get(meeting_id)
+    if meeting is None:
+        return
+    
     st.markdown("""
         <div class="section-header">
             <h3>📝 Meeting Notes</h3>
@@ -1138,19 +851,16 @@ def render_notes_section(meeting_id, meeting):
     
     # Add new note
     with st.form(key="add_note_form", clear_on_submit=True):
-        new_note = st.text_area(
+        st.text_area(
             "Add a new note",
             placeholder="Enter meeting notes here...",
-            height=100
+            height=100,
+            key="add_note_form_content"
         )
         
-        if st.form_submit_button("➕ Add Note", use_container_width=True):
-            if new_note.strip():
-                add_note(meeting_id, new_note)
-                st.success("Note added!")
-                st.rerun()
-            else:
-                st.warning("Please enter a note")
+        st.form_submit_button("➕ Add Note", use_container_width=True, on_click=dispatch,
+                              args=(AddNote(meeting_id, "add_note_form"),))
+    show_flash('notes')
     
     # Display existing notes
     if meeting.get('notes'):
@@ -1170,9 +880,8 @@ def render_notes_section(meeting_id, meeting):
                     """, unsafe_allow_html=True)
                 
                 with col2:
-                    if st.button("🗑️", key=f"del_note_{note['id']}"):
-                        delete_note(meeting_id, note['id'])
-                        st.rerun()
+                    st.button("🗑️", key=f"del_note_{note['id']}", on_click=dispatch,
+                              args=(DeleteNote(meeting_id, note['id']),))
     else:
         st.markdown("""
             <div class="empty-state">
@@ -1182,8 +891,15 @@ def render_notes_section(meeting_id, meeting):
             </div>
         """, unsafe_allow_html=True)
 
-def render_action_items_section(meeting_id, meeting):
+@st.fragment
+@measure_rerun
+def render_action_items_section(meeting_id):
     """Render the action items section"""
+    # Look the record up on every run, so a fragment rerun sees its latest state
+    meeting = st.session_state.meetings.get(meeting_id)
+    if meeting is None:
+        return
+    
     st.markdown("""
         <div class="section-header">
             <h3>✅ Action Items</h3>
@@ -1195,28 +911,27 @@ def render_action_items_section(meeting_id, meeting):
         col1, col2 = st.columns(2)
         
         with col1:
-            action_content = st.text_input(
+            st.text_input(
                 "Action Item",
-                placeholder="What needs to be done?"
+                placeholder="What needs to be done?",
+                key="add_action_form_content"
             )
-            assignee = st.text_input(
+            st.text_input(
                 "Assignee",
-                placeholder="Who is responsible?"
+                placeholder="Who is responsible?",
+                key="add_action_form_assignee"
             )
         
         with col2:
-            due_date = st.date_input(
+            st.date_input(
                 "Due Date",
-                value=None
+                value=None,
+                key="add_action_form_due_date"
             )
         
-        if st.form_submit_button("➕ Add Action Item", use_container_width=True):
-            if action_content.strip():
-                add_action_item(meeting_id, action_content, assignee, due_date)
-                st.success("Action item added!")
-                st.rerun()
-            else:
-                st.warning("Please enter an action item")
+        st.form_submit_button("➕ Add Action Item", use_container_width=True, on_click=dispatch,
+                              args=(AddActionItem(meeting_id, "add_action_form"),))
+    show_flash('action_items')
     
     # Display existing action items
     if meeting.get('action_items'):
@@ -1225,15 +940,15 @@ def render_action_items_section(meeting_id, meeting):
                 col1, col2, col3 = st.columns([0.5, 5.5, 1])
                 
                 with col1:
-                    completed = st.checkbox(
+                    # Show the stored state, which an undo or redo may have changed since the last run
+                    st.session_state[f"check_{item['id']}"] = item['completed']
+                    st.checkbox(
                         "Done",
-                        value=item['completed'],
                         key=f"check_{item['id']}",
-                        label_visibility="collapsed"
+                        label_visibility="collapsed",
+                        on_change=dispatch,
+                        args=(ToggleActionItem(meeting_id, item['id']),)
                     )
-                    if completed != item['completed']:
-                        toggle_action_item(meeting_id, item['id'])
-                        st.rerun()
                 
                 with col2:
                     due_str = ""
@@ -1258,9 +973,8 @@ def render_action_items_section(meeting_id, meeting):
                     """, unsafe_allow_html=True)
                 
                 with col3:
-                    if st.button("🗑️", key=f"del_action_{item['id']}"):
-                        delete_action_item(meeting_id, item['id'])
-                        st.rerun()
+                    st.button("🗑️", key=f"del_action_{item['id']}", on_click=dispatch,
+                              args=(DeleteActionItem(meeting_id, item['id']),))
     else:
         st.markdown("""
             <div class="empty-state">
@@ -1270,8 +984,15 @@ def render_action_items_section(meeting_id, meeting):
             </div>
         """, unsafe_allow_html=True)
 
-def render_follow_ups_section(meeting_id, meeting):
+@st.fragment
+@measure_rerun
+def render_follow_ups_section(meeting_id):
     """Render the follow-ups section"""
+    # Look the record up on every run, so a fragment rerun sees its latest state
+    meeting = st.session_state.meetings.get(meeting_id)
+    if meeting is None:
+        return
+    
     st.markdown("""
         <div class="section-header">
             <h3>🔄 Follow-up Items</h3>
@@ -1283,24 +1004,22 @@ def render_follow_ups_section(meeting_id, meeting):
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            followup_content = st.text_input(
+            st.text_input(
                 "Follow-up Item",
-                placeholder="What needs follow-up?"
+                placeholder="What needs follow-up?",
+                key="add_followup_form_content"
             )
         
         with col2:
-            priority = st.selectbox(
+            st.selectbox(
                 "Priority",
-                options=["Low", "Medium", "High", "Critical"]
+                options=["Low", "Medium", "High", "Critical"],
+                key="add_followup_form_priority"
             )
         
-        if st.form_submit_button("➕ Add Follow-up", use_container_width=True):
-            if followup_content.strip():
-                add_follow_up(meeting_id, followup_content, priority)
-                st.success("Follow-up added!")
-                st.rerun()
-            else:
-                st.warning("Please enter a follow-up item")
+        st.form_submit_button("➕ Add Follow-up", use_container_width=True, on_click=dispatch,
+                              args=(AddFollowUp(meeting_id, "add_followup_form"),))
+    show_flash('follow_ups')
     
     # Display existing follow-ups
     if meeting.get('follow_ups'):
@@ -1309,15 +1028,15 @@ def render_follow_ups_section(meeting_id, meeting):
                 col1, col2, col3 = st.columns([0.5, 5.5, 1])
                 
                 with col1:
-                    completed = st.checkbox(
+                    # Show the stored state, which an undo or redo may have changed since the last run
+                    st.session_state[f"followup_check_{item['id']}"] = item['completed']
+                    st.checkbox(
                         "Done",
-                        value=item['completed'],
                         key=f"followup_check_{item['id']}",
-                        label_visibility="collapsed"
+                        label_visibility="collapsed",
+                        on_change=dispatch,
+                        args=(ToggleFollowUp(meeting_id, item['id']),)
                     )
-                    if completed != item['completed']:
-                        toggle_follow_up(meeting_id, item['id'])
-                        st.rerun()
                 
                 with col2:
                     priority_colors = {
@@ -1340,9 +1059,8 @@ def render_follow_ups_section(meeting_id, meeting):
                     """, unsafe_allow_html=True)
                 
                 with col3:
-                    if st.button("🗑️", key=f"del_followup_{item['id']}"):
-                        delete_follow_up(meeting_id, item['id'])
-                        st.rerun()
+                    st.button("🗑️", key=f"del_followup_{item['id']}", on_click=dispatch,
+                              args=(DeleteFollowUp(meeting_id, item['id']),))
     else:
         st.markdown("""
             <div class="empty-state">
@@ -1352,6 +1070,51 @@ def render_follow_ups_section(meeting_id, meeting):
             </div>
         """, unsafe_allow_html=True)
 
+def render_analytics():
+    """Render meeting, action item and follow-up metrics computed over the cached analytics frames"""
+    frames = get_analytics_frames()
+    meetings, actions, follow_ups = frames['meetings'], frames['actions'], frames['follow_ups']
+    if meetings.empty:
+        st.info("No meetings yet. Create one to see analytics.")
+        return
+    
+    actions_done = actions['completed'].fillna(False).astype(bool)
+    follow_ups_done = follow_ups['completed'].fillna(False).astype(bool)
+    stats = analytics.completion(actions, actions_done)
+    overdue = analytics.overdue_by_owner(actions, ~actions_done, 'assignee')
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Action Items", f"{stats['total']:,}")
+    with col2:
+        st.metric("Completed", f"{stats['rate']:.0%}" if stats['rate'] is not None else "—")
+    with col3:
+        median = stats['median_days_to_close']
+        st.metric("Median Days to Close", median if median is not None else "—",
+                  help=f"Over {stats['timed']:,} action item(s) completed since completion times were recorded")
+    with col4:
+        st.metric("Overdue", f"{int(overdue['Overdue'].sum()):,}")
+    
+    st.markdown("### 📅 Meetings per Month")
+    if meetings['date'].notna().any():
+        st.bar_chart(analytics.monthly_counts(meetings, 'date', 'topic', top=8))
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("### ⏰ Overdue by Assignee")
+        if overdue.empty:
+            st.success("No overdue action items.")
+        else:
+            st.dataframe(overdue.head(25), use_container_width=True, hide_index=True)
+    with col2:
+        st.markdown("### 🚩 Follow-up Priorities")
+        st.dataframe(analytics.priority_mix(follow_ups, 'priority', follow_ups_done,
+                                            ['Critical', 'High', 'Medium', 'Low']),
+                     use_container_width=True, hide_index=True)
+    
+    st.caption(f"Computed over {len(actions):,} action item(s) and {len(follow_ups):,} follow-up(s); "
+               f"flattened {st.session_state.analytics_cache.builds} time(s) this session.")
+
 def render_sidebar():
     """Render the sidebar navigation"""
     with st.sidebar:
@@ -1384,17 +1147,26 @@ def render_sidebar():
         # Navigation
         st.markdown("### 🧭 Navigation")
         
-        if st.button("📋 All Meetings", use_container_width=True):
-            st.session_state.selected_meeting = None
-            st.session_state.editing_meeting = None
-            st.session_state.current_view = 'list'
-            st.rerun()
+        st.button("📋 All Meetings", use_container_width=True, on_click=dispatch,
+                  args=(Navigate(current_view='list'),))
         
-        if st.button("➕ New Meeting", use_container_width=True):
-            st.session_state.selected_meeting = None
-            st.session_state.editing_meeting = None
-            st.session_state.current_view = 'create'
-            st.rerun()
+        st.button("➕ New Meeting", use_container_width=True, on_click=dispatch,
+                  args=(Navigate(current_view='create'),))
+        
+        st.button("📈 Analytics", use_container_width=True, on_click=dispatch,
+                  args=(Navigate(current_view='analytics'),))
+        
+        # Undo / redo this session's changes
+        log = st.session_state.operation_log
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button("↩️ Undo", key="undo", use_container_width=True, disabled=log.undo_label() is None,
+                      help=f"Undo: {log.undo_label()}" if log.undo_label() else "Nothing to undo",
+                      on_click=dispatch, args=(Undo(),))
+        with col2:
+            st.button("↪️ Redo", key="redo", use_container_width=True, disabled=log.redo_label() is None,
+                      help=f"Redo: {log.redo_label()}" if log.redo_label() else "Nothing to redo",
+                      on_click=dispatch, args=(Redo(),))
         
         st.markdown("---")
         
@@ -1402,20 +1174,21 @@ def render_sidebar():
         if st.session_state.meetings:
             st.markdown("### 🕐 Recent Meetings")
             
-            sorted_meetings = sorted(
-                st.session_state.meetings.values(),
-                key=lambda x: x.get('created_at', ''),
-                reverse=True
-            )[:5]
+            with span('sort'):
+                sorted_meetings = sorted(
+                    st.session_state.meetings.values(),
+                    key=lambda x: x.get('created_at', ''),
+                    reverse=True
+                )[:5]
             
             for meeting in sorted_meetings:
-                if st.button(
+                st.button(
                     f"📌 {meeting['name'][:20]}...",
                     key=f"sidebar_{meeting['id']}",
-                    use_container_width=True
-                ):
-                    st.session_state.selected_meeting = meeting['id']
-                    st.rerun()
+                    use_container_width=True,
+                    on_click=dispatch,
+                    args=(Navigate(selected_meeting=meeting['id']),)
+                )
         
         st.markdown("---")
         
@@ -1428,27 +1201,111 @@ def render_sidebar():
                 </p>
             </div>
         """, unsafe_allow_html=True)
+        
+        # Timing diagnostics, hidden unless the page is opened with ?diagnostics=1
+        if st.query_params.get('diagnostics') == '1':
+            render_diagnostics()
 
+def render_diagnostics():
+    """Render the previous run's span breakdown and this process's rolling span latencies"""
+    with st.expander("🩺 Diagnostics", expanded=True):
+        last_rerun = st.session_state.get('last_rerun')
+        if last_rerun:
+            name, breakdown = last_rerun
+            total_ms = breakdown.get(name, (0, 0.0))[1] * 1000
+            st.caption(f"Previous run ({name}): {total_ms:.1f} ms")
+            st.dataframe(breakdown_rows(breakdown), hide_index=True, use_container_width=True)
+        
+        snapshot = METRICS.snapshot()
+        if snapshot:
+            st.caption(f"Last {METRICS.window} calls per span, all sessions")
+            st.dataframe([{'Span': name, 'Calls': s['count'], 'p50 ms': s['p50_ms'], 'p95 ms': s['p95_ms'],
+                           'max ms': s['max_ms']} for name, s in snapshot.items()],
+                         hide_index=True, use_container_width=True)
+        
+        if st.button("📤 Export metrics", key="export_metrics", use_container_width=True):
+            try:
+                st.toast(f"Wrote {METRICS.export()}")
+            except OSError as e:
+                st.error(f"Error writing metrics: {e}")
+        st.caption(f"Exported every {METRICS.export_interval}s to `{METRICS.export_path}`")
+        
+        render_profiler()
+        render_memory()
+
+def render_profiler():
+    """Render the controls and hotspots of this session's profile capture"""
+    st.markdown("**🔬 Profiler**")
+    capture = st.session_state.get('profile_capture')
+    if capture is not None and capture.active:
+        st.caption(f"Profiling: {capture.remaining} of {capture.runs} run(s) left")
+        if st.button("⏹️ Stop profiling", key="profile_stop", use_container_width=True):
+            capture.runs = len(capture.dumps)
+            st.rerun()
+    else:
+        runs = st.number_input("Runs to profile", min_value=1, max_value=50, value=DEFAULT_RUNS, key="profile_runs")
+        if st.button("▶️ Profile next runs", key="profile_start", use_container_width=True):
+            st.session_state.profile_capture = ProfileCapture(int(runs))
+            st.toast(f"Profiling this session's next {int(runs)} run(s)")
+    
+    if capture is None:
+        return
+    if capture.last_error:
+        st.error(capture.last_error)
+    if capture.skipped:
+        st.caption(f"{capture.skipped} run(s) skipped while another session was being profiled")
+    hotspots = capture.hotspots()
+    if hotspots:
+        st.caption(f"Top functions by own time over {len(capture.dumps)} run(s), dumps in `{capture.directory}`")
+        st.dataframe(hotspots, hide_index=True, use_container_width=True)
+
+def render_memory():
+    """Render this session's memory accounting and the sizes of the other sessions"""
+    st.markdown("**🧠 Memory**")
+    report = measure_memory()
+    budget = memory_usage.MEMORY_BUDGET_MB
+    st.caption(f"This session: {report['total'] / 1e6:.1f} MB for {report['records']} meetings"
+               + (f" · budget {budget} MB" if budget is not None else ""))
+    st.dataframe(memory_usage.rows(report['by_category'], 'Category'), hide_index=True, use_container_width=True)
+    names = {meeting_id: meeting['name'] for meeting_id, meeting in st.session_state.meetings.items()}
+    st.dataframe(memory_usage.rows(report['by_record'], 'Meeting', names, limit=10),
+                 hide_index=True, use_container_width=True)
+    st.dataframe(memory_usage.rows(report['by_key'], 'Session key', limit=10),
+                 hide_index=True, use_container_width=True)
+    
+    st.caption("Sessions in this process")
+    st.dataframe(memory_usage.session_table(), hide_index=True, use_container_width=True)
+
+@profile_rerun
+@measure_rerun
 def main():
     """Main application logic"""
     render_sidebar()
+    check_memory_budget()
     
     # Check if we're editing a meeting
     if st.session_state.editing_meeting:
         meeting_data = st.session_state.meetings.get(st.session_state.editing_meeting)
         if meeting_data:
             render_header()
+            show_flash('page')
             render_meeting_form(editing=True, meeting_data=meeting_data)
         return
     
     # Check if viewing a specific meeting
     if st.session_state.selected_meeting:
         render_header()
+        show_flash('page')
         render_meeting_details(st.session_state.selected_meeting)
         return
     
     # Default views
     render_header()
+    show_flash('page')
+    
+    if st.session_state.current_view == 'analytics':
+        render_analytics()
+        return
     
     if st.session_state.current_view == 'create':
         render_meeting_form()
@@ -1465,22 +1322,25 @@ def main():
     with tab1:
         if st.session_state.meetings:
             # Sort meetings by date
-            sorted_meetings = sorted(
-                st.session_state.meetings.values(),
-                key=lambda x: (x.get('date', ''), x.get('time', '')),
-                reverse=True
-            )
+            with span('sort'):
+                sorted_meetings = sorted(
+                    st.session_state.meetings.values(),
+                    key=lambda x: (x.get('date', ''), x.get('time', '')),
+                    reverse=True
+                )
             
             # Search/filter
             search = st.text_input("🔍 Search meetings...", placeholder="Search by name or topic")
             
             if search:
-                sorted_meetings = [
-                    m for m in sorted_meetings
-                    if search.lower() in m['name'].lower() or search.lower() in m.get('topic', '').lower()
-                ]
+                with span('filter'):
+                    sorted_meetings = [
+                        m for m in sorted_meetings
+                        if search.lower() in m['name'].lower() or search.lower() in m.get('topic', '').lower()
+                    ]
             
             if sorted_meetings:
+                render_bulk_actions(sorted_meetings)
                 for meeting in sorted_meetings:
                     render_meeting_card(meeting)
             else:
@@ -1495,7 +1355,7 @@ def main():
             """, unsafe_allow_html=True)
     
     with tab2:
-        render_meeting_form()
+        render_meeting_form(form_key="create_tab_form")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,177 @@
+"""
+Operation Log - bounded undo/redo over a dict of records with child item lists
+Each mutation is recorded as the list of deltas that reverses it, not as a
+copy of the store. Applying a delta returns its own inverse, so undoing an
+operation yields the redo entry (and vice versa) without storing both
+directions. The log is capped by operation count and by an estimate of the
+bytes its deltas hold, so memory stays bounded whatever the dataset size.
+
+Deltas are tuples:
+    ('insert_record', record_id, record)
+    ('remove_record', record_id)
+    ('set_fields', record_id, {field: value})
+    ('insert_item', record_id, list_name, index, item)
+    ('remove_item', record_id, list_name, item_id)
+    ('set_item_fields', record_id, list_name, item_id, {field: value})
+"""
+
+import sys
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+Delta = Tuple
+
+class Operation(NamedTuple):
+    label: str
+    deltas: List[Delta]
+    nbytes: int
+
+class Replay(NamedTuple):
+    label: str
+    record_ids: Set[str]
+    inverse: List[Delta]    # deltas that would reverse this replay, e.g. what it removed
+
+# ============================================================================
+# DELTAS
+# ============================================================================
+
+def estimate_size(value) -> int:
+    """Rough byte count of the data held by a delta (strings dominate)"""
+    if isinstance(value, str):
+        return len(value) + 49
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+def _find(items: List[dict], item_id: str) -> Optional[int]:
+    for pos, item in enumerate(items):
+        if item.get('id') == item_id:
+            return pos
+    return None
+
+def apply_delta(records: Dict, delta: Delta) -> Optional[Delta]:
+    """Apply one delta in place and return the delta that reverses it
+
+    Returns None if the target no longer exists (e.g. another change removed
+    it), in which case nothing is modified.
+    """
+    kind, record_id = delta[0], delta[1]
+    if kind == 'insert_record':
+        if record_id in records:
+            return None
+        records[record_id] = delta[2]
+        return ('remove_record', record_id)
+
+    record = records.get(record_id)
+    if record is None:
+        return None
+    if kind == 'remove_record':
+        return ('insert_record', record_id, records.pop(record_id))
+    if kind == 'set_fields':
+        previous = {field: record.get(field) for field in delta[2]}
+        record.update(delta[2])
+        return ('set_fields', record_id, previous)
+
+    items = record.setdefault(delta[2], [])
+    if kind == 'insert_item':
+        _, _, list_name, index, item = delta
+        items.insert(min(index, len(items)), item)
+        return ('remove_item', record_id, list_name, item['id'])
+    pos = _find(items, delta[3])
+    if pos is None:
+        return None
+    if kind == 'remove_item':
+        return ('insert_item', record_id, delta[2], pos, items.pop(pos))
+    if kind == 'set_item_fields':
+        previous = {field: items[pos].get(field) for field in delta[4]}
+        items[pos].update(delta[4])
+        return ('set_item_fields', record_id, delta[2], delta[3], previous)
+    raise ValueError(f"Unknown delta {kind!r}")
+
+def item_position(records: Dict, record_id: str, list_name: str, item_id: str) -> Optional[int]:
+    """Index of a child item, for recording where a deleted item sat"""
+    record = records.get(record_id)
+    return _find(record.get(list_name, []), item_id) if record else None
+
+# ============================================================================
+# LOG
+# ============================================================================
+
+class OperationLog:
+    """Per-session undo and redo stacks with a count and byte budget"""
+
+    def __init__(self, max_operations: int = 50, max_bytes: int = 8 * 1024 * 1024):
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self._undo: deque = deque()
+        self._redo: deque = deque()
+        self._nbytes = 0
+        # Bumped by every change made or replayed through the log, so derived views can key caches on it
+        self.revision = 0
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes held by both stacks"""
+        return self._nbytes
+
+    def _operation(self, label: str, deltas: List[Delta]) -> Operation:
+        return Operation(label, deltas, sum(estimate_size(d) for d in deltas))
+
+    def _push(self, stack: deque, op: Operation) -> None:
+        stack.append(op)
+        self._nbytes += op.nbytes
+        # Evict the oldest undo entries first, then the oldest redo entries
+        while self._undo and (len(self._undo) > self.max_operations or self._nbytes > self.max_bytes):
+            self._nbytes -= self._undo.popleft().nbytes
+        while self._redo and self._nbytes > self.max_bytes:
+            self._nbytes -= self._redo.popleft().nbytes
+
+    def record(self, label: str, undo_deltas: List[Delta]) -> None:
+        """Record a mutation by the deltas that reverse it; clears the redo stack"""
+        for op in self._redo:
+            self._nbytes -= op.nbytes
+        self._redo.clear()
+        self.revision += 1
+        if undo_deltas:
+            self._push(self._undo, self._operation(label, list(undo_deltas)))
+
+    def clear(self) -> None:
+        self.revision += 1
+        self._undo.clear()
+        self._redo.clear()
+        self._nbytes = 0
+
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1].label if self._undo else None
+
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1].label if self._redo else None
+
+    def _replay(self, records: Dict, source: deque, target: deque) -> Optional[Replay]:
+        if not source:
+            return None
+        op = source.pop()
+        self._nbytes -= op.nbytes
+        self.revision += 1
+        inverse = []
+        # Deltas are applied newest-first so multi-step operations unwind in order
+        for delta in reversed(op.deltas):
+            reverse = apply_delta(records, delta)
+            if reverse is not None:
+                inverse.append(reverse)
+        if inverse:
+            self._push(target, self._operation(op.label, inverse))
+        return Replay(op.label, {delta[1] for delta in op.deltas}, inverse)
+
+    def undo(self, records: Dict) -> Optional[Replay]:
+        """Reverse the latest operation; return its label, touched record IDs and inverse deltas"""
+        return self._replay(records, self._undo, self._redo)
+
+    def redo(self, records: Dict) -> Optional[Replay]:
+        """Re-apply the latest undone operation; return its label, touched record IDs and inverse deltas"""
+        return self._replay(records, self._redo, self._undo)
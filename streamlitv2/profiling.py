@@ -0,0 +1,90 @@
+"""
+Profile Capture - deterministic profiling of one session's next few reruns
+An admin arms a capture from the diagnostics panel. The session's next N
+script runs are then executed under cProfile, each saved as a .prof dump
+(pstats format, with the call graph) in its own directory under PROFILE_DIR,
+and the combined hotspots are shown in the app. A session without an armed
+capture pays one session-state lookup per run.
+
+    python -m pstats profiles/<capture>/run_001.prof
+    snakeviz profiles/<capture>/run_001.prof
+"""
+
+import cProfile
+import os
+import pstats
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROFILE_DIR = Path('profiles')
+DEFAULT_RUNS = 5
+TOP_HOTSPOTS = 15
+
+class ProfileCapture:
+    """The profiles of a session's next `runs` reruns"""
+
+    def __init__(self, runs: int = DEFAULT_RUNS, directory: Path = PROFILE_DIR):
+        self.runs = runs
+        self.started_at = datetime.now()
+        self.directory = Path(directory) / f"{self.started_at.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self.dumps: List[Path] = []
+        self.skipped = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def remaining(self) -> int:
+        return self.runs - len(self.dumps)
+
+    @property
+    def active(self) -> bool:
+        return self.remaining > 0
+
+    @contextmanager
+    def record(self, name: str):
+        """Run the block under cProfile and dump it as the next run of this capture
+
+        Only one profiler can be enabled at a time on Python 3.12+; a run
+        that overlaps another session's capture is skipped, not failed.
+        """
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            profiler = None
+        if profiler is None:
+            self.skipped += 1
+            yield
+            return
+        try:
+            yield
+        finally:
+            profiler.disable()
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                path = self.directory / f"run_{len(self.dumps) + 1:03d}_{name}.prof"
+                profiler.dump_stats(path)
+                self.dumps.append(path)
+            except OSError as e:
+                self.last_error = f"Error saving profile: {e}"
+                self.runs = len(self.dumps)
+
+    def stats(self) -> Optional[pstats.Stats]:
+        """All dumps of this capture merged, or None before the first run"""
+        dumps = [str(path) for path in self.dumps if path.exists()]
+        return pstats.Stats(*dumps) if dumps else None
+
+    def hotspots(self, limit: int = TOP_HOTSPOTS) -> List[Dict]:
+        """The functions with the most own time across the captured runs"""
+        stats = self.stats()
+        if stats is None:
+            return []
+        rows = []
+        for (filename, line, function), (_, calls, own, total, _) in stats.stats.items():
+            where = f"{os.path.basename(filename)}:{line}" if line else filename
+            rows.append({'Function': f"{function} ({where})", 'Calls': calls,
+                         'Own ms': round(own * 1000, 2), 'Total ms': round(total * 1000, 2)})
+        rows.sort(key=lambda row: row['Own ms'], reverse=True)
+        return rows[:limit]
@@ -0,0 +1,55 @@
+"""
+Static Assets - content-hashed stylesheet build for the Streamlit app
+Minifies styles/app.css once into static/app.<hash>.min.css so each rerun
+only sends a <link> to a URL that never changes content. Requires
+`server.enableStaticServing` (see .streamlit/config.toml); without it the
+minified CSS is inlined instead.
+
+    python static_assets.py     # pre-build the stylesheet
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Tuple
+
+APP_DIR = Path(__file__).parent
+STYLE_SOURCE = APP_DIR / 'styles' / 'app.css'
+STATIC_DIR = APP_DIR / 'static'
+STATIC_URL = 'app/static'
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = css.replace(';}', '}')
+    return css.strip()
+
+def build_stylesheet(source: Path = STYLE_SOURCE, static_dir: Path = STATIC_DIR) -> Tuple[str, str]:
+    """Write the minified, content-hashed stylesheet and return (filename, css)"""
+    css = minify_css(source.read_text(encoding='utf-8'))
+    digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]
+    filename = f"{source.stem}.{digest}.min.css"
+
+    static_dir.mkdir(exist_ok=True)
+    target = static_dir / filename
+    if not target.exists():
+        tmp = target.with_suffix('.tmp')
+        tmp.write_text(css, encoding='utf-8')
+        tmp.replace(target)
+    for stale in static_dir.glob(f"{source.stem}.*.min.css"):
+        if stale.name != filename:
+            stale.unlink(missing_ok=True)
+    return filename, css
+
+def stylesheet_tag(filename: str, css: str, static_serving: bool) -> str:
+    """HTML to emit on every rerun: a link when static serving is on, inline CSS otherwise"""
+    if static_serving:
+        return f'<link rel="stylesheet" href="{STATIC_URL}/{filename}">'
+    return f'<style>{css}</style>'
+
+if __name__ == "__main__":
+    name, minified = build_stylesheet()
+    print(f"Built {STATIC_DIR / name} ({len(minified)} bytes from {STYLE_SOURCE.stat().st_size})")